@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Choix automatique de la variante la plus rapide selon la taille du problème.
+
+Le dépôt propose plusieurs niveaux de performance pour un même calcul :
+boucle Python, boucle sans allocation, numpy vectorisé et numba. La plus
+rapide dépend de la taille du problème et de la machine.
+
+dispatcheur() enveloppe un dictionnaire de variantes de même signature :
+    - au premier appel pour une signature de problème donnée (par exemple
+      les ordres de grandeur de la taille et du nombre de pas), toutes les
+      variantes disponibles sont mesurées sur un essai réduit, après un
+      appel d'échauffement (compilation numba) ; les variantes dont le
+      résultat diffère de celui des autres sont écartées ;
+    - le gagnant est enregistré dans un cache JSON sur disque, indexé par
+      une empreinte du processeur, du système et des versions de Python,
+      numpy et numba : il n'est plus mesuré aux lancements suivants ;
+    - les appels sont ensuite routés vers le gagnant.
+Les scripts n'ont plus à tester NUMBA_OK pour choisir une variante : une
+variante numba n'est simplement présente que si numba est installé. Une
+seule variante disponible est appelée directement, sans mesure.
+
+rk4_oscillateurs dans banc_performances.py, les noyaux de remplissage de
+TP3 (q08.py, q11.py) et le diagramme de bifurcation de TP2 (q05.py) passent
+par dispatcheur(). Ce module n'existe qu'ici : les scripts de TP2 et TP3
+ajoutent TP1/python à sys.path pour l'importer, plutôt qu'en garder des
+copies qui divergeraient.
+
+Le fichier de cache est donné par l'argument fichier ou la variable
+d'environnement AUTOREGLAGE_CACHE, sinon __pycache__/autoreglage.json à
+côté de ce module (comme le cache disque des noyaux numba, ignoré par git).
+"""
+import hashlib
+import json
+import os
+import platform
+import time
+
+import numpy as np
+
+try:
+    import numba
+    VERSION_NUMBA = numba.__version__
+except Exception:
+    VERSION_NUMBA = None
+
+
+FICHIER_CACHE = os.environ.get(
+    "AUTOREGLAGE_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__",
+                 "autoreglage.json"))
+
+
+def empreinte_machine():
+    """
+    Empreinte courte du processeur, du système et des versions des
+    bibliothèques (sans le nom d'hôte : deux machines identiques partagent
+    leurs mesures).
+    """
+    infos = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "numba": VERSION_NUMBA,
+        "systeme": platform.platform(),
+        "processeur": platform.processor() or platform.machine(),
+        "coeurs": os.cpu_count(),
+    }
+    cle = json.dumps({k: infos[k] for k in sorted(infos)}, sort_keys=True)
+    return hashlib.sha1(cle.encode()).hexdigest()[:16]
+
+
+def ordre_grandeur(n):
+    """Classe de taille : puissance de 2 la plus proche de n (n ≥ 1)."""
+    return int(round(np.log2(max(n, 1))))
+
+
+def lire_cache(fichier):
+    """Contenu du cache JSON ({} si absent ou illisible)."""
+    try:
+        with open(fichier) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def ecrire_cache(fichier, cache):
+    """Écrit le cache JSON (remplacement atomique du fichier)."""
+    dossier = os.path.dirname(fichier)
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+    temporaire = f"{fichier}.{os.getpid()}.tmp"
+    with open(temporaire, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(temporaire, fichier)
+
+
+def mesurer_variantes(variantes, args, repetitions=3, rtol=1e-8, atol=1e-12):
+    """
+    Mesure chaque variante sur args.
+
+    Chaque variante est appelée une fois pour l'échauffement (compilation
+    éventuelle), puis repetitions fois ; on garde la durée minimale.
+
+    Retour
+    ------
+    durees : dict
+        Durée minimale par variante (inf si son résultat diffère de celui
+        de la majorité des autres).
+    """
+    resultats, durees = {}, {}
+    for nom, fonction in variantes.items():
+        resultats[nom] = fonction(*args)
+        mesures = []
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            fonction(*args)
+            mesures.append(time.perf_counter() - start)
+        durees[nom] = min(mesures)
+
+    # Une variante est écartée si elle ne s'accorde qu'avec une minorité
+    noms = list(resultats)
+    for nom in noms:
+        accords = sum(np.allclose(resultats[nom], resultats[autre], rtol=rtol, atol=atol)
+                      for autre in noms if autre != nom)
+        if len(noms) > 2 and accords < (len(noms) - 1) / 2:
+            durees[nom] = np.inf
+    return durees
+
+
+def dispatcheur(nom, variantes, signature, essai=None, fichier=None, repetitions=3,
+                verbeux=False):
+    """
+    Fonction qui route chaque appel vers la variante la plus rapide.
+
+    Paramètres
+    ----------
+    nom : str
+        Nom du calcul (clé dans le cache).
+    variantes : dict
+        Variantes {nom: fonction} de même signature et de même résultat.
+    signature : callable
+        signature(*args) -> str décrivant la classe du problème (les appels
+        de même signature partagent le même gagnant).
+    essai : callable ou None
+        essai(*args) -> arguments réduits pour les mesures (par défaut les
+        arguments de l'appel eux-mêmes).
+    fichier : str ou None
+        Fichier du cache (FICHIER_CACHE par défaut).
+    repetitions : int
+        Nombre de mesures par variante.
+    verbeux : bool
+        Affiche les mesures et le gagnant à chaque nouvelle signature.
+
+    Retour
+    ------
+    callable
+        Fonction de mêmes arguments que les variantes ; son attribut
+        "gagnants" donne les choix faits pendant la session et sa méthode
+        choisir(*args) fait le choix (mesures comprises) sans calculer.
+    """
+    fichier = FICHIER_CACHE if fichier is None else fichier
+    machine = empreinte_machine()
+    gagnants = {}
+
+    def choisir(*args):
+        cle = signature(*args)
+        if cle in gagnants:
+            return gagnants[cle]
+        if len(variantes) == 1:
+            gagnants[cle] = next(iter(variantes))
+            return gagnants[cle]
+        cache = lire_cache(fichier)
+        entree = cache.get(machine, {}).get(nom, {}).get(cle)
+        if entree is not None and entree["gagnant"] in variantes:
+            gagnants[cle] = entree["gagnant"]
+            return gagnants[cle]
+
+        durees = mesurer_variantes(variantes, args if essai is None else essai(*args),
+                                   repetitions)
+        gagnant = min(durees, key=durees.get)
+        if verbeux:
+            detail = ", ".join(f"{v} {d * 1e3:.3g} ms" for v, d in sorted(durees.items(),
+                                                                          key=lambda x: x[1]))
+            print(f"   [{nom} / {cle}] {detail} → {gagnant}")
+        # Relecture juste avant l'écriture : d'autres processus ont pu
+        # enregistrer d'autres signatures entre-temps
+        cache = lire_cache(fichier)
+        cache.setdefault(machine, {}).setdefault(nom, {})[cle] = {
+            "gagnant": gagnant,
+            "durees": {v: (d if np.isfinite(d) else None) for v, d in durees.items()}}
+        ecrire_cache(fichier, cache)
+        gagnants[cle] = gagnant
+        return gagnant
+
+    def appeler(*args):
+        return variantes[choisir(*args)](*args)
+
+    appeler.gagnants = gagnants
+    appeler.choisir = choisir
+    appeler.variantes = variantes
+    return appeler
+
+
+# ========== Démonstration ==========
+if __name__ == "__main__":
+    import tempfile
+
+    def somme_python(x):
+        total = 0.0
+        for valeur in x:
+            total += valeur * valeur
+        return total
+
+    def somme_numpy(x):
+        return float(x @ x)
+
+    variantes = {"python": somme_python, "numpy": somme_numpy}
+    if VERSION_NUMBA is not None:
+        from numba import njit
+        variantes["numba"] = njit(somme_python)
+
+    def signature(x):
+        return f"taille=2^{ordre_grandeur(x.size)}"
+
+    print("=" * 70)
+    print("Choix automatique de la variante : somme des carrés")
+    print("=" * 70)
+    print(f"   Variantes disponibles : {', '.join(variantes)}")
+    print(f"   Empreinte machine     : {empreinte_machine()}")
+
+    fichier = os.path.join(tempfile.mkdtemp(), "autoreglage.json")
+    rng = np.random.default_rng(0)
+    for lancement in (1, 2):
+        # Nouveau dispatcheur à chaque « lancement », même fichier de cache
+        somme_auto = dispatcheur("somme_carres", variantes, signature, fichier=fichier,
+                                 verbeux=True)
+        print(f"\n📊 Lancement {lancement}")
+        for taille in (8, 1_024, 1_048_576):
+            x = rng.uniform(-1.0, 1.0, taille)
+            start = time.perf_counter()
+            total = somme_auto(x)
+            duree = time.perf_counter() - start
+            print(f"   taille {taille:>8} : {somme_auto.gagnants[signature(x)]:<7} "
+                  f"{duree:.4f} s (écart relatif à numpy "
+                  f"{abs(total - somme_numpy(x)) / somme_numpy(x):.1e})")
+    print("=" * 70)
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+Banc de performances reproductible (généralisation de q09.py).
+
+Compare les variantes de RK4 du dépôt sur un ensemble d'oscillateurs
+harmoniques indépendants, pour plusieurs tailles d'état, pas de temps et
+durées :
+    - python   : integrer() avec la boucle Python sur rk4()
+    - inplace  : boucle sur rk4_inplace() (sans allocation)
+    - numba    : integrer() avec une fonction deriv compilée (@njit)
+    - ensemble : boucle sur rk4_ensemble() (étapes vectorisées)
+
+Le premier appel (compilation numba comprise) est mesuré à part ; viennent
+ensuite des appels d'échauffement puis des répétitions dont on garde la
+médiane et l'écart interquartile. Les résultats sont enregistrés en JSON.
+
+rk4_oscillateurs() route chaque appel vers la variante la plus rapide pour
+la taille de l'état et le nombre de pas (dispatcheur() de autoreglage.py).
+
+Usage :
+    python banc_performances.py mesurer resultats.json
+    python banc_performances.py mesurer resultats.json --tailles 2 200 --repetitions 7
+    python banc_performances.py comparer ancien.json nouveau.json --seuil 1.10
+    python banc_performances.py choisir --tailles 2 64 2048 65536
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+from rk4 import rk4_inplace, rk4_ensemble, espace_travail_rk4
+from integration import integrer, NUMBA_OK
+from autoreglage import dispatcheur, ordre_grandeur
+
+if NUMBA_OK:
+    import numba
+    from numba import njit
+
+
+# ========== Problème : n oscillateurs harmoniques indépendants ==========
+# État à plat y = [x_0, v_0, x_1, v_1, ...] de taille 2n
+
+def deriv(t, y, params, out=None):
+    """Dérivées pour n oscillateurs (état à plat de taille 2n)."""
+    omega = params
+    dy = np.empty_like(y) if out is None else out
+    dy[0::2] = y[1::2]
+    dy[1::2] = -omega**2 * y[0::2]
+    return dy
+
+
+def deriv_ensemble(t, Y, params):
+    """Dérivées pour n oscillateurs rangés en ensemble (n, 2)."""
+    omega = params
+    dY = np.empty_like(Y)
+    dY[:, 0] = Y[:, 1]
+    dY[:, 1] = -omega**2 * Y[:, 0]
+    return dY
+
+
+if NUMBA_OK:
+    @njit
+    def deriv_nb(t, y, params):
+        """Version compilée de deriv()."""
+        omega = params
+        dy = np.empty_like(y)
+        for i in range(0, y.size, 2):
+            dy[i] = y[i + 1]
+            dy[i + 1] = -omega**2 * y[i]
+        return dy
+
+
+def etat_initial(taille):
+    """État initial reproductible de taille paire."""
+    rng = np.random.default_rng(1234)
+    y0 = np.zeros(taille)
+    y0[0::2] = rng.uniform(-1.0, 1.0, taille // 2)
+    return y0
+
+
+# ========== Variantes ==========
+def _python(y0, dt, n_pas):
+    temps = dt * np.arange(n_pas + 1)
+    return integrer(deriv, y0, temps, 1.0, pas_sortie=n_pas)[1][-1]
+
+
+def _inplace(y0, dt, n_pas):
+    y = np.copy(y0)
+    travail = espace_travail_rk4(y.size)
+    for i in range(n_pas):
+        rk4_inplace(i * dt, dt, y, deriv, 1.0, travail)
+    return y
+
+
+def _numba(y0, dt, n_pas):
+    temps = dt * np.arange(n_pas + 1)
+    return integrer(deriv_nb, y0, temps, 1.0, pas_sortie=n_pas)[1][-1]
+
+
+def _ensemble(y0, dt, n_pas):
+    Y = y0.reshape(-1, 2).copy()
+    for i in range(n_pas):
+        Y = rk4_ensemble(i * dt, dt, Y, deriv_ensemble, 1.0)
+    return Y.ravel()
+
+
+VARIANTES = {"python": _python, "inplace": _inplace, "ensemble": _ensemble}
+if NUMBA_OK:
+    VARIANTES["numba"] = _numba
+
+
+# ========== Choix automatique de la variante ==========
+def _signature_rk4(y0, dt, n_pas):
+    return f"taille=2^{ordre_grandeur(y0.size)},pas=2^{ordre_grandeur(n_pas)}"
+
+
+def _essai_rk4(y0, dt, n_pas):
+    # Assez de pas pour que le coût par pas domine, sans dépasser ~10⁶
+    # évaluations de composantes par mesure
+    return y0, dt, int(min(n_pas, max(10, 1_000_000 // y0.size)))
+
+
+def dispatcheur_rk4(fichier=None, verbeux=False):
+    """Dispatcheur des variantes de RK4 (voir autoreglage.dispatcheur())."""
+    return dispatcheur("rk4_oscillateurs", VARIANTES, _signature_rk4, _essai_rk4,
+                       fichier=fichier, verbeux=verbeux)
+
+
+rk4_oscillateurs = dispatcheur_rk4()
+
+
+# ========== Mesures ==========
+def decrire_machine():
+    """
+    Informations sur la machine et les versions, pour la traçabilité (sans
+    le nom d'hôte, pour pouvoir partager les fichiers de résultats).
+    """
+    infos = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "numba": numba.__version__ if NUMBA_OK else None,
+        "systeme": platform.platform(),
+        "processeur": platform.processor() or platform.machine(),
+        "coeurs": os.cpu_count(),
+    }
+    return infos
+
+
+def mesurer_cas(fonction, y0, dt, n_pas, echauffement, repetitions):
+    """
+    Mesure une variante sur un cas.
+
+    Retour
+    ------
+    dict
+        Durée du premier appel (compilation éventuelle comprise), médiane,
+        quartiles, écart interquartile et échantillons, en secondes.
+    """
+    start = time.perf_counter()
+    fonction(y0, dt, n_pas)
+    premier_appel = time.perf_counter() - start
+
+    for _ in range(echauffement):
+        fonction(y0, dt, n_pas)
+
+    echantillons = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        fonction(y0, dt, n_pas)
+        echantillons.append(time.perf_counter() - start)
+
+    q1, mediane, q3 = np.percentile(echantillons, [25, 50, 75])
+    return {
+        "premier_appel_s": premier_appel,
+        "mediane_s": float(mediane),
+        "q1_s": float(q1),
+        "q3_s": float(q3),
+        "iqr_s": float(q3 - q1),
+        "pas_par_seconde": n_pas / float(mediane),
+        "echantillons_s": echantillons,
+    }
+
+
+def mesurer(tailles, pas_temps, durees, variantes, echauffement, repetitions):
+    """Lance toutes les combinaisons et renvoie le dictionnaire des résultats."""
+    resultats = []
+    for taille in tailles:
+        y0 = etat_initial(taille)
+        for dt in pas_temps:
+            for t_max in durees:
+                n_pas = int(round(t_max / dt))
+                for nom in variantes:
+                    mesure = mesurer_cas(VARIANTES[nom], y0, dt, n_pas,
+                                         echauffement, repetitions)
+                    mesure.update({"variante": nom, "taille": taille, "dt": dt,
+                                   "t_max": t_max, "n_pas": n_pas})
+                    resultats.append(mesure)
+                    print(f"   {nom:<9} taille={taille:<7} dt={dt:<7} t_max={t_max:<6} "
+                          f"médiane={mesure['mediane_s']:.4f} s "
+                          f"(IQR {mesure['iqr_s']:.4f} s, 1er appel "
+                          f"{mesure['premier_appel_s']:.3f} s)")
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "machine": decrire_machine(),
+        "configuration": {"echauffement": echauffement, "repetitions": repetitions},
+        "resultats": resultats,
+    }
+
+
+# ========== Comparaison ==========
+def _cle(mesure):
+    return (mesure["variante"], mesure["taille"], mesure["dt"], mesure["t_max"])
+
+
+def comparer(ancien, nouveau, seuil):
+    """
+    Compare deux fichiers de résultats cas par cas.
+
+    Un cas est une régression si la médiane a augmenté de plus du facteur
+    seuil et si l'écart dépasse le bruit (premier quartile du nouveau au
+    dessus du troisième quartile de l'ancien).
+
+    Retour
+    ------
+    list
+        Les clés (variante, taille, dt, t_max) en régression.
+    """
+    anciens = {_cle(m): m for m in ancien["resultats"]}
+    regressions = []
+    print(f"   {'variante':<9}{'taille':>8}{'dt':>8}{'t_max':>8}"
+          f"{'ancien (s)':>12}{'nouveau (s)':>13}{'rapport':>9}")
+    for m in nouveau["resultats"]:
+        cle = _cle(m)
+        if cle not in anciens:
+            continue
+        a = anciens[cle]
+        rapport = m["mediane_s"] / a["mediane_s"]
+        regression = rapport > seuil and m["q1_s"] > a["q3_s"]
+        if regression:
+            regressions.append(cle)
+        marque = "  ⚠️ régression" if regression else ""
+        print(f"   {cle[0]:<9}{cle[1]:>8}{cle[2]:>8}{cle[3]:>8}"
+              f"{a['mediane_s']:>12.4f}{m['mediane_s']:>13.4f}{rapport:>9.2f}{marque}")
+    return regressions
+
+
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description="Banc de performances des variantes de RK4")
+    commandes = parser.add_subparsers(dest="commande", required=True)
+
+    p_mesure = commandes.add_parser("mesurer", help="lance les mesures et écrit un JSON")
+    p_mesure.add_argument("sortie", help="fichier JSON de résultats")
+    p_mesure.add_argument("--tailles", type=int, nargs="+", default=[2, 200, 20000],
+                          help="tailles d'état (paires)")
+    p_mesure.add_argument("--dt", type=float, nargs="+", default=[0.01],
+                          help="pas de temps")
+    p_mesure.add_argument("--t-max", type=float, nargs="+", default=[10.0],
+                          help="durées simulées")
+    p_mesure.add_argument("--variantes", nargs="+", default=list(VARIANTES),
+                          choices=list(VARIANTES))
+    p_mesure.add_argument("--echauffement", type=int, default=1)
+    p_mesure.add_argument("--repetitions", type=int, default=5)
+
+    p_comp = commandes.add_parser("comparer", help="compare deux fichiers de résultats")
+    p_comp.add_argument("ancien")
+    p_comp.add_argument("nouveau")
+    p_comp.add_argument("--seuil", type=float, default=1.10,
+                        help="rapport de médianes au-delà duquel on signale une régression")
+
+    p_choix = commandes.add_parser("choisir", help="choisit la variante la plus rapide "
+                                                   "par taille (cache autoreglage)")
+    p_choix.add_argument("--tailles", type=int, nargs="+", default=[2, 64, 2048, 65536],
+                         help="tailles d'état (paires)")
+    p_choix.add_argument("--n-pas", type=int, default=200)
+    p_choix.add_argument("--fichier", default=None,
+                         help="fichier du cache (défaut : celui de autoreglage.py)")
+
+    args = parser.parse_args()
+
+    print("=" * 78)
+    if args.commande == "mesurer":
+        if any(taille % 2 for taille in args.tailles):
+            parser.error("les tailles d'état doivent être paires (x, v par oscillateur)")
+        print("Banc de performances : mesures")
+        print("=" * 78)
+        resultats = mesurer(args.tailles, args.dt, args.t_max, args.variantes,
+                            args.echauffement, args.repetitions)
+        with open(args.sortie, "w", encoding="utf-8") as f:
+            json.dump(resultats, f, indent=2)
+        print(f"\n✓ Résultats sauvegardés : {args.sortie}")
+    elif args.commande == "choisir":
+        print("Banc de performances : choix automatique de la variante")
+        print("=" * 78)
+        rk4_auto = dispatcheur_rk4(args.fichier, verbeux=True)
+        for taille in args.tailles:
+            y0 = etat_initial(taille)
+            start = time.perf_counter()
+            y = rk4_auto(y0, 0.01, args.n_pas)
+            duree = time.perf_counter() - start
+            reference = VARIANTES["ensemble"](y0, 0.01, args.n_pas)
+            print(f"   taille {taille:>6} : {rk4_auto.gagnants[_signature_rk4(y0, 0.01, args.n_pas)]:<9}"
+                  f" {duree:.3f} s (écart à la variante ensemble "
+                  f"{np.max(np.abs(y - reference)):.1e})")
+    else:
+        print("Banc de performances : comparaison")
+        print("=" * 78)
+        with open(args.ancien, encoding="utf-8") as f:
+            ancien = json.load(f)
+        with open(args.nouveau, encoding="utf-8") as f:
+            nouveau = json.load(f)
+        regressions = comparer(ancien, nouveau, args.seuil)
+        if regressions:
+            print(f"\n❌ {len(regressions)} régression(s) détectée(s)")
+            sys.exit(1)
+        print("\n✅ Aucune régression")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+Réseaux de désintégration radioactive (généralisation de q02.py).
+
+q02.py traite la seule chaîne X → Y → Z. Ici un réseau quelconque est
+décrit par une table de nucléides :
+
+    table = [("X", 1.0, [("Y", 1.0)]),
+             ("Y", 0.1, [("Z", 0.7), ("W", 0.3)]),   # embranchement
+             ("Z", 0.0, []),                          # stable
+             ("W", 0.0, [])]
+
+(nom, constante de désintégration λ, [(fille, rapport d'embranchement)]).
+Les populations vérifient dN/dt = A N avec la matrice creuse des taux A.
+
+Les populations aux instants demandés sont obtenues sans pas de temps :
+    - chaîne linéaire (un seul parent et une seule fille par nucléide, λ
+      distinctes) : solution de Bateman explicite, écrite sous la forme
+      N(t) = V exp(-λ t) V⁻¹ N0 avec les vecteurs propres V connus en forme
+      close. Cette somme de termes qui se compensent perd toute précision
+      pour les chaînes longues ou à constantes proches : elle n'est choisie
+      que si le facteur d'amplification des arrondis reste faible ;
+    - réseau quelconque : action de l'exponentielle de matrice,
+      exp(A t) N0. Pour les réseaux de taille modérée et une grille
+      uniforme, exp(A Δt) dense est calculée une seule fois puis appliquée
+      d'instant en instant ; sinon on utilise l'action creuse de scipy
+      (expm_multiply), sans jamais former exp(A t).
+Dans tous les cas N0 peut contenir plusieurs inventaires initiaux en
+colonnes, évalués d'un seul coup.
+"""
+import numpy as np
+from scipy import sparse
+from scipy.linalg import expm, solve_triangular
+from scipy.sparse.linalg import expm_multiply
+
+
+# La forme de Bateman n'est choisie automatiquement que pour les chaînes
+# courtes dont le facteur d'amplification des arrondis reste sous ce seuil
+# (erreur relative d'environ 1e-13)
+LONGUEUR_MAX_BATEMAN = 50
+AMPLIFICATION_MAX_BATEMAN = 1e3
+
+# Au-delà de cette taille, les matrices denses (n, n) et leurs
+# factorisations en O(n³) coûtent plus cher que expm_multiply
+TAILLE_MAX_DENSE = 300
+
+
+def matrice_taux(table):
+    """
+    Matrice creuse des taux du réseau.
+
+    Paramètres
+    ----------
+    table : list
+        Liste de (nom, constante, [(fille, rapport), ...]).
+
+    Retour
+    ------
+    noms : list
+        Noms des nucléides, dans l'ordre des lignes de A.
+    A : scipy.sparse.csr_matrix
+        Matrice (n, n) : A[i, i] = -λ_i et A[j, i] = rapport × λ_i pour
+        chaque fille j de i.
+    """
+    noms = [nom for nom, _, _ in table]
+    indice = {nom: i for i, nom in enumerate(noms)}
+    if len(indice) != len(noms):
+        raise ValueError("Nom de nucléide en double dans la table")
+
+    lignes, colonnes, valeurs = [], [], []
+    for i, (nom, constante, filles) in enumerate(table):
+        lignes.append(i)
+        colonnes.append(i)
+        valeurs.append(-constante)
+        for fille, rapport in filles:
+            if fille not in indice:
+                raise ValueError(f"Fille inconnue : {fille} (parent {nom})")
+            lignes.append(indice[fille])
+            colonnes.append(i)
+            valeurs.append(rapport * constante)
+    n = len(noms)
+    A = sparse.csr_matrix((valeurs, (lignes, colonnes)), shape=(n, n))
+    return noms, A
+
+
+def chaine_lineaire(table):
+    """
+    Ordre des nucléides si le réseau est une chaîne linéaire, sinon None.
+
+    Une chaîne linéaire a un seul nucléide sans parent, chaque nucléide a au
+    plus une fille et au plus un parent. Les constantes doivent être
+    distinctes pour la formule de Bateman.
+
+    Retour
+    ------
+    ordre : list d'indices ou None
+        Indices des nucléides de la tête à la queue de la chaîne.
+    rapports : ndarray ou None
+        Rapport d'embranchement vers le nucléide suivant.
+    """
+    indice = {nom: i for i, (nom, _, _) in enumerate(table)}
+    suivant, parents = {}, {}
+    for i, (_, _, filles) in enumerate(table):
+        if len(filles) > 1:
+            return None, None
+        for fille, rapport in filles:
+            suivant[i] = (indice[fille], rapport)
+            parents[indice[fille]] = parents.get(indice[fille], 0) + 1
+    if any(nombre > 1 for nombre in parents.values()):
+        return None, None
+    tetes = [i for i in range(len(table)) if i not in parents]
+    if len(tetes) != 1:
+        return None, None
+
+    ordre, rapports = [tetes[0]], []
+    while ordre[-1] in suivant:
+        i, rapport = suivant[ordre[-1]]
+        ordre.append(i)
+        rapports.append(rapport)
+    if len(ordre) != len(table):
+        return None, None
+    constantes = np.array([table[i][1] for i in ordre])
+    if np.unique(constantes).size != constantes.size:
+        return None, None
+    return ordre, np.array(rapports)
+
+
+def _vecteurs_bateman(constantes, rapports):
+    """Vecteurs propres de la chaîne (matrice triangulaire inférieure unitaire)."""
+    flux = np.asarray(rapports, dtype=float) * constantes[:-1]  # b_j λ_j
+    n = constantes.size
+
+    # V[i, k] = Π_{j=k}^{i-1} b_j λ_j / Π_{l=k+1}^{i} (λ_l - λ_k)
+    V = np.zeros((n, n))
+    with np.errstate(over="ignore", invalid="ignore"):
+        for k in range(n):
+            V[k, k] = 1.0
+            for i in range(k + 1, n):
+                V[i, k] = V[i - 1, k] * flux[i - 1] / (constantes[i] - constantes[k])
+    return V
+
+
+def amplification_bateman(constantes, rapports, N0):
+    """
+    Facteur d'amplification des arrondis de la forme de Bateman.
+
+    Les populations sont des sommes Σ_k V[i, k] c_k e^{-λ_k t} de termes qui
+    se compensent : l'erreur relative est d'environ ε fois
+    max_i Σ_k |V[i, k]| |c_k| / max |N0|. Ce facteur explose avec la
+    longueur de la chaîne et quand des constantes sont proches.
+
+    Retour
+    ------
+    float
+        Facteur d'amplification (inf si V ou c débordent).
+    """
+    constantes = np.asarray(constantes, dtype=float)
+    V = _vecteurs_bateman(constantes, rapports)
+    N0 = np.asarray(N0, dtype=float)
+    if not np.all(np.isfinite(V)):
+        return np.inf
+    coefficients = solve_triangular(V, N0, lower=True, unit_diagonal=True)
+    echelle = np.max(np.abs(N0))
+    if not np.all(np.isfinite(coefficients)) or echelle == 0.0:
+        return np.inf if echelle > 0.0 else 1.0
+    return float(np.max(np.abs(V) @ np.abs(coefficients)) / echelle)
+
+
+def bateman_chaine(constantes, rapports, N0, temps):
+    """
+    Solution de Bateman pour une chaîne linéaire 1 → 2 → ... → n.
+
+    Cette forme close n'est précise que pour des chaînes courtes à
+    constantes bien séparées (voir amplification_bateman()).
+
+    Paramètres
+    ----------
+    constantes : ndarray
+        Constantes λ_1, ..., λ_n, toutes distinctes (λ_n = 0 si le dernier
+        nucléide est stable).
+    rapports : ndarray
+        Rapports d'embranchement b_1, ..., b_{n-1} vers le nucléide suivant.
+    N0 : ndarray
+        Inventaire initial (n,) ou inventaires (n, m) en colonnes.
+    temps : float ou ndarray
+        Instants d'évaluation.
+
+    Retour
+    ------
+    ndarray
+        Populations de forme (temps.size,) + N0.shape.
+    """
+    constantes = np.asarray(constantes, dtype=float)
+    V = _vecteurs_bateman(constantes, rapports)
+
+    N0 = np.asarray(N0, dtype=float)
+    coefficients = solve_triangular(V, N0, lower=True, unit_diagonal=True)
+    temps = np.atleast_1d(np.asarray(temps, dtype=float))
+    exponentielles = np.exp(-np.outer(temps, constantes))  # (temps, n)
+    if N0.ndim == 1:
+        return (exponentielles * coefficients) @ V.T
+    return np.einsum("ik,tk,km->tim", V, exponentielles, coefficients)
+
+
+def evoluer(A, N0, temps, methode="auto"):
+    """
+    Populations exp(A t) N0 aux instants demandés, pour un réseau quelconque.
+
+    Paramètres
+    ----------
+    A : scipy.sparse matrix ou ndarray
+        Matrice des taux (n, n).
+    N0 : ndarray
+        Inventaire initial (n,) ou inventaires (n, m) en colonnes.
+    temps : float ou ndarray
+        Instants d'évaluation (t ≥ 0).
+    methode : str
+        "dense" (exp(A Δt) calculée une fois et appliquée d'instant en
+        instant ; les grilles non uniformes passent par expm_multiply),
+        "creuse" (expm_multiply, sans jamais former exp(A t)) ou "auto"
+        (dense jusqu'à TAILLE_MAX_DENSE nucléides).
+
+    Retour
+    ------
+    ndarray
+        Populations de forme (temps.size,) + N0.shape.
+    """
+    if methode == "auto":
+        methode = "dense" if A.shape[0] <= TAILLE_MAX_DENSE else "creuse"
+    if methode not in ("dense", "creuse"):
+        raise ValueError(f"Méthode inconnue : {methode} (choix : dense, creuse, auto)")
+
+    N0 = np.asarray(N0, dtype=float)
+    temps = np.atleast_1d(np.asarray(temps, dtype=float))
+    resultat = np.empty((temps.size,) + N0.shape)
+    ecarts = np.diff(temps)
+    uniforme = temps.size == 1 or np.allclose(ecarts, ecarts[0], rtol=1e-9, atol=0.0)
+
+    if methode == "dense" and uniforme:
+        # exp(A Δt) une seule fois, puis un produit matriciel par instant
+        A = A.toarray() if sparse.issparse(A) else np.asarray(A, dtype=float)
+        resultat[0] = N0 if temps[0] == 0.0 else expm(A * temps[0]) @ N0
+        if temps.size > 1:
+            P = expm(A * ((temps[-1] - temps[0]) / (temps.size - 1)))
+            for i in range(1, temps.size):
+                resultat[i] = P @ resultat[i - 1]
+        return resultat
+
+    A = sparse.csr_matrix(A)
+    if temps.size > 1 and uniforme:
+        # Grille uniforme : un seul appel produit tous les instants
+        resultat[...] = expm_multiply(A, N0, start=temps[0], stop=temps[-1],
+                                      num=temps.size, endpoint=True)
+    else:
+        for i, t in enumerate(temps):
+            resultat[i] = expm_multiply(A * t, N0)
+    return resultat
+
+
+def evaluer_populations(table, N0, temps, methode="auto"):
+    """
+    Populations du réseau décrit par table aux instants demandés.
+
+    En mode "auto", la solution de Bateman est utilisée si le réseau est
+    une chaîne linéaire à constantes distinctes, d'au plus
+    LONGUEUR_MAX_BATEMAN nucléides et dont le facteur d'amplification des
+    arrondis (amplification_bateman()) reste sous AMPLIFICATION_MAX_BATEMAN ;
+    sinon evoluer() en creux (expm_multiply). "bateman" force la forme
+    close, même mal conditionnée.
+
+    Paramètres
+    ----------
+    table : list
+        Liste de (nom, constante, [(fille, rapport), ...]).
+    N0 : ndarray
+        Inventaire initial (n,) ou inventaires (n, m), dans l'ordre de table.
+    temps : float ou ndarray
+        Instants d'évaluation.
+    methode : str
+        "auto", "bateman", "dense" ou "creuse".
+
+    Retour
+    ------
+    noms : list
+        Noms des nucléides.
+    N : ndarray
+        Populations de forme (temps.size,) + N0.shape.
+    """
+    noms, A = matrice_taux(table)
+    if methode in ("auto", "bateman"):
+        ordre, rapports = chaine_lineaire(table)
+        if ordre is not None:
+            N0 = np.asarray(N0, dtype=float)
+            constantes = np.array([table[i][1] for i in ordre])
+            if methode == "auto" and (
+                    len(ordre) > LONGUEUR_MAX_BATEMAN
+                    or amplification_bateman(constantes, rapports, N0[ordre])
+                    > AMPLIFICATION_MAX_BATEMAN):
+                return noms, evoluer(A, N0, temps, "creuse")
+            N = bateman_chaine(constantes, rapports, N0[ordre], temps)
+            # Retour à l'ordre de la table
+            resultat = np.empty_like(N)
+            resultat[:, ordre] = N
+            return noms, resultat
+        if methode == "bateman":
+            raise ValueError("Le réseau n'est pas une chaîne linéaire à constantes distinctes")
+        methode = "auto"
+    return noms, evoluer(A, N0, temps, methode)
+
+
+# ========== Vérification et performances ==========
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("Réseaux de désintégration")
+    print("=" * 70)
+
+    # Chaîne de q02 : X → Y → Z, y(t) = k x0 (e^{-k t} - e^{-k2 t}) / (k2 - k)
+    k, k2 = 1.0, 0.1
+    table = [("X", k, [("Y", 1.0)]), ("Y", k2, [("Z", 1.0)]), ("Z", 0.0, [])]
+    temps = np.linspace(0.0, 20.0, 401)
+    noms, N = evaluer_populations(table, [1.0, 0.0, 0.0], temps)
+    y_exact = k * (np.exp(-k * temps) - np.exp(-k2 * temps)) / (k2 - k)
+    print(f"   q02, Bateman : erreur max sur y = {np.max(np.abs(N[:, 1] - y_exact)):.1e}, "
+          f"conservation {np.max(np.abs(N.sum(axis=1) - 1.0)):.1e}")
+
+    # Chaînes plus longues ou à constantes proches : la forme de Bateman
+    # perd toute précision, "auto" passe alors par expm_multiply
+    rng = np.random.default_rng(0)
+    print(f"   {'chaîne':<30}{'amplification':>14}{'Bateman':>10}{'auto':>10}"
+          "  (écart à expm_multiply)")
+    for n, description, constantes in [
+            (10, "λ ∈ [1e-3, 10]", 10.0 ** rng.uniform(-3, 1, 9)),
+            (40, "λ ∈ [1e-3, 10]", 10.0 ** rng.uniform(-3, 1, 39)),
+            (200, "λ ∈ [1e-3, 10]", 10.0 ** rng.uniform(-3, 1, 199)),
+            (30, "λ ∈ [0.5, 1]", rng.uniform(0.5, 1.0, 29))]:
+        constantes = np.append(constantes, 0.0)
+        table = [(f"N{i}", constantes[i], [(f"N{i + 1}", 1.0)] if i < n - 1 else [])
+                 for i in range(n)]
+        N0 = rng.uniform(0.0, 1.0, (n, 5))
+        temps = np.linspace(0.0, 100.0, 11)
+        _, N_creuse = evaluer_populations(table, N0, temps, methode="creuse")
+        ecarts = [np.max(np.abs(evaluer_populations(table, N0, temps, methode)[1] - N_creuse))
+                  for methode in ("bateman", "auto")]
+        print(f"   {f'{n} nucléides, {description}':<30}"
+              f"{amplification_bateman(constantes, np.ones(n - 1), N0):>14.1e}"
+              f"{ecarts[0]:>10.1e}{ecarts[1]:>10.1e}")
+
+    # Réseau de 300 nucléides, 40 instants : exp(A Δt) dense contre expm_multiply
+    n = 300
+    constantes = 10.0 ** rng.uniform(-2, 0, n)
+    A = sparse.diags(-constantes) + sparse.diags(0.9 * constantes[:-1], -1)
+    N0 = rng.uniform(0.0, 1.0, (n, 10))
+    temps = np.linspace(1.0, 50.0, 40)
+    resultats, durees = {}, {}
+    for methode in ("dense", "creuse"):
+        start = time.perf_counter()
+        resultats[methode] = evoluer(A, N0, temps, methode)
+        durees[methode] = time.perf_counter() - start
+    print(f"   {n} nucléides, 40 instants : dense {durees['dense']:.2f} s, "
+          f"creuse {durees['creuse']:.2f} s, écart {np.max(np.abs(resultats['dense'] - resultats['creuse'])):.1e}")
+
+    # Réseau de 3000 nucléides avec embranchements, 100 inventaires
+    n, m = 3000, 100
+    constantes = 10.0 ** rng.uniform(-2, 0, n)
+    constantes[-50:] = 0.0  # nucléides stables
+    table = []
+    for i in range(n):
+        filles = []
+        if constantes[i] > 0.0:
+            cibles = rng.choice(np.arange(i + 1, n), size=min(2, n - i - 1), replace=False)
+            rapport = rng.uniform(0.5, 1.0)
+            filles = [(f"N{cibles[0]}", rapport), (f"N{cibles[1]}", 1.0 - rapport)]
+        table.append((f"N{i}", constantes[i], filles))
+    N0 = rng.uniform(0.0, 1.0, (n, m))
+    temps = np.linspace(0.0, 10.0, 6)
+    start = time.perf_counter()
+    noms, N = evaluer_populations(table, N0, temps)
+    duree = time.perf_counter() - start
+    print(f"   Réseau de {n} nucléides, {m} inventaires, {temps.size} instants : "
+          f"{duree:.2f} s, conservation {np.max(np.abs(N.sum(axis=1) - N0.sum(axis=0))):.1e}")
+    print("=" * 70)
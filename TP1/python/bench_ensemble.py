@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Banc d'essai : mode ensemble de RK4
+Comparaison entre une boucle sur rk4() et un seul appel à rk4_ensemble()
+"""
+import time
+import numpy as np
+from rk4 import rk4, rk4_ensemble
+
+
+def deriv(t, y, params):
+    """Dérivées pour l'oscillateur harmonique (un seul état)."""
+    omega = params
+    dy = np.zeros(2)
+    dy[0] = y[1]
+    dy[1] = -omega**2 * y[0]
+    return dy
+
+
+def deriv_ensemble(t, Y, params):
+    """
+    Dérivées pour un ensemble d'oscillateurs harmoniques.
+
+    Y est de forme (n_membres, 2) et params contient la pulsation ω de
+    chaque membre (tableau de taille n_membres ou scalaire).
+    """
+    omega = params
+    dY = np.empty_like(Y)
+    dY[:, 0] = Y[:, 1]
+    dY[:, 1] = -omega**2 * Y[:, 0]
+    return dY
+
+
+def integrer_boucle(Y0, omegas, dt, n_pas):
+    """Intègre chaque membre séparément avec rk4()."""
+    Y = np.copy(Y0)
+    for m in range(Y.shape[0]):
+        y = Y[m]
+        t = 0.0
+        for _ in range(n_pas):
+            y = rk4(t, dt, y, deriv, omegas[m])
+            t += dt
+        Y[m] = y
+    return Y
+
+
+def integrer_ensemble(Y0, omegas, dt, n_pas):
+    """Intègre tous les membres en même temps avec rk4_ensemble()."""
+    Y = np.copy(Y0)
+    t = 0.0
+    for _ in range(n_pas):
+        Y = rk4_ensemble(t, dt, Y, deriv_ensemble, omegas)
+        t += dt
+    return Y
+
+
+# ========== Tests de performance ==========
+if __name__ == "__main__":
+    # Paramètres
+    n_membres = 10000
+    dt = 0.01
+    n_pas = 100
+    rng = np.random.default_rng(0)
+    omegas = rng.uniform(0.5, 2.0, n_membres)
+    Y0 = np.column_stack([rng.uniform(-1.0, 1.0, n_membres), np.zeros(n_membres)])
+
+    print("=" * 60)
+    print("Banc d'essai : RK4 sur un ensemble de", n_membres, "oscillateurs")
+    print("=" * 60)
+
+    # Test 1 : boucle Python sur rk4()
+    print("\n📊 Test 1 : boucle sur rk4()")
+    start = time.perf_counter()
+    Y_boucle = integrer_boucle(Y0, omegas, dt, n_pas)
+    temps_boucle = time.perf_counter() - start
+    print(f"   Temps d'exécution : {temps_boucle:.3f} s")
+
+    # Test 2 : un seul appel vectorisé par pas
+    print("\n📊 Test 2 : rk4_ensemble()")
+    start = time.perf_counter()
+    Y_ensemble = integrer_ensemble(Y0, omegas, dt, n_pas)
+    temps_ensemble = time.perf_counter() - start
+    print(f"   Temps d'exécution : {temps_ensemble:.3f} s")
+
+    # Vérification et gain
+    ecart = np.max(np.abs(Y_boucle - Y_ensemble))
+    print(f"\n   Écart maximal entre les deux méthodes : {ecart:.2e}")
+    print(f"\n✨ Gain de performance : {temps_boucle / temps_ensemble:.1f}x plus rapide")
+
+    # Test 3 : balayage en pas de temps (un dt par membre)
+    print("\n📊 Test 3 : balayage de dt en un seul appel")
+    pas_temps = np.array([0.2, 0.1, 0.05, 0.01])
+    Y = np.tile([1.0, 0.0], (pas_temps.size, 1))
+    t = np.zeros(pas_temps.size)
+    n_pas_max = 1000
+    for _ in range(n_pas_max):
+        Y = rk4_ensemble(t, pas_temps, Y, deriv_ensemble, 1.0)
+        t += pas_temps
+    for dt_m, x_m, t_m in zip(pas_temps, Y[:, 0], t):
+        print(f"   dt = {dt_m:<5} : x({t_m:.0f}) = {x_m:+.6f}   (exact : {np.cos(t_m):+.6f})")
+
+    print("\n" + "=" * 60)
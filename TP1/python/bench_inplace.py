@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Banc d'essai : pas d'intégration sans allocation
+Comparaison de rk4()/euler() avec rk4_inplace()/euler_inplace()
+(mémoire temporaire allouée par pas et temps d'exécution)
+"""
+import time
+import tracemalloc
+import numpy as np
+from rk4 import (rk4, euler, rk4_inplace, euler_inplace,
+                 espace_travail_rk4, espace_travail_euler)
+
+
+def deriv(t, y, params, out=None):
+    """Dérivées pour l'oscillateur harmonique (protocole out= optionnel)."""
+    omega = params
+    dy = np.zeros(2) if out is None else out
+    dy[0] = y[1]
+    dy[1] = -omega**2 * y[0]
+    return dy
+
+
+def deriv_decroissance(t, y, params, out=None):
+    """Décroissance dy/dt = -k y sur un état de grande taille (protocole out=)."""
+    k = params
+    if out is None:
+        return -k * y
+    np.multiply(y, -k, out=out)
+    return out
+
+
+def boucle_standard(pas, y0, dt, n_pas, omega, f=deriv):
+    """Boucle classique : chaque pas renvoie un nouveau tableau."""
+    y = np.copy(y0)
+    t = 0.0
+    for _ in range(n_pas):
+        y = pas(t, dt, y, f, omega)
+        t += dt
+    return y
+
+
+def boucle_inplace(pas, travail, y0, dt, n_pas, omega, f=deriv):
+    """Boucle sans allocation : y et l'espace de travail sont réutilisés."""
+    y = np.copy(y0)
+    t = 0.0
+    for _ in range(n_pas):
+        pas(t, dt, y, f, omega, travail)
+        t += dt
+    return y
+
+
+def octets_alloues_par_pas(pas_unique):
+    """
+    Octets alloués (puis libérés) au cours d'un seul pas, mesurés par le pic
+    de tracemalloc : on répète la mesure et on garde la médiane.
+    """
+    mesures = []
+    tracemalloc.start()
+    for _ in range(50):
+        tracemalloc.reset_peak()
+        avant, _ = tracemalloc.get_traced_memory()
+        pas_unique()
+        _, pic = tracemalloc.get_traced_memory()
+        mesures.append(pic - avant)
+    tracemalloc.stop()
+    return float(np.median(mesures))
+
+
+# ========== Tests de performance ==========
+if __name__ == "__main__":
+    # Paramètres (même durée que q09.py)
+    omega = 1.0
+    dt = 0.001
+    t_max = 100.0
+    n_pas = int(t_max / dt)
+    y0 = np.array([1.0, 0.0])
+
+    print("=" * 60)
+    print(f"Banc d'essai : {n_pas} pas sur l'oscillateur harmonique")
+    print("=" * 60)
+
+    travail_rk4 = espace_travail_rk4(2)
+    travail_euler = espace_travail_euler(2)
+    y_test = np.copy(y0)
+
+    cas = [
+        ("euler()", lambda: boucle_standard(euler, y0, dt, n_pas, omega),
+         lambda: euler(0.0, dt, y_test, deriv, omega)),
+        ("euler_inplace()", lambda: boucle_inplace(euler_inplace, travail_euler, y0, dt, n_pas, omega),
+         lambda: euler_inplace(0.0, dt, y_test, deriv, omega, travail_euler)),
+        ("rk4()", lambda: boucle_standard(rk4, y0, dt, n_pas, omega),
+         lambda: rk4(0.0, dt, y_test, deriv, omega)),
+        ("rk4_inplace()", lambda: boucle_inplace(rk4_inplace, travail_rk4, y0, dt, n_pas, omega),
+         lambda: rk4_inplace(0.0, dt, y_test, deriv, omega, travail_rk4)),
+    ]
+
+    resultats = {}
+    for nom, boucle, pas_unique in cas:
+        print(f"\n📊 {nom}")
+        octets = octets_alloues_par_pas(pas_unique)
+        start = time.perf_counter()
+        y_final = boucle()
+        duree = time.perf_counter() - start
+        resultats[nom] = (y_final, duree)
+        print(f"   Mémoire temporaire par pas : {octets:.0f} octets")
+        print(f"   Temps d'exécution          : {duree:.3f} s "
+              f"({1e6 * duree / n_pas:.2f} µs/pas)")
+
+    # Vérification : les deux versions donnent le même résultat
+    ecart_euler = np.max(np.abs(resultats["euler()"][0] - resultats["euler_inplace()"][0]))
+    ecart_rk4 = np.max(np.abs(resultats["rk4()"][0] - resultats["rk4_inplace()"][0]))
+    print(f"\n   Écart euler / euler_inplace : {ecart_euler:.2e}")
+    print(f"   Écart rk4 / rk4_inplace     : {ecart_rk4:.2e}")
+
+    gain = resultats["rk4()"][1] / resultats["rk4_inplace()"][1]
+    print(f"\n✨ rk4_inplace() : {gain:.1f}x plus rapide que rk4()")
+
+    # Sur un grand état, le coût des allocations n'est plus masqué par
+    # celui des appels de fonctions Python
+    n_etat = 1_000_000
+    n_pas_grand = 50
+    k = 0.5
+    y_grand = np.ones(n_etat)
+    print(f"\n📊 État de taille {n_etat}, {n_pas_grand} pas de RK4")
+    start = time.perf_counter()
+    boucle_standard(rk4, y_grand, dt, n_pas_grand, k, deriv_decroissance)
+    duree_standard = time.perf_counter() - start
+    travail_grand = espace_travail_rk4(n_etat)
+    start = time.perf_counter()
+    boucle_inplace(rk4_inplace, travail_grand, y_grand, dt, n_pas_grand, k, deriv_decroissance)
+    duree_inplace = time.perf_counter() - start
+    print(f"   rk4()         : {duree_standard:.3f} s")
+    print(f"   rk4_inplace() : {duree_inplace:.3f} s")
+    print(f"\n✨ rk4_inplace() : {duree_standard / duree_inplace:.1f}x plus rapide que rk4()")
+    print("\n" + "=" * 60)
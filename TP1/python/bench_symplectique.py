@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Banc d'essai : intégrateurs symplectiques contre RK4
+Diagramme travail-précision sur l'énergie pour de longues durées
+"""
+import time
+import numpy as np
+from integration import integrer
+from symplectique import integrer_symplectique
+
+
+# ========== Problèmes ==========
+def deriv_oscillateur(t, y, params):
+    """Oscillateur harmonique de TP1 : y = [x, v]."""
+    omega = params
+    dy = np.zeros(2)
+    dy[0] = y[1]
+    dy[1] = -omega**2 * y[0]
+    return dy
+
+
+def acceleration_oscillateur(t, x, params):
+    """Partie « impulsion » de l'oscillateur : dv/dt = -ω² x."""
+    omega = params
+    return -omega**2 * x
+
+
+def energie_oscillateur(x, v, params):
+    """Énergie mécanique par unité de masse."""
+    omega = params
+    return 0.5 * v**2 + 0.5 * omega**2 * x**2
+
+
+def deriv_pendule(t, y, params):
+    """Pendule linéarisé de TP2/q02 sans amortissement ni excitation."""
+    Omega, q, Fe, Omega_e = params
+    dy = np.empty(2)
+    dy[0] = y[1]
+    dy[1] = -q * y[1] - Omega**2 * y[0] + Fe * np.sin(Omega_e * t)
+    return dy
+
+
+def acceleration_pendule(t, theta, params):
+    """Partie « impulsion » du pendule (q = 0 : hamiltonien séparable)."""
+    Omega, q, Fe, Omega_e = params
+    return -Omega**2 * theta + Fe * np.sin(Omega_e * t)
+
+
+def energie_pendule(theta, omega, params):
+    """Énergie du pendule linéarisé."""
+    Omega = params[0]
+    return 0.5 * omega**2 + 0.5 * Omega**2 * theta**2
+
+
+PROBLEMES = [
+    {"nom": "Oscillateur harmonique (TP1)", "deriv": deriv_oscillateur,
+     "acceleration": acceleration_oscillateur, "energie": energie_oscillateur,
+     "params": 1.0, "x0": 1.0, "v0": 0.0},
+    {"nom": "Pendule libre (TP2/q02, q=0, Fe=0)", "deriv": deriv_pendule,
+     "acceleration": acceleration_pendule, "energie": energie_pendule,
+     "params": np.array([1.0, 0.0, 0.0, 2.0 / 3.0]), "x0": np.radians(10.0), "v0": 0.0},
+]
+
+
+def erreurs_energie(E, E0):
+    """
+    Erreur relative maximale sur l'énergie, sur le premier dixième de la
+    simulation et sur toute la durée (leur rapport mesure la dérive).
+    """
+    erreur = np.abs(E - E0) / E0
+    return np.max(erreur[: erreur.size // 10 + 1]), np.max(erreur)
+
+
+def mesurer_rk4(probleme, dt, t_max):
+    """Intègre avec RK4 et renvoie (appels, erreur début, erreur fin, durée)."""
+    n_pas = int(round(t_max / dt))
+    temps = dt * np.arange(n_pas + 1)
+    start = time.perf_counter()
+    _, Y = integrer(probleme["deriv"], np.array([probleme["x0"], probleme["v0"]]),
+                    temps, probleme["params"], methode="rk4")
+    duree = time.perf_counter() - start
+    E = probleme["energie"](Y[:, 0], Y[:, 1], probleme["params"])
+    return (4 * n_pas,) + erreurs_energie(E, E[0]) + (duree,)
+
+
+def mesurer_symplectique(probleme, methode, dt, t_max):
+    """Intègre avec un schéma symplectique ; mêmes sorties que mesurer_rk4."""
+    n_pas = int(round(t_max / dt))
+    start = time.perf_counter()
+    _, X, V, evaluations = integrer_symplectique(
+        probleme["acceleration"], probleme["x0"], probleme["v0"], dt, n_pas,
+        probleme["params"], methode=methode)
+    duree = time.perf_counter() - start
+    E = probleme["energie"](X, V, probleme["params"])
+    return (evaluations,) + erreurs_energie(E, E[0]) + (duree,)
+
+
+# ========== Tests de performance ==========
+if __name__ == "__main__":
+    t_max = 1000.0
+    pas_temps = [0.01, 0.05, 0.1, 0.2]
+    methodes = ["rk4", "verlet", "yoshida4", "yoshida6"]
+
+    print("=" * 78)
+    print(f"Banc d'essai : erreur relative sur l'énergie jusqu'à t = {t_max:.0f}")
+    print("=" * 78)
+
+    for probleme in PROBLEMES:
+        print(f"\n📊 {probleme['nom']}")
+        print(f"   {'méthode':<10}{'dt':>6}{'appels':>10}{'ΔE/E (t≤T/10)':>16}"
+              f"{'ΔE/E (t≤T)':>14}{'dérive':>9}{'temps (s)':>11}")
+        for methode in methodes:
+            for dt in pas_temps:
+                if methode == "rk4":
+                    appels, err_debut, err_fin, duree = mesurer_rk4(probleme, dt, t_max)
+                else:
+                    appels, err_debut, err_fin, duree = mesurer_symplectique(
+                        probleme, methode, dt, t_max)
+                derive = err_fin / err_debut if err_debut > 0 else np.nan
+                print(f"   {methode:<10}{dt:>6}{appels:>10}{err_debut:>16.2e}"
+                      f"{err_fin:>14.2e}{derive:>9.1f}{duree:>11.3f}")
+
+    print("\nLa colonne « dérive » vaut ≈ 1 si l'erreur reste bornée, ≈ 10 si elle")
+    print("croît linéairement avec le temps (cas de RK4).")
+    print("\n" + "=" * 78)
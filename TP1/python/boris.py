@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Pousseur de Boris pour des ensembles de particules chargées dans E et B.
+
+Généralisation de q06.py : au lieu d'une particule avancée par Euler, on
+avance d'un coup N particules rangées dans un tableau (N, 6)
+[x, y, z, vx, vy, vz]. Un pas de Boris se décompose en :
+    - demi-accélération électrique  v⁻ = v + (q/m) E dt/2 ;
+    - rotation magnétique exacte    v⁺ = rotation de v⁻ autour de B ;
+    - demi-accélération électrique  v  = v⁺ + (q/m) E dt/2 ;
+    - déplacement                   x  = x + v dt.
+La rotation conserve exactement la norme de la vitesse : la giration reste
+stable (pas de croissance de l'énergie comme avec Euler), même avec un pas
+de temps bien plus grand. Comme pour le schéma saute-mouton, les vitesses
+sont décalées d'un demi-pas par rapport aux positions
+(voir synchroniser_vitesses).
+
+Deux moteurs :
+    - "numpy" : opérations vectorisées sur place, sans allocation par pas
+      (espace de travail préalloué, comme rk4_inplace) ;
+    - "numba" : boucle compilée et parallélisée sur les particules (prange),
+      si numba est installé.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_OK = True
+except Exception:
+    NUMBA_OK = False
+
+
+def espace_travail_boris(n):
+    """
+    Tableaux de travail pour pas_boris() avec n particules.
+
+    Retour
+    ------
+    tuple
+        Quatre tableaux (n, 3) et un tableau (n,).
+    """
+    return (np.empty((n, 3)), np.empty((n, 3)), np.empty((n, 3)),
+            np.empty((n, 3)), np.empty(n))
+
+
+def _produit_vectoriel(a, b, out, tmp):
+    """out = a × b sur place, colonne par colonne (tmp : tableau (n,))."""
+    for i, j, k in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+        np.multiply(a[:, j], b[:, k], out=out[:, i])
+        np.multiply(a[:, k], b[:, j], out=tmp)
+        np.subtract(out[:, i], tmp, out=out[:, i])
+
+
+def pas_boris(X, dt, q_m, E, B, travail):
+    """
+    Un pas de Boris sur place, vectorisé avec numpy.
+
+    Paramètres
+    ----------
+    X : ndarray
+        Tableau (N, 6) des positions et vitesses, modifié sur place.
+    dt : float
+        Pas de temps.
+    q_m : float
+        Rapport charge sur masse.
+    E, B : ndarray
+        Champs (3,) uniformes, ou (N, 3) évalués à la position de chaque
+        particule.
+    travail : tuple
+        Espace de travail renvoyé par espace_travail_boris(N).
+    """
+    a, t, s, vp, tmp = travail
+    v = X[:, 3:]
+    h = 0.5 * q_m * dt
+
+    # Demi-accélération électrique (a est réutilisé pour la seconde moitié)
+    np.multiply(E, h, out=a)
+    np.add(v, a, out=v)
+
+    # Rotation : t = (q/m) B dt/2, s = 2 t / (1 + |t|²)
+    np.multiply(B, h, out=t)
+    np.einsum("ij,ij->i", t, t, out=tmp)
+    tmp += 1.0
+    np.divide(2.0, tmp, out=tmp)
+    np.multiply(t, tmp[:, np.newaxis], out=s)
+
+    # v' = v⁻ + v⁻ × t puis v⁺ = v⁻ + v' × s (t sert ensuite de tampon)
+    _produit_vectoriel(v, t, vp, tmp)
+    np.add(vp, v, out=vp)
+    _produit_vectoriel(vp, s, t, tmp)
+    np.add(v, t, out=v)
+
+    # Seconde demi-accélération et déplacement
+    np.add(v, a, out=v)
+    np.multiply(v, dt, out=vp)
+    np.add(X[:, :3], vp, out=X[:, :3])
+
+
+if NUMBA_OK:
+    @njit(parallel=True, cache=True)
+    def _pas_boris_nb(X, dt, q_m, E, B):
+        """Un pas de Boris compilé ; E et B de forme (1, 3) ou (N, 3)."""
+        h = 0.5 * q_m * dt
+        # Champ uniforme (1, 3) : on relit toujours la ligne 0
+        pe = 1 if E.shape[0] > 1 else 0
+        pb = 1 if B.shape[0] > 1 else 0
+        for i in prange(X.shape[0]):
+            ie = i * pe
+            ib = i * pb
+            ax = h * E[ie, 0]
+            ay = h * E[ie, 1]
+            az = h * E[ie, 2]
+            vx = X[i, 3] + ax
+            vy = X[i, 4] + ay
+            vz = X[i, 5] + az
+
+            tx = h * B[ib, 0]
+            ty = h * B[ib, 1]
+            tz = h * B[ib, 2]
+            f = 2.0 / (1.0 + tx * tx + ty * ty + tz * tz)
+            sx = f * tx
+            sy = f * ty
+            sz = f * tz
+
+            px = vx + vy * tz - vz * ty
+            py = vy + vz * tx - vx * tz
+            pz = vz + vx * ty - vy * tx
+            vx += py * sz - pz * sy + ax
+            vy += pz * sx - px * sz + ay
+            vz += px * sy - py * sx + az
+
+            X[i, 3] = vx
+            X[i, 4] = vy
+            X[i, 5] = vz
+            X[i, 0] += dt * vx
+            X[i, 1] += dt * vy
+            X[i, 2] += dt * vz
+
+
+    @njit(cache=True)
+    def _pousser_nb(X, dt, n_pas, q_m, E, B):
+        """n_pas pas de Boris compilés, champs fixes."""
+        for _ in range(n_pas):
+            _pas_boris_nb(X, dt, q_m, E, B)
+
+
+def _en_tableau_champ(champ):
+    """Champ sous forme (1, 3) ou (N, 3) en float64 contigu."""
+    return np.ascontiguousarray(np.atleast_2d(np.asarray(champ, dtype=float)))
+
+
+def synchroniser_vitesses(X, dt, q_m, E, B):
+    """
+    Recule les vitesses d'un demi-pas (v(t0) → v(t0 - dt/2)) avant pousser().
+
+    Les positions ne sont pas modifiées.
+    """
+    positions = X[:, :3].copy()
+    pas_boris(X, -0.5 * dt, q_m, _en_tableau_champ(E), _en_tableau_champ(B),
+              espace_travail_boris(X.shape[0]))
+    X[:, :3] = positions
+
+
+def pousser(X, dt, n_pas, q_m, E, B, champs=None, t0=0.0, moteur="auto",
+            suivi=None, travail=None):
+    """
+    Avance les particules de n_pas pas de Boris, sur place.
+
+    Paramètres
+    ----------
+    X : ndarray
+        Tableau (N, 6) [x, y, z, vx, vy, vz], modifié sur place.
+    dt : float
+        Pas de temps.
+    n_pas : int
+        Nombre de pas.
+    q_m : float
+        Rapport charge sur masse.
+    E, B : ndarray
+        Champs (3,) uniformes ou (N, 3) ; si champs est donné, ce sont les
+        tableaux (N, 3) remplis à chaque pas.
+    champs : callable ou None
+        champs(t, positions, E, B) remplit E et B sur place aux positions
+        (N, 3) ; None pour des champs fixes.
+    t0 : float
+        Temps initial (transmis à champs).
+    moteur : str
+        "numpy", "numba" ou "auto" (numba s'il est installé).
+    suivi : sequence d'entiers ou None
+        Indices des particules dont on enregistre la trajectoire.
+    travail : tuple ou None
+        Espace de travail du moteur numpy (alloué si None).
+
+    Retour
+    ------
+    ndarray ou None
+        Tableau (n_pas + 1, len(suivi), 6) des états suivis, ou None.
+    """
+    if moteur == "auto":
+        moteur = "numba" if NUMBA_OK else "numpy"
+    if moteur not in ("numpy", "numba"):
+        raise ValueError(f"Moteur inconnu : {moteur} (choix : numpy, numba)")
+    if moteur == "numba" and not NUMBA_OK:
+        raise ValueError("Le moteur numba demande le paquet numba")
+
+    if champs is None:
+        E = _en_tableau_champ(E)
+        B = _en_tableau_champ(B)
+    if moteur == "numpy" and travail is None:
+        travail = espace_travail_boris(X.shape[0])
+
+    historique = None
+    if suivi is not None:
+        historique = np.empty((n_pas + 1, len(suivi), 6))
+        historique[0] = X[suivi]
+
+    # Champs fixes sans suivi : toute la boucle dans le noyau compilé
+    if moteur == "numba" and champs is None and suivi is None:
+        _pousser_nb(X, dt, n_pas, q_m, E, B)
+        return None
+
+    for i in range(n_pas):
+        if champs is not None:
+            champs(t0 + i * dt, X[:, :3], E, B)
+        if moteur == "numba":
+            _pas_boris_nb(X, dt, q_m, E, B)
+        else:
+            pas_boris(X, dt, q_m, E, B, travail)
+        if historique is not None:
+            historique[i + 1] = X[suivi]
+    return historique
+
+
+# ========== Vérification et débit ==========
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("Pousseur de Boris")
+    print("=" * 70)
+
+    # Problème de q06 : q/m = 1, E = ux, B = uz, v0 = uy.
+    # Vitesse de dérive E × B / B² = -uy ; dans le repère de dérive la
+    # vitesse de giration |v - v_d| vaut 2 et doit rester constante.
+    E = np.array([1.0, 0.0, 0.0])
+    B = np.array([0.0, 0.0, 1.0])
+    v_derive = np.array([0.0, -1.0, 0.0])
+    t_max = 50.0
+    print(f"\n📊 Problème de q06 (t_max = {t_max}) : écart de |v - v_d| à 2")
+
+    dt = 0.01
+    y = np.array([0.0, 0.0, 0.0, 1.0])
+    for _ in range(int(round(t_max / dt))):
+        y = y + dt * np.array([y[2], y[3], 1.0 + y[3], -y[2]])
+    ecart = abs(np.hypot(y[2], y[3] + 1.0) - 2.0)
+    print(f"   Euler dt = {dt:<5}: {ecart:.1e}")
+
+    for dt in [0.01, 0.1, 0.5]:
+        X = np.array([[0.0, 0.0, 0.0, 0.0, 1.0, 0.0]])
+        synchroniser_vitesses(X, dt, 1.0, E, B)
+        pousser(X, dt, int(round(t_max / dt)), 1.0, E, B, moteur="numpy")
+        ecart = abs(np.linalg.norm(X[0, 3:] - v_derive) - 2.0)
+        print(f"   Boris dt = {dt:<5}: {ecart:.1e}")
+
+    # Débit sur un faisceau
+    n_particules, n_pas = 1_000_000, 20
+    rng = np.random.default_rng(0)
+    moteurs = ["numpy", "numba"] if NUMBA_OK else ["numpy"]
+    print(f"\n📊 Débit : {n_particules} particules, {n_pas} pas")
+    for moteur in moteurs:
+        X = np.zeros((n_particules, 6))
+        X[:, 3:] = rng.normal(size=(n_particules, 3))
+        pousser(X, 0.1, 1, 1.0, E, B, moteur=moteur)  # compilation éventuelle
+        start = time.perf_counter()
+        pousser(X, 0.1, n_pas, 1.0, E, B, moteur=moteur)
+        duree = time.perf_counter() - start
+        print(f"   {moteur:<6}: {n_particules * n_pas / duree:.2e} particules·pas/s")
+    print("=" * 70)
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Approximation du centre guide : dérive des particules sans résoudre la
+giration cyclotron.
+
+Dans q06.py la trajectoire est une giration rapide autour d'une dérive E × B
+lente ; suivre chaque tour impose dt ≈ 0.01. Quand le rayon de Larmor est
+petit devant la longueur de variation des champs et la période cyclotron
+petite devant la durée simulée, on peut ne suivre que le centre guide R et
+la vitesse parallèle v∥, le moment magnétique μ = v⊥² / (2B) (par unité de
+masse) restant constant :
+
+    dR/dt  = v∥ b + E × b / B + μ/(q/m B) b × ∇B + v∥²/(q/m B) b × (b·∇)b
+    dv∥/dt = (q/m) E·b - μ b·∇B
+
+avec b = B / B. Les gradients sont calculés par différences finies centrées
+à partir de la même fonction champs(t, positions, E, B) que boris.pousser(),
+et le système (N, 4) [X, Y, Z, v∥] est avancé par rk4_ensemble avec un pas
+bien plus grand que la période cyclotron.
+
+suivre() choisit automatiquement entre ce mode et l'orbite complète (Boris)
+d'après le critère critere_centre_guide().
+"""
+import numpy as np
+from rk4 import rk4_ensemble
+from boris import pousser, synchroniser_vitesses
+
+
+def _evaluer_champs(champs, t, positions):
+    """E et B aux positions (N, 3), dans des tableaux neufs."""
+    E = np.empty_like(positions)
+    B = np.empty_like(positions)
+    champs(t, positions, E, B)
+    return E, B
+
+
+def _norme(V):
+    """Norme de chaque ligne d'un tableau (N, 3)."""
+    return np.sqrt(np.einsum("ij,ij->i", V, V))
+
+
+def gradient_module_B(champs, t, positions, h):
+    """∇|B| par différences finies centrées, tableau (N, 3)."""
+    gradient = np.empty_like(positions)
+    for k in range(3):
+        decale = positions.copy()
+        decale[:, k] += h
+        plus = _norme(_evaluer_champs(champs, t, decale)[1])
+        decale[:, k] -= 2.0 * h
+        moins = _norme(_evaluer_champs(champs, t, decale)[1])
+        gradient[:, k] = (plus - moins) / (2.0 * h)
+    return gradient
+
+
+def deriv_centre_guide(t, Y, params):
+    """
+    Dérivées du centre guide pour un ensemble (N, 4) [X, Y, Z, v∥].
+
+    Paramètres
+    ----------
+    params : tuple
+        (q_m, mu, champs, h) : rapport charge sur masse, moments
+        magnétiques (N,), fonction champs et pas des différences finies.
+    """
+    q_m, mu, champs, h = params
+    positions = Y[:, :3]
+    v_par = Y[:, 3]
+
+    E, B = _evaluer_champs(champs, t, positions)
+    module = _norme(B)
+    b = B / module[:, np.newaxis]
+
+    # Gradient de |B| et courbure (b·∇)b des lignes de champ
+    grad_B = gradient_module_B(champs, t, positions, h)
+    b_plus = _evaluer_champs(champs, t, positions + h * b)[1]
+    b_moins = _evaluer_champs(champs, t, positions - h * b)[1]
+    courbure = (b_plus / _norme(b_plus)[:, np.newaxis]
+                - b_moins / _norme(b_moins)[:, np.newaxis]) / (2.0 * h)
+
+    inverse = 1.0 / (q_m * module)
+    dY = np.empty_like(Y)
+    dY[:, :3] = (v_par[:, np.newaxis] * b
+                 + np.cross(E, b) / module[:, np.newaxis]
+                 + (mu * inverse)[:, np.newaxis] * np.cross(b, grad_B)
+                 + (v_par**2 * inverse)[:, np.newaxis] * np.cross(b, courbure))
+    dY[:, 3] = q_m * np.einsum("ij,ij->i", E, b) - mu * np.einsum("ij,ij->i", b, grad_B)
+    return dY
+
+
+def vers_centre_guide(X, q_m, E, B):
+    """
+    Centre guide, vitesse parallèle et moment magnétique de particules.
+
+    Paramètres
+    ----------
+    X : ndarray
+        Tableau (N, 6) [x, y, z, vx, vy, vz].
+    q_m : float
+        Rapport charge sur masse.
+    E, B : ndarray
+        Champs (N, 3) aux positions des particules.
+
+    Retour
+    ------
+    Y : ndarray
+        Tableau (N, 4) [X, Y, Z, v∥] des centres guides.
+    mu : ndarray
+        Moments magnétiques v⊥² / (2B), tableau (N,).
+    """
+    module = _norme(B)
+    b = B / module[:, np.newaxis]
+    v = X[:, 3:]
+    v_par = np.einsum("ij,ij->i", v, b)
+    # Vitesse de giration, dans le repère qui dérive à E × B / B²
+    v_perp = v - v_par[:, np.newaxis] * b - np.cross(E, b) / module[:, np.newaxis]
+    Y = np.empty((X.shape[0], 4))
+    Y[:, :3] = X[:, :3] - np.cross(b, v_perp) / (q_m * module)[:, np.newaxis]
+    Y[:, 3] = v_par
+    mu = np.einsum("ij,ij->i", v_perp, v_perp) / (2.0 * module)
+    return Y, mu
+
+
+def critere_centre_guide(X, q_m, champs, t_max, t0=0.0, h=1e-4):
+    """
+    Paramètres d'échelle du centre guide.
+
+    Retour
+    ------
+    dict
+        "rayon_sur_gradient" : max de ρ_L |∇B| / B (rayon de Larmor sur
+        longueur de variation de B) ;
+        "periode_sur_duree" : max de la période cyclotron sur t_max ;
+        "periode" : plus grande période cyclotron 2π / (|q/m| B).
+    """
+    positions = np.ascontiguousarray(X[:, :3])
+    E, B = _evaluer_champs(champs, t0, positions)
+    mu = vers_centre_guide(X, q_m, E, B)[1]
+    module = _norme(B)
+    rayon = np.sqrt(2.0 * mu * module) / (abs(q_m) * module)
+    grad_B = _norme(gradient_module_B(champs, t0, positions, h))
+    periode = 2.0 * np.pi / (abs(q_m) * module)
+    return {
+        "rayon_sur_gradient": float(np.max(rayon * grad_B / module)),
+        "periode_sur_duree": float(np.max(periode) / t_max),
+        "periode": float(np.max(periode)),
+    }
+
+
+def suivre(X, q_m, t_max, champs, mode="auto", seuil=0.01, n_pas_centre_guide=50,
+           pas_par_giration=20, h=1e-4, moteur="auto"):
+    """
+    Suit des particules jusqu'à t_max, en orbite complète ou en centre guide.
+
+    Paramètres
+    ----------
+    X : ndarray
+        Tableau (N, 6) [x, y, z, vx, vy, vz] au temps 0 (non modifié).
+    q_m : float
+        Rapport charge sur masse.
+    t_max : float
+        Durée simulée.
+    champs : callable
+        champs(t, positions, E, B) remplissant E et B (N, 3) sur place.
+    mode : str
+        "orbite", "centre_guide" ou "auto" : centre guide si les deux
+        rapports de critere_centre_guide() sont inférieurs à seuil.
+    seuil : float
+        Seuil du choix automatique.
+    n_pas_centre_guide : int
+        Nombre de pas RK4 en mode centre guide.
+    pas_par_giration : int
+        Nombre de pas de Boris par période cyclotron en mode orbite.
+    h : float
+        Pas des différences finies.
+    moteur : str
+        Moteur de boris.pousser().
+
+    Retour
+    ------
+    dict
+        "mode", "critere", "centre_guide" (tableau (N, 4) final), "mu" et,
+        en mode orbite, "X" (tableau (N, 6) final) ; "n_pas" et "dt".
+    """
+    critere = critere_centre_guide(X, q_m, champs, t_max, h=h)
+    if mode == "auto":
+        petit = max(critere["rayon_sur_gradient"], critere["periode_sur_duree"]) < seuil
+        mode = "centre_guide" if petit else "orbite"
+    if mode not in ("orbite", "centre_guide"):
+        raise ValueError(f"Mode inconnu : {mode} (choix : orbite, centre_guide, auto)")
+
+    E, B = _evaluer_champs(champs, 0.0, np.ascontiguousarray(X[:, :3]))
+    Y, mu = vers_centre_guide(X, q_m, E, B)
+    resultat = {"mode": mode, "critere": critere, "mu": mu}
+
+    if mode == "centre_guide":
+        dt = t_max / n_pas_centre_guide
+        for i in range(n_pas_centre_guide):
+            Y = rk4_ensemble(i * dt, dt, Y, deriv_centre_guide, (q_m, mu, champs, h))
+        resultat.update({"centre_guide": Y, "n_pas": n_pas_centre_guide, "dt": dt})
+        return resultat
+
+    # Orbite complète : pas de Boris fixé par la plus courte période cyclotron
+    periode_min = 2.0 * np.pi / (abs(q_m) * np.max(_norme(B)))
+    n_pas = int(np.ceil(t_max / periode_min * pas_par_giration))
+    dt = t_max / n_pas
+    X = np.array(X, dtype=float)
+    synchroniser_vitesses(X, dt, q_m, E, B)
+    pousser(X, dt, n_pas, q_m, np.empty_like(E), np.empty_like(B), champs=champs,
+            moteur=moteur)
+    # Vitesses ramenées au temps t_max (elles sont décalées de dt/2)
+    E, B = _evaluer_champs(champs, t_max, np.ascontiguousarray(X[:, :3]))
+    synchroniser_vitesses(X, -dt, q_m, E, B)
+    resultat.update({"X": X, "centre_guide": vers_centre_guide(X, q_m, E, B)[0],
+                     "n_pas": n_pas, "dt": dt})
+    return resultat
+
+
+# ========== Validation contre l'orbite complète ==========
+if __name__ == "__main__":
+    import time
+    from boris import NUMBA_OK
+
+    # Champs de q06 avec B plus intense et un gradient faible :
+    # E = ux, B = B0 (1 + x / L) uz
+    q_m, B0, L = 1.0, 10.0, 100.0
+
+    def champs(t, positions, E, B):
+        E[...] = 0.0
+        E[:, 0] = 1.0
+        B[...] = 0.0
+        B[:, 2] = B0 * (1.0 + positions[:, 0] / L)
+
+    n_particules, t_max = 1000, 200.0
+    rng = np.random.default_rng(0)
+    X0 = np.zeros((n_particules, 6))
+    X0[:, :2] = rng.uniform(-1.0, 1.0, (n_particules, 2))
+    X0[:, 3:] = rng.normal(size=(n_particules, 3))
+
+    print("=" * 70)
+    print(f"Centre guide contre orbite complète ({n_particules} particules, t_max = {t_max})")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    auto = suivre(X0, q_m, t_max, champs, n_pas_centre_guide=20)
+    duree_cg = time.perf_counter() - start
+    critere = auto["critere"]
+    print(f"   ρ_L |∇B| / B = {critere['rayon_sur_gradient']:.1e}, "
+          f"T_c / t_max = {critere['periode_sur_duree']:.1e} → mode {auto['mode']}")
+    print(f"   Centre guide    : {auto['n_pas']} pas (dt = {auto['dt']:.3f}), {duree_cg:.3f} s")
+
+    moteurs = ["numpy", "numba"] if NUMBA_OK else ["numpy"]
+    for moteur in moteurs:
+        suivre(X0[:1], q_m, 1.0, champs, mode="orbite", moteur=moteur)  # compilation
+        start = time.perf_counter()
+        orbite = suivre(X0, q_m, t_max, champs, mode="orbite", moteur=moteur)
+        duree_orbite = time.perf_counter() - start
+        print(f"   Orbite ({moteur:<5}) : {orbite['n_pas']} pas (dt = {orbite['dt']:.3f}), "
+              f"{duree_orbite:.3f} s → gain du centre guide {duree_orbite / duree_cg:.0f}x")
+
+    ecart = _norme(auto["centre_guide"][:, :3] - orbite["centre_guide"][:, :3])
+    depart = vers_centre_guide(X0, q_m, *_evaluer_champs(champs, 0.0, X0[:, :3].copy()))[0]
+    deplacement = _norme(orbite["centre_guide"][:, :3] - depart[:, :3])
+    rayon = np.sqrt(2.0 * auto["mu"] * B0) / (q_m * B0)
+    print(f"   Écart des centres guides : médiane {np.median(ecart):.1e}, "
+          f"max {np.max(ecart):.1e}")
+    print(f"   (dérive parcourue ~ {np.median(deplacement):.0f}, "
+          f"rayon de Larmor ~ {np.median(rayon):.2f})")
+    print("=" * 70)
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Cartes de champs E et B tabulées sur une grille 3-D régulière.
+
+Le deriv de q06.py impose E = ux et B = uz. Ici les champs sont donnés par
+leurs valeurs aux nœuds d'une grille régulière (origine, pas) et interpolés
+de façon trilinéaire à la position de chaque particule, pour tout un lot de
+particules à la fois.
+
+E et B sont rangés ensemble dans un seul tableau (nx, ny, nz, 6) : la case
+et les 8 poids de l'interpolation ne sont calculés qu'une fois par particule
+et servent aux six composantes, lues d'un seul accès mémoire par coin.
+Les positions hors de la grille sont ramenées sur son bord (champ prolongé
+par continuité).
+
+champs_depuis_carte() fournit la fonction champs(t, positions, E, B)
+attendue par boris.pousser().
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_OK = True
+except Exception:
+    NUMBA_OK = False
+
+
+def creer_carte(origine, pas, E, B):
+    """
+    Regroupe les champs tabulés dans une carte.
+
+    Paramètres
+    ----------
+    origine : sequence
+        Coordonnées (x, y, z) du nœud (0, 0, 0).
+    pas : sequence
+        Espacement (dx, dy, dz) des nœuds.
+    E, B : ndarray
+        Valeurs aux nœuds, de forme (nx, ny, nz, 3) ; nx, ny, nz ≥ 2.
+
+    Retour
+    ------
+    dict
+        "origine", "inverse_pas", "forme" et "valeurs" (nx, ny, nz, 6).
+    """
+    E = np.asarray(E, dtype=float)
+    B = np.asarray(B, dtype=float)
+    if E.shape != B.shape or E.ndim != 4 or E.shape[3] != 3:
+        raise ValueError("E et B doivent avoir la même forme (nx, ny, nz, 3)")
+    if min(E.shape[:3]) < 2:
+        raise ValueError("La grille doit compter au moins 2 nœuds par direction")
+    return {
+        "origine": np.asarray(origine, dtype=float),
+        "inverse_pas": 1.0 / np.asarray(pas, dtype=float),
+        "forme": np.array(E.shape[:3]),
+        "valeurs": np.ascontiguousarray(np.concatenate([E, B], axis=3)),
+    }
+
+
+def tabuler(fonction, origine, pas, forme):
+    """
+    Construit une carte en évaluant fonction(positions) -> (E, B) aux nœuds.
+
+    positions est un tableau (nx * ny * nz, 3) ; E et B sont renvoyés sous
+    la même forme.
+    """
+    axes = [origine[k] + pas[k] * np.arange(forme[k]) for k in range(3)]
+    noeuds = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+    E, B = fonction(noeuds)
+    forme_champ = tuple(forme) + (3,)
+    return creer_carte(origine, pas, np.reshape(E, forme_champ), np.reshape(B, forme_champ))
+
+
+def espace_travail_grille(n):
+    """Tableaux de travail de interpoler() pour n particules."""
+    return (np.empty((n, 3)), np.empty((n, 3), dtype=np.intp), np.empty(n, dtype=np.intp),
+            np.empty(n), np.empty((n, 6)))
+
+
+def interpoler(carte, positions, E, B, travail):
+    """
+    Interpolation trilinéaire de E et B, vectorisée avec numpy.
+
+    Paramètres
+    ----------
+    carte : dict
+        Carte renvoyée par creer_carte().
+    positions : ndarray
+        Tableau (N, 3) des positions.
+    E, B : ndarray
+        Tableaux (N, 3) remplis sur place.
+    travail : tuple
+        Espace de travail renvoyé par espace_travail_grille(N).
+    """
+    f, i0, indice, poids, coin = travail
+    forme = carte["forme"]
+    valeurs = carte["valeurs"].reshape(-1, 6)
+
+    # Coordonnées dans la grille, puis case (i0) et position dans la case (f)
+    np.subtract(positions, carte["origine"], out=f)
+    np.multiply(f, carte["inverse_pas"], out=f)
+    np.clip(f, 0.0, forme - 1, out=f)
+    i0[...] = f  # troncature = partie entière, car f ≥ 0
+    np.minimum(i0, forme - 2, out=i0)
+    np.subtract(f, i0, out=f)
+
+    E[...] = 0.0
+    B[...] = 0.0
+    for dx in (0, 1):
+        for dy in (0, 1):
+            for dz in (0, 1):
+                # Indice à plat du coin et poids (1 - f) ou f par direction
+                np.add(i0[:, 0], dx, out=indice)
+                indice *= forme[1]
+                indice += i0[:, 1]
+                indice += dy
+                indice *= forme[2]
+                indice += i0[:, 2]
+                indice += dz
+                poids[...] = f[:, 0] if dx else 1.0 - f[:, 0]
+                poids *= f[:, 1] if dy else 1.0 - f[:, 1]
+                poids *= f[:, 2] if dz else 1.0 - f[:, 2]
+                np.take(valeurs, indice, axis=0, out=coin)
+                coin *= poids[:, np.newaxis]
+                E += coin[:, :3]
+                B += coin[:, 3:]
+
+
+if NUMBA_OK:
+    @njit(parallel=True, cache=True)
+    def _interpoler_nb(valeurs, origine, inverse_pas, positions, E, B):
+        """Même calcul que interpoler(), compilé et parallèle."""
+        nx, ny, nz = valeurs.shape[0], valeurs.shape[1], valeurs.shape[2]
+        for n in prange(positions.shape[0]):
+            fx = min(max((positions[n, 0] - origine[0]) * inverse_pas[0], 0.0), nx - 1.0)
+            fy = min(max((positions[n, 1] - origine[1]) * inverse_pas[1], 0.0), ny - 1.0)
+            fz = min(max((positions[n, 2] - origine[2]) * inverse_pas[2], 0.0), nz - 1.0)
+            i = min(int(fx), nx - 2)
+            j = min(int(fy), ny - 2)
+            k = min(int(fz), nz - 2)
+            fx -= i
+            fy -= j
+            fz -= k
+            for c in range(3):
+                E[n, c] = 0.0
+                B[n, c] = 0.0
+            for dx in range(2):
+                wx = fx if dx else 1.0 - fx
+                for dy in range(2):
+                    wy = fy if dy else 1.0 - fy
+                    for dz in range(2):
+                        w = wx * wy * (fz if dz else 1.0 - fz)
+                        for c in range(3):
+                            E[n, c] += w * valeurs[i + dx, j + dy, k + dz, c]
+                            B[n, c] += w * valeurs[i + dx, j + dy, k + dz, c + 3]
+
+
+def champs_depuis_carte(carte, moteur="auto"):
+    """
+    Fonction champs(t, positions, E, B) pour boris.pousser().
+
+    Une seule interpolation donne E et B. L'espace de travail du moteur
+    numpy est alloué une fois par nombre de particules.
+
+    Paramètres
+    ----------
+    carte : dict
+        Carte renvoyée par creer_carte() ou tabuler().
+    moteur : str
+        "numpy", "numba" ou "auto" (numba s'il est installé).
+    """
+    if moteur == "auto":
+        moteur = "numba" if NUMBA_OK else "numpy"
+    if moteur not in ("numpy", "numba"):
+        raise ValueError(f"Moteur inconnu : {moteur} (choix : numpy, numba)")
+    if moteur == "numba" and not NUMBA_OK:
+        raise ValueError("Le moteur numba demande le paquet numba")
+    travail = {}
+
+    def champs(t, positions, E, B):
+        if moteur == "numba":
+            _interpoler_nb(carte["valeurs"], carte["origine"], carte["inverse_pas"],
+                           positions, E, B)
+            return
+        n = positions.shape[0]
+        if n not in travail:
+            travail.clear()
+            travail[n] = espace_travail_grille(n)
+        interpoler(carte, positions, E, B, travail[n])
+
+    return champs
+
+
+# ========== Vérification et débit ==========
+if __name__ == "__main__":
+    import time
+    from boris import pousser, NUMBA_OK as BORIS_NUMBA_OK
+
+    print("=" * 70)
+    print("Cartes de champs tabulées")
+    print("=" * 70)
+
+    # Champ linéaire (reproduit exactement par l'interpolation trilinéaire) :
+    # E = ux, B = (1 + 0.1 x) uz
+    def champ_analytique(positions):
+        E = np.zeros_like(positions)
+        B = np.zeros_like(positions)
+        E[:, 0] = 1.0
+        B[:, 2] = 1.0 + 0.1 * positions[:, 0]
+        return E, B
+
+    carte = tabuler(champ_analytique, origine=(-20.0, -20.0, -1.0), pas=(0.5, 0.5, 0.5),
+                    forme=(81, 81, 5))
+
+    n_particules, n_pas, dt = 200_000, 20, 0.1
+    rng = np.random.default_rng(0)
+    X0 = np.zeros((n_particules, 6))
+    X0[:, :2] = rng.uniform(-5.0, 5.0, (n_particules, 2))
+    X0[:, 3:] = rng.normal(size=(n_particules, 3))
+
+    # Validation de l'interpolation
+    E = np.empty((n_particules, 3))
+    B = np.empty((n_particules, 3))
+    interpoler(carte, X0[:, :3], E, B, espace_travail_grille(n_particules))
+    E_ref, B_ref = champ_analytique(X0[:, :3])
+    print(f"   Écart interpolation / champ analytique : "
+          f"{max(np.max(np.abs(E - E_ref)), np.max(np.abs(B - B_ref))):.1e}")
+
+    def champs_analytiques(t, positions, E, B):
+        E[...], B[...] = champ_analytique(positions)
+
+    moteurs = ["numpy", "numba"] if NUMBA_OK and BORIS_NUMBA_OK else ["numpy"]
+    print(f"\n📊 Débit : {n_particules} particules, {n_pas} pas")
+    for moteur in moteurs:
+        for nom, champs in [("analytique", champs_analytiques),
+                            ("carte", champs_depuis_carte(carte, moteur))]:
+            X = X0.copy()
+            E = np.empty((n_particules, 3))
+            B = np.empty((n_particules, 3))
+            pousser(X, dt, 1, 1.0, E, B, champs=champs, moteur=moteur)  # compilation
+            X = X0.copy()
+            start = time.perf_counter()
+            pousser(X, dt, n_pas, 1.0, E, B, champs=champs, moteur=moteur)
+            duree = time.perf_counter() - start
+            print(f"   {moteur:<6} champ {nom:<11}: "
+                  f"{n_particules * n_pas / duree:.2e} particules·pas/s")
+    print("=" * 70)
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Vérification automatique de l'ordre de convergence des intégrateurs.
+
+q07.py et q08.py comparent deux pas de temps à l'œil. Ici on lance un
+intégrateur (euler, rk4, ou tout pas de même signature
+pas(t, dt, y, deriv, params)) sur une échelle géométrique de pas de temps,
+en parallèle, sur un problème dont on connaît la solution analytique :
+    - l'ordre observé est la pente de log(erreur) en fonction de log(dt) ;
+    - le coût par chiffre de précision est le nombre d'appels à deriv divisé
+      par le nombre de chiffres exacts obtenus (-log10(erreur)) ;
+    - on en déduit le plus grand dt (donc le moins coûteux) qui respecte une
+      tolérance donnée, pour ne plus sur-résoudre.
+
+Un problème est décrit par un dictionnaire :
+    {"deriv": deriv, "y0": y0, "params": params, "t_max": t_max,
+     "solution": solution_analytique, "composante": 0}
+où solution_analytique(t) renvoie la valeur exacte de la composante suivie
+aux instants t.
+"""
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def echelle_geometrique(dt_max, n_niveaux, rapport=2.0):
+    """
+    Échelle de pas de temps dt_max, dt_max / rapport, dt_max / rapport², ...
+
+    Retour
+    ------
+    ndarray
+        Les n_niveaux pas de temps, du plus grand au plus petit.
+    """
+    return dt_max / rapport ** np.arange(n_niveaux)
+
+
+def _mesurer(pas, probleme, dt):
+    """
+    Intègre le problème avec un pas de temps donné.
+
+    Le pas est ajusté pour tomber exactement sur t_max. L'erreur est l'écart
+    maximal à la solution analytique sur toute la trajectoire.
+
+    Retour
+    ------
+    dict
+        dt effectif, erreur, nombre d'appels à deriv et durée (s).
+    """
+    deriv = probleme["deriv"]
+    params = probleme["params"]
+    t_max = probleme["t_max"]
+    composante = probleme.get("composante", 0)
+
+    n_pas = max(1, int(round(t_max / dt)))
+    dt = t_max / n_pas
+    temps = dt * np.arange(n_pas + 1)
+
+    appels = [0]
+
+    def deriv_comptee(t, y, params, out=None):
+        appels[0] += 1
+        if out is None:
+            return deriv(t, y, params)
+        return deriv(t, y, params, out)
+
+    start = time.perf_counter()
+    y = np.array(probleme["y0"], dtype=float)
+    valeurs = np.empty(n_pas + 1)
+    valeurs[0] = y[composante]
+    for i in range(n_pas):
+        y = pas(temps[i], dt, y, deriv_comptee, params)
+        valeurs[i + 1] = y[composante]
+    duree = time.perf_counter() - start
+
+    erreur = np.max(np.abs(valeurs - probleme["solution"](temps)))
+    return {"dt": dt, "erreur": float(erreur), "evaluations": appels[0], "duree": duree}
+
+
+def ajuster_ordre(dt, erreur, plancher=1e-13):
+    """
+    Ordre observé : pente de log(erreur) en fonction de log(dt).
+
+    Les points dont l'erreur est au niveau des erreurs d'arrondi (sous le
+    plancher) sont écartés de l'ajustement.
+
+    Retour
+    ------
+    ordre : float
+        Pente ajustée (nan s'il reste moins de deux points).
+    constante : float
+        C tel que erreur ≈ C dt^ordre.
+    """
+    dt = np.asarray(dt, dtype=float)
+    erreur = np.asarray(erreur, dtype=float)
+    garder = erreur > plancher
+    if np.count_nonzero(garder) < 2:
+        return np.nan, np.nan
+    pente, ordonnee = np.polyfit(np.log(dt[garder]), np.log(erreur[garder]), 1)
+    return pente, np.exp(ordonnee)
+
+
+def verifier_ordre(pas, probleme, pas_temps, ordre_attendu=None,
+                   parallele=True, n_processus=None):
+    """
+    Mesure l'erreur sur toute l'échelle de pas de temps et ajuste l'ordre.
+
+    Paramètres
+    ----------
+    pas : callable
+        Intégrateur pas(t, dt, y, deriv, params) -> y(t + dt), défini au
+        niveau d'un module pour pouvoir être envoyé aux processus.
+    probleme : dict
+        Description du problème (voir l'en-tête du module).
+    pas_temps : sequence
+        Pas de temps à essayer (par exemple echelle_geometrique(...)).
+    ordre_attendu : float ou None
+        Si donné, on indique si l'ordre observé est à moins de 0.3 de lui.
+    parallele : bool
+        Lance chaque pas de temps dans un processus séparé.
+    n_processus : int ou None
+        Nombre de processus (par défaut, le nombre de cœurs).
+
+    Retour
+    ------
+    dict
+        "mesures" (liste de dict de _mesurer, du plus grand dt au plus
+        petit), "ordre", "constante", "cout_par_chiffre" (ndarray) et
+        "conforme" (bool ou None).
+    """
+    pas_temps = sorted((float(dt) for dt in pas_temps), reverse=True)
+    if parallele and len(pas_temps) > 1:
+        with ProcessPoolExecutor(max_workers=n_processus) as executeur:
+            mesures = list(executeur.map(_mesurer, [pas] * len(pas_temps),
+                                         [probleme] * len(pas_temps), pas_temps))
+    else:
+        mesures = [_mesurer(pas, probleme, dt) for dt in pas_temps]
+
+    dt = np.array([m["dt"] for m in mesures])
+    erreur = np.array([m["erreur"] for m in mesures])
+    evaluations = np.array([m["evaluations"] for m in mesures])
+    ordre, constante = ajuster_ordre(dt, erreur)
+
+    # Nombre de chiffres exacts ; on évite la division par zéro quand
+    # l'erreur dépasse 1 (aucun chiffre exact)
+    chiffres = np.maximum(-np.log10(np.maximum(erreur, 1e-300)), 1e-12)
+    conforme = None
+    if ordre_attendu is not None:
+        conforme = bool(abs(ordre - ordre_attendu) < 0.3)
+
+    return {
+        "mesures": mesures,
+        "ordre": ordre,
+        "constante": constante,
+        "cout_par_chiffre": evaluations / chiffres,
+        "conforme": conforme,
+    }
+
+
+def dt_le_moins_cher(resultat, tolerance):
+    """
+    Plus grand pas de temps qui respecte la tolérance sur l'erreur.
+
+    Retour
+    ------
+    dt_mesure : float ou None
+        Plus grand dt de l'échelle dont l'erreur mesurée est ≤ tolerance
+        (None si aucun).
+    dt_predit : float
+        dt prédit par l'ajustement erreur ≈ C dt^ordre (nan si l'ajustement
+        a échoué).
+    """
+    dt_mesure = None
+    for m in resultat["mesures"]:
+        if m["erreur"] <= tolerance:
+            dt_mesure = m["dt"]
+            break
+    ordre, constante = resultat["ordre"], resultat["constante"]
+    if np.isfinite(ordre) and ordre > 0:
+        dt_predit = (tolerance / constante) ** (1.0 / ordre)
+    else:
+        dt_predit = np.nan
+    return dt_mesure, dt_predit
+
+
+def afficher_rapport(nom, resultat, tolerance=None):
+    """Affiche le tableau erreur / coût et l'ordre observé."""
+    print(f"\n📊 {nom}")
+    print(f"   {'dt':>10}{'erreur':>12}{'appels':>10}{'durée (s)':>11}{'appels/chiffre':>16}")
+    for m, cout in zip(resultat["mesures"], resultat["cout_par_chiffre"]):
+        print(f"   {m['dt']:>10.2e}{m['erreur']:>12.2e}{m['evaluations']:>10}"
+              f"{m['duree']:>11.3f}{cout:>16.0f}")
+
+    message = f"   Ordre observé : {resultat['ordre']:.2f}"
+    if resultat["conforme"] is not None:
+        message += "  ✓" if resultat["conforme"] else "  ⚠️ différent de l'ordre attendu"
+    print(message)
+
+    if tolerance is not None:
+        dt_mesure, dt_predit = dt_le_moins_cher(resultat, tolerance)
+        texte_mesure = f"{dt_mesure:.2e}" if dt_mesure is not None else "aucun"
+        print(f"   Tolérance {tolerance:.0e} : plus grand dt mesuré {texte_mesure}, "
+              f"dt prédit {dt_predit:.2e}")
+
+
+# ========== Oscillateur harmonique de q07/q08 ==========
+def deriv_oscillateur(t, y, params, out=None):
+    """Dérivées pour l'oscillateur harmonique."""
+    omega = params
+    dy = np.zeros(2) if out is None else out
+    dy[0] = y[1]
+    dy[1] = -omega**2 * y[0]
+    return dy
+
+
+def solution_oscillateur(t):
+    """Solution exacte x(t) = cos(t) pour x0 = 1, v0 = 0, ω = 1."""
+    return np.cos(t)
+
+
+OSCILLATEUR = {
+    "deriv": deriv_oscillateur,
+    "y0": [1.0, 0.0],
+    "params": 1.0,
+    "t_max": 10.0,
+    "solution": solution_oscillateur,
+    "composante": 0,
+}
+
+
+if __name__ == "__main__":
+    from rk4 import euler, rk4
+
+    print("=" * 70)
+    print("Vérification de l'ordre de convergence (oscillateur, t_max = 10)")
+    print("=" * 70)
+
+    tolerance = 1e-6
+    resultat = verifier_ordre(euler, OSCILLATEUR, echelle_geometrique(0.01, 6),
+                              ordre_attendu=1)
+    afficher_rapport("Euler", resultat, tolerance)
+
+    resultat = verifier_ordre(rk4, OSCILLATEUR, echelle_geometrique(0.2, 6),
+                              ordre_attendu=4)
+    afficher_rapport("RK4", resultat, tolerance)
+    print("=" * 70)
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Diagnostics calculés au fil de l'intégration, sans stocker la trajectoire.
+
+Dans q07.py et q08.py, toute la trajectoire est conservée pour n'en tirer
+que l'écart à la solution analytique. Ici des accumulateurs reçoivent les
+états par blocs pendant l'intégration (integrer_par_blocs) et ne gardent
+que des sommes et des extrema, plus une courbe sous-échantillonnée de
+taille bornée pour les graphes :
+    - ErreurReference : erreur max et RMS par rapport à une fonction de
+      référence (solution analytique) ;
+    - Derive : écart d'une quantité conservée (énergie, moment...) à sa
+      valeur initiale, relatif ou absolu.
+
+Les accumulateurs sont vectorisés sur chaque bloc : leur coût par pas est
+négligeable devant celui d'un pas de RK4, et la boucle compilée de
+integration.py reste utilisable (deriv @njit). La cadence (un état observé
+sur cadence pas) est celle des points conservés par integrer_par_blocs.
+
+Tout objet possédant les méthodes observer(t, Y) et resume() peut servir de
+diagnostic.
+"""
+import numpy as np
+from integration import integrer_par_blocs
+
+
+class CourbeReduite:
+    """
+    Courbe (t, valeur) de taille bornée, alimentée par blocs.
+
+    Un point sur pas est gardé ; quand plus de 2 n_max points sont
+    conservés, on n'en garde qu'un sur deux et pas double. La courbe couvre
+    donc toujours toute la durée avec entre n_max et 2 n_max points.
+    """
+
+    def __init__(self, n_max=500):
+        self.n_max = n_max
+        self.pas = 1
+        self._compteur = 0
+        self._t = np.empty(0)
+        self._valeurs = np.empty(0)
+
+    def ajouter(self, t, valeurs):
+        """Ajoute un bloc de points (t et valeurs de forme (m,))."""
+        premier = (-self._compteur) % self.pas
+        self._compteur += t.size
+        self._t = np.concatenate([self._t, t[premier::self.pas]])
+        self._valeurs = np.concatenate([self._valeurs, valeurs[premier::self.pas]])
+        while self._t.size > 2 * self.n_max:
+            self._t = self._t[::2].copy()
+            self._valeurs = self._valeurs[::2].copy()
+            # Les points gardés sont ceux d'indice multiple de pas : après
+            # [::2], ce sont les multiples de 2 pas
+            self.pas *= 2
+
+    def donnees(self):
+        """Tableaux (t, valeurs) de la courbe réduite."""
+        return self._t, self._valeurs
+
+
+class ErreurReference:
+    """
+    Erreur max et RMS d'une composante par rapport à une référence.
+
+    Paramètres
+    ----------
+    reference : callable
+        reference(t) -> valeurs exactes pour un tableau de temps.
+    composante : int
+        Indice de la composante de l'état comparée.
+    nom : str
+        Nom affiché dans le tableau récapitulatif.
+    n_courbe : int
+        Taille minimale de la courbe d'erreur réduite.
+    """
+
+    def __init__(self, reference, composante=0, nom="erreur", n_courbe=500):
+        self.reference = reference
+        self.composante = composante
+        self.nom = nom
+        self.courbe = CourbeReduite(n_courbe)
+        self.n = 0
+        self.maximum = 0.0
+        self.somme_carres = 0.0
+        self.finale = np.nan
+
+    def observer(self, t, Y):
+        """Met à jour les accumulateurs avec un bloc d'états (t (m,), Y (m, n))."""
+        erreur = Y[:, self.composante] - self.reference(t)
+        self.n += erreur.size
+        self.maximum = max(self.maximum, float(np.max(np.abs(erreur))))
+        self.somme_carres += float(erreur @ erreur)
+        self.finale = float(erreur[-1])
+        self.courbe.ajouter(t, erreur)
+
+    def resume(self):
+        """Dictionnaire nom, max, RMS, valeur finale et nombre de points."""
+        rms = np.sqrt(self.somme_carres / self.n) if self.n else np.nan
+        return {"nom": self.nom, "max": self.maximum, "rms": rms,
+                "finale": self.finale, "points": self.n}
+
+
+class Derive:
+    """
+    Écart d'une quantité conservée à sa valeur initiale.
+
+    Paramètres
+    ----------
+    quantite : callable
+        quantite(t, Y) -> tableau (m,) de la quantité pour un bloc d'états.
+    nom : str
+        Nom affiché dans le tableau récapitulatif.
+    relative : bool
+        Écart relatif (Q - Q0) / |Q0| (dérive d'énergie) ou absolu Q - Q0.
+    n_courbe : int
+        Taille minimale de la courbe réduite.
+    """
+
+    def __init__(self, quantite, nom="énergie", relative=True, n_courbe=500):
+        self.quantite = quantite
+        self.nom = nom
+        self.relative = relative
+        self.courbe = CourbeReduite(n_courbe)
+        self.initiale = None
+        self.n = 0
+        self.maximum = 0.0
+        self.somme_carres = 0.0
+        self.finale = np.nan
+
+    def observer(self, t, Y):
+        """Met à jour les accumulateurs avec un bloc d'états (t (m,), Y (m, n))."""
+        valeurs = self.quantite(t, Y)
+        if self.initiale is None:
+            self.initiale = float(valeurs[0])
+        ecart = valeurs - self.initiale
+        if self.relative:
+            ecart /= abs(self.initiale)
+        self.n += ecart.size
+        self.maximum = max(self.maximum, float(np.max(np.abs(ecart))))
+        self.somme_carres += float(ecart @ ecart)
+        self.finale = float(ecart[-1])
+        self.courbe.ajouter(t, ecart)
+
+    def resume(self):
+        """Dictionnaire nom, max, RMS, valeur finale et nombre de points."""
+        rms = np.sqrt(self.somme_carres / self.n) if self.n else np.nan
+        return {"nom": self.nom, "max": self.maximum, "rms": rms,
+                "finale": self.finale, "points": self.n}
+
+
+def integrer_avec_diagnostics(deriv, y0, t0, dt, n_pas, params, diagnostics,
+                              methode="rk4", cadence=1, taille_bloc=100_000):
+    """
+    Intègre à pas constant en alimentant les diagnostics, sans trajectoire.
+
+    Paramètres
+    ----------
+    deriv : callable
+        Fonction deriv(t, y, params) -> dy (compilée par numba si @njit).
+    y0 : ndarray
+        État initial au temps t0.
+    t0, dt : float
+        Temps initial et pas de temps.
+    n_pas : int
+        Nombre total de pas (arrondi au multiple de cadence inférieur).
+    params : float, ndarray ou tuple
+        Paramètres physiques transmis à deriv.
+    diagnostics : sequence
+        Objets munis d'une méthode observer(t, Y).
+    methode : str
+        "euler" ou "rk4".
+    cadence : int
+        Un état observé sur cadence pas (l'état initial est toujours observé).
+    taille_bloc : int
+        Nombre maximal d'états par bloc (fixe la mémoire utilisée).
+
+    Retour
+    ------
+    t : float
+        Temps du dernier état observé.
+    y : ndarray
+        Dernier état observé.
+    """
+    for t, Y in integrer_par_blocs(deriv, y0, t0, dt, n_pas, params, methode,
+                                   pas_sortie=cadence, taille_bloc=taille_bloc):
+        for diagnostic in diagnostics:
+            diagnostic.observer(t, Y)
+    return t[-1], Y[-1].copy()
+
+
+def tableau_resume(diagnostics):
+    """Tableau texte des résumés (une ligne par diagnostic)."""
+    lignes = [f"   {'diagnostic':<24}{'max':>10}{'RMS':>10}{'final':>11}{'points':>10}"]
+    for diagnostic in diagnostics:
+        r = diagnostic.resume()
+        lignes.append(f"   {r['nom']:<24}{r['max']:>10.2e}{r['rms']:>10.2e}"
+                      f"{r['finale']:>11.2e}{r['points']:>10}")
+    return "\n".join(lignes)
+
+
+# ========== Vérification et coût ==========
+if __name__ == "__main__":
+    import time
+    from integration import integrer
+
+    def deriv(t, y, params, out=None):
+        """Oscillateur harmonique."""
+        omega = params
+        dy = np.zeros(2) if out is None else out
+        dy[0] = y[1]
+        dy[1] = -omega**2 * y[0]
+        return dy
+
+    def energie(t, Y):
+        return 0.5 * (Y[:, 1]**2 + Y[:, 0]**2)
+
+    print("=" * 70)
+    print("Diagnostics au fil de l'intégration (oscillateur, RK4)")
+    print("=" * 70)
+
+    dt, n_pas = 0.01, 200_000
+    diagnostics = [ErreurReference(np.cos, 0, "erreur sur x"),
+                   Derive(energie, "dérive d'énergie")]
+    start = time.perf_counter()
+    integrer_avec_diagnostics(deriv, [1.0, 0.0], 0.0, dt, n_pas, 1.0, diagnostics,
+                              taille_bloc=10_000)
+    duree_diag = time.perf_counter() - start
+    print(tableau_resume(diagnostics))
+
+    # Même calcul en stockant la trajectoire
+    start = time.perf_counter()
+    temps, Y = integrer(deriv, [1.0, 0.0], dt * np.arange(n_pas + 1), 1.0)
+    erreur = Y[:, 0] - np.cos(temps)
+    duree_stockee = time.perf_counter() - start
+    print(f"\n   Écart au calcul sur trajectoire stockée : max "
+          f"{abs(np.max(np.abs(erreur)) - diagnostics[0].maximum):.1e}, RMS "
+          f"{abs(np.sqrt(np.mean(erreur**2)) - diagnostics[0].resume()['rms']):.1e}")
+    t_courbe, _ = diagnostics[0].courbe.donnees()
+    print(f"   Courbe réduite : {t_courbe.size} points de t = {t_courbe[0]} à "
+          f"{t_courbe[-1]:.0f} (un pas sur {diagnostics[0].courbe.pas})")
+    print(f"   Durée : {duree_diag:.2f} s avec diagnostics, {duree_stockee:.2f} s "
+          f"avec trajectoire stockée ({Y.nbytes / 1e6:.1f} Mo)")
+    print("=" * 70)
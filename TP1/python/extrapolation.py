@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Extrapolation de Richardson et méthode de Gragg-Bulirsch-Stoer.
+
+Une méthode d'ordre p appliquée avec n sous-pas de taille h = dt / n donne
+une erreur de la forme c_1 h^p + c_2 h^(p+q) + ... On calcule la solution
+pour plusieurs valeurs de n puis on élimine les premiers termes d'erreur par
+le tableau de Neville : on obtient un résultat d'ordre plus élevé et, comme
+sous-produit, une estimation de l'erreur (écart entre les deux dernières
+colonnes du tableau).
+
+Méthodes de base :
+    - "euler"        : p = 1, q = 1, sous-pas n = 1, 2, 4, 8, ...
+    - "rk4"          : p = 4, q = 1, sous-pas n = 1, 2, 4, 8, ...
+    - "point_milieu" : point milieu modifié de Gragg, dont l'erreur ne
+                       contient que des puissances paires (p = 2, q = 2),
+                       sous-pas n = 2, 4, 6, 8, ... (Bulirsch-Stoer)
+
+combiner_richardson() fait la même chose au niveau des trajectoires : elle
+combine deux simulations complètes à dt et dt/2, comme celles de q07 et q08.
+"""
+import numpy as np
+from rk4 import euler, rk4
+
+
+def point_milieu_modifie(t, dt, y, deriv, params, n_sous_pas):
+    """
+    Méthode du point milieu modifié (Gragg) sur [t, t + dt].
+
+    Paramètres
+    ----------
+    n_sous_pas : int
+        Nombre de sous-pas (pair) ; coûte n_sous_pas + 1 appels à deriv.
+
+    Retour
+    ------
+    ndarray
+        Valeurs de y au temps t + dt.
+    """
+    h = dt / n_sous_pas
+    z_prec = y
+    z = y + h * deriv(t, y, params)
+    for m in range(1, n_sous_pas):
+        z_prec, z = z, z_prec + 2.0 * h * deriv(t + m * h, z, params)
+    # Lissage final de Gragg
+    return 0.5 * (z + z_prec + h * deriv(t + dt, z, params))
+
+
+def _sous_pas(pas, t, dt, y, deriv, params, n):
+    """Avance de dt en n sous-pas de la méthode pas."""
+    h = dt / n
+    for i in range(n):
+        y = pas(t + i * h, h, y, deriv, params)
+    return y
+
+
+# Méthode de base : (pas, ordre p, incrément q des exposants d'erreur)
+METHODES_EXTRAPOLATION = {
+    "euler": (euler, 1, 1),
+    "rk4": (rk4, 4, 1),
+    "point_milieu": (None, 2, 2),
+}
+
+
+def sequence_sous_pas(methode, n_niveaux):
+    """Nombres de sous-pas utilisés pour chaque ligne du tableau."""
+    if methode == "point_milieu":
+        return 2 * np.arange(1, n_niveaux + 1)
+    return 2 ** np.arange(n_niveaux)
+
+
+def pas_extrapole(t, dt, y, deriv, params, methode="point_milieu", n_niveaux=4):
+    """
+    Un pas de dt extrapolé à partir de n_niveaux subdivisions.
+
+    Paramètres
+    ----------
+    t, dt : float
+        Temps actuel et pas de temps.
+    y : ndarray
+        Valeurs au temps t.
+    deriv : callable
+        Fonction deriv(t, y, params) -> dy.
+    params : float, ndarray ou tuple
+        Paramètres physiques transmis à deriv.
+    methode : str
+        "euler", "rk4" ou "point_milieu".
+    n_niveaux : int
+        Nombre de lignes du tableau de Neville (≥ 2).
+
+    Retour
+    ------
+    y : ndarray
+        Valeurs extrapolées au temps t + dt.
+    erreur : float
+        Estimation de l'erreur locale : écart maximal entre les deux
+        dernières colonnes du tableau.
+    """
+    if methode not in METHODES_EXTRAPOLATION:
+        raise ValueError(f"Méthode inconnue : {methode} "
+                         f"(choix : {', '.join(METHODES_EXTRAPOLATION)})")
+    if n_niveaux < 2:
+        raise ValueError("n_niveaux doit être ≥ 2")
+    pas, ordre, increment = METHODES_EXTRAPOLATION[methode]
+    n = sequence_sous_pas(methode, n_niveaux)
+
+    # T[k] contient la ligne k du tableau de Neville
+    T = []
+    for k in range(n_niveaux):
+        if pas is None:
+            base = point_milieu_modifie(t, dt, y, deriv, params, n[k])
+        else:
+            base = _sous_pas(pas, t, dt, y, deriv, params, n[k])
+        ligne = [base]
+        for j in range(1, k + 1):
+            if pas is None:
+                # Développement en puissances de h² : extrapolation polynomiale
+                facteur = (n[k] / n[k - j]) ** increment - 1.0
+            else:
+                # Suite n_k = 2^k : on élimine le terme en h^(p + (j-1) q)
+                facteur = 2.0 ** (ordre + (j - 1) * increment) - 1.0
+            ligne.append(ligne[j - 1] + (ligne[j - 1] - T[k - 1][j - 1]) / facteur)
+        T.append(ligne)
+
+    resultat = T[-1][-1]
+    erreur = np.max(np.abs(resultat - T[-1][-2]))
+    return resultat, erreur
+
+
+def integrer_extrapole(deriv, y0, temps, params, methode="point_milieu", n_niveaux=4):
+    """
+    Intègre sur toute la grille de temps avec pas_extrapole().
+
+    Retour
+    ------
+    temps : ndarray
+        Grille des temps.
+    Y : ndarray
+        Tableau (temps.size, n) des états.
+    erreurs : ndarray
+        Estimation de l'erreur locale de chaque pas (taille temps.size - 1).
+    """
+    temps = np.asarray(temps, dtype=float)
+    Y = np.empty((temps.size, np.size(y0)))
+    erreurs = np.empty(temps.size - 1)
+    y = np.array(y0, dtype=float)
+    Y[0] = y
+    for i in range(temps.size - 1):
+        y, erreurs[i] = pas_extrapole(temps[i], temps[i + 1] - temps[i], y, deriv,
+                                      params, methode, n_niveaux)
+        Y[i + 1] = y
+    return temps, Y, erreurs
+
+
+def combiner_richardson(Y_grossier, Y_fin, ordre):
+    """
+    Combine deux trajectoires calculées avec dt et dt/2.
+
+    Les points de Y_grossier correspondent à un point sur deux de Y_fin.
+    L'erreur globale d'une méthode d'ordre p étant ≈ C dt^p, la combinaison
+    (2^p Y_fin - Y_grossier) / (2^p - 1) élimine le terme principal.
+
+    Paramètres
+    ----------
+    Y_grossier : ndarray
+        Trajectoire au pas dt (m points).
+    Y_fin : ndarray
+        Trajectoire au pas dt/2 (2m - 1 points).
+    ordre : int
+        Ordre p de la méthode (1 pour Euler, 4 pour RK4).
+
+    Retour
+    ------
+    Y : ndarray
+        Trajectoire extrapolée aux temps de Y_grossier.
+    erreur : ndarray
+        Estimation de l'erreur de Y_fin en ces points.
+    """
+    Y_fin = np.asarray(Y_fin)[::2]
+    Y_grossier = np.asarray(Y_grossier)
+    difference = (Y_fin - Y_grossier) / (2.0 ** ordre - 1.0)
+    return Y_fin + difference, difference
+
+
+# ========== Vérification et coût ==========
+if __name__ == "__main__":
+    def deriv(t, y, params, out=None):
+        """Oscillateur harmonique avec compteur d'appels."""
+        deriv.appels += 1
+        omega = params
+        dy = np.zeros(2) if out is None else out
+        dy[0] = y[1]
+        dy[1] = -omega**2 * y[0]
+        return dy
+
+    omega, t_max = 1.0, 100.0
+    y0 = np.array([1.0, 0.0])
+
+    print("=" * 70)
+    print("Extrapolation sur l'oscillateur harmonique (t_max = 100)")
+    print("=" * 70)
+    print(f"   {'méthode':<32}{'erreur max':>12}{'estimée':>12}{'appels':>10}")
+
+    # Référence : RK4 classique
+    for dt in [0.01, 0.05]:
+        deriv.appels = 0
+        temps = np.arange(0.0, t_max + dt, dt)
+        y = y0.copy()
+        X = [y[0]]
+        for i in range(temps.size - 1):
+            y = rk4(temps[i], dt, y, deriv, omega)
+            X.append(y[0])
+        erreur = np.max(np.abs(np.array(X) - np.cos(temps)))
+        print(f"   {f'RK4 dt = {dt}':<32}{erreur:>12.1e}{'-':>12}{deriv.appels:>10}")
+
+    for methode, n_niveaux, dt in [("euler", 4, 0.05), ("euler", 6, 0.2),
+                                   ("point_milieu", 4, 0.5), ("point_milieu", 6, 1.0)]:
+        deriv.appels = 0
+        temps = np.arange(0.0, t_max + dt, dt)
+        temps, Y, erreurs = integrer_extrapole(deriv, y0, temps, omega, methode, n_niveaux)
+        erreur = np.max(np.abs(Y[:, 0] - np.cos(temps)))
+        nom = f"{methode}, {n_niveaux} niveaux, dt = {dt}"
+        print(f"   {nom:<32}{erreur:>12.1e}{np.sum(erreurs):>12.1e}{deriv.appels:>10}")
+
+    # Combinaison des deux trajectoires d'Euler de q07 (dt = 0.01 et 0.005)
+    deriv.appels = 0
+    trajectoires = []
+    for dt in [0.01, 0.005]:
+        temps = np.linspace(0.0, t_max, int(round(t_max / dt)) + 1)
+        y = y0.copy()
+        Y = [y]
+        for i in range(temps.size - 1):
+            y = euler(temps[i], dt, y, deriv, omega)
+            Y.append(y)
+        trajectoires.append(np.array(Y))
+    temps = np.linspace(0.0, t_max, trajectoires[0].shape[0])
+    Y, estimation = combiner_richardson(trajectoires[0], trajectoires[1], 1)
+    erreur_fin = np.max(np.abs(trajectoires[1][::2, 0] - np.cos(temps)))
+    erreur = np.max(np.abs(Y[:, 0] - np.cos(temps)))
+    print(f"\n   Euler dt = 0.005 seul       : erreur max {erreur_fin:.1e} "
+          f"(estimée {np.max(np.abs(estimation[:, 0])):.1e})")
+    print(f"   Richardson (0.01 et 0.005)  : erreur max {erreur:.1e}, "
+          f"même coût ({deriv.appels} appels)")
+    print("=" * 70)
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Méthodes implicites pour les systèmes raides.
+
+Dans q02.py le pas d'Euler explicite est limité par la constante la plus
+rapide k (stabilité : dt < 2 / k), même quand seule la queue lente en k2
+nous intéresse. Avec k / k2 = 10⁶, la boucle explicite devient inutilisable.
+Les méthodes de ce module restent stables avec de grands pas :
+    - "euler_implicite" : y_{n+1} = y_n + dt f(t_{n+1}, y_{n+1}) (ordre 1) ;
+    - "bdf2"            : différentiation rétrograde d'ordre 2, à pas
+                          variable (démarrage par Euler implicite) ;
+    - "rosenbrock"      : ROS2 (Verwer et al.), linéairement implicite
+                          d'ordre 2, deux résolutions linéaires par pas et
+                          aucune itération de Newton.
+
+Les deux premières résolvent y - c - γ f(t, y) = 0 par Newton simplifié
+avec la matrice I - γ J. La jacobienne J vient d'une fonction fournie
+jacobien(t, y, params) ou de différences finies ; elle n'est recalculée que
+si elle a vieilli ou si Newton converge mal, et les factorisations LU de
+I - γ J sont gardées en cache pour chaque γ : à pas constant, une seule
+factorisation sert à de nombreux pas.
+"""
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+
+
+METHODES_IMPLICITES = ("euler_implicite", "bdf2", "rosenbrock")
+
+# Coefficient γ de ROS2 (L-stable)
+GAMMA_ROS2 = 1.0 + 1.0 / np.sqrt(2.0)
+
+
+def jacobien_numerique(deriv, t, y, params, f0=None):
+    """
+    Jacobienne df/dy par différences finies avant.
+
+    Retour
+    ------
+    ndarray
+        Matrice (n, n) ; coûte n appels à deriv (n + 1 si f0 n'est pas
+        fourni).
+    """
+    y = np.asarray(y, dtype=float)
+    if f0 is None:
+        f0 = deriv(t, y, params)
+    J = np.empty((y.size, y.size))
+    for j in range(y.size):
+        h = np.sqrt(np.finfo(float).eps) * max(1.0, abs(y[j]))
+        y_decale = y.copy()
+        y_decale[j] += h
+        J[:, j] = (deriv(t, y_decale, params) - f0) / h
+    return J
+
+
+def integrer_implicite(deriv, y0, temps, params, methode="bdf2", jacobien=None,
+                       jacobien_constant=False, tol=1e-10, max_iter=8, age_max=20):
+    """
+    Intègre un système raide sur une grille de temps.
+
+    Paramètres
+    ----------
+    deriv : callable
+        Fonction deriv(t, y, params) -> dy.
+    y0 : ndarray
+        État initial au temps temps[0].
+    temps : ndarray
+        Grille des temps (croissante, pas éventuellement variable).
+    params : float, ndarray ou tuple
+        Paramètres physiques transmis à deriv.
+    methode : str
+        "euler_implicite", "bdf2" ou "rosenbrock".
+    jacobien : callable ou None
+        jacobien(t, y, params) -> matrice (n, n) ; différences finies si None.
+    jacobien_constant : bool
+        La jacobienne ne dépend ni de t ni de y (système linéaire) : elle
+        n'est calculée qu'une fois.
+    tol : float
+        Tolérance relative sur la correction de Newton.
+    max_iter : int
+        Nombre maximal d'itérations de Newton par pas.
+    age_max : int
+        Nombre de pas après lequel la jacobienne est recalculée.
+
+    Retour
+    ------
+    temps : ndarray
+        Grille des temps.
+    Y : ndarray
+        Tableau (temps.size, n) des états.
+    stats : dict
+        Nombres d'appels à deriv ("evaluations"), de jacobiennes, de
+        factorisations LU et d'itérations de Newton.
+    """
+    if methode not in METHODES_IMPLICITES:
+        raise ValueError(f"Méthode inconnue : {methode} "
+                         f"(choix : {', '.join(METHODES_IMPLICITES)})")
+
+    temps = np.asarray(temps, dtype=float)
+    y = np.array(y0, dtype=float)
+    n = y.size
+    Y = np.empty((temps.size, n))
+    Y[0] = y
+    stats = {"evaluations": 0, "jacobiens": 0, "factorisations": 0, "newton": 0}
+    # J courante, nombre de pas depuis son calcul et LU de I - γ J par γ
+    etat = {"J": None, "age": 0, "lu": {}}
+    identite = np.eye(n)
+
+    def f(t, y):
+        stats["evaluations"] += 1
+        return deriv(t, y, params)
+
+    def actualiser_jacobien(t, y):
+        if jacobien is not None:
+            etat["J"] = np.asarray(jacobien(t, y, params), dtype=float)
+        else:
+            etat["J"] = jacobien_numerique(deriv, t, y, params)
+            stats["evaluations"] += n + 1
+        stats["jacobiens"] += 1
+        etat["age"] = 0
+        etat["lu"] = {}
+
+    def facteur(gamma):
+        # Clé arrondie : les pas d'une grille uniforme ne diffèrent que par
+        # les erreurs d'arrondi, et Newton simplifié tolère ce léger écart
+        cle = float(f"{gamma:.10g}")
+        if cle not in etat["lu"]:
+            if len(etat["lu"]) >= 8:
+                etat["lu"] = {}
+            etat["lu"][cle] = lu_factor(identite - cle * etat["J"])
+            stats["factorisations"] += 1
+        return etat["lu"][cle]
+
+    def vieillir(t, y):
+        """Recalcule J si elle est trop ancienne (jamais si constante)."""
+        if etat["J"] is None or (not jacobien_constant and etat["age"] >= age_max):
+            actualiser_jacobien(t, y)
+        etat["age"] += 1
+
+    def newton(t, c, gamma, y_depart):
+        """Résout y - c - γ f(t, y) = 0 par Newton simplifié."""
+        for essai in range(2):
+            lu = facteur(gamma)
+            y = y_depart.copy()
+            for iteration in range(max_iter):
+                residu = y - c - gamma * f(t, y)
+                correction = lu_solve(lu, -residu)
+                y += correction
+                stats["newton"] += 1
+                if np.max(np.abs(correction)) <= tol * (1.0 + np.max(np.abs(y))):
+                    # Convergence lente : J sera recalculée au pas suivant
+                    if iteration >= 5 and not jacobien_constant:
+                        etat["age"] = age_max
+                    return y
+            if etat["age"] <= 1 or jacobien_constant:
+                break
+            actualiser_jacobien(t, y_depart)
+        raise RuntimeError(f"Newton n'a pas convergé à t = {t:g} : réduire le pas de temps")
+
+    y_prec, dt_prec = None, None
+    for i in range(temps.size - 1):
+        t = temps[i]
+        dt = temps[i + 1] - t
+        vieillir(t, y)
+
+        if methode == "rosenbrock":
+            lu = facteur(GAMMA_ROS2 * dt)
+            k1 = lu_solve(lu, f(t, y))
+            k2 = lu_solve(lu, f(t + dt, y + dt * k1) - 2.0 * k1)
+            y_nouveau = y + dt * (1.5 * k1 + 0.5 * k2)
+        elif methode == "euler_implicite" or y_prec is None:
+            y_nouveau = newton(t + dt, y, dt, y)
+        else:
+            # BDF2 à pas variable, ω = dt / dt_prec
+            omega = dt / dt_prec
+            a = (1.0 + omega) ** 2 / (1.0 + 2.0 * omega)
+            b = omega ** 2 / (1.0 + 2.0 * omega)
+            gamma = dt * (1.0 + omega) / (1.0 + 2.0 * omega)
+            prediction = y + omega * (y - y_prec)
+            y_nouveau = newton(t + dt, a * y - b * y_prec, gamma, prediction)
+
+        y_prec, dt_prec = y, dt
+        y = y_nouveau
+        Y[i + 1] = y
+    return temps, Y, stats
+
+
+def grille_par_paliers(dt0, t_max, pas_par_palier=10, facteur=2.0):
+    """
+    Grille [0, t_max] à pas constant par paliers : pas_par_palier pas de
+    dt0, puis autant de pas facteur fois plus grands, etc. (facteur < 1 + √2
+    pour la stabilité de BDF2 à pas variable).
+    """
+    temps, dt = [0.0], dt0
+    while temps[-1] < t_max:
+        temps.extend(temps[-1] + dt * np.arange(1, pas_par_palier + 1))
+        dt *= facteur
+    temps = np.array(temps)
+    return np.append(temps[temps < t_max], t_max)
+
+
+# ========== Vérification ==========
+if __name__ == "__main__":
+    import time
+    from recurrence import euler_lineaire
+
+    print("=" * 70)
+    print("Méthodes implicites sur la chaîne X → Y → Z raide (k / k2 = 10⁶)")
+    print("=" * 70)
+
+    k, k2, t_max = 1e6, 1.0, 10.0
+    A = np.array([[-k, 0.0], [k, -k2]])
+
+    def deriv(t, y, params, out=None):
+        """Chaîne X → Y : dx/dt = -k x, dy/dt = k x - k2 y."""
+        k, k2 = params
+        dy = np.empty(2) if out is None else out
+        dy[0] = -k * y[0]
+        dy[1] = k * y[0] - k2 * y[1]
+        return dy
+
+    def y_exact(t):
+        return k * (np.exp(-k * t) - np.exp(-k2 * t)) / (k2 - k)
+
+    # Euler explicite : instable dès que dt > 2 / k
+    for dt in [0.01, 1e-6]:
+        start = time.perf_counter()
+        temps, X = euler_lineaire(A, [1.0, 0.0], dt, t_max)
+        duree = time.perf_counter() - start
+        erreur = np.max(np.abs(X[temps > 1e-3, 1] - y_exact(temps[temps > 1e-3])))
+        print(f"   Euler explicite dt = {dt:<6g}: {temps.size - 1:>9} pas, "
+              f"erreur {erreur:.1e}, {duree:.2f} s")
+
+    # Méthodes implicites : pas serrés pendant le transitoire en 1/k, puis
+    # doublés tous les 10 pas ; la même factorisation LU sert à chaque palier
+    temps = grille_par_paliers(1e-8, t_max)
+    for methode in METHODES_IMPLICITES:
+        start = time.perf_counter()
+        temps, Y, stats = integrer_implicite(deriv, [1.0, 0.0], temps, (k, k2), methode,
+                                             jacobien=lambda t, y, p: A,
+                                             jacobien_constant=True)
+        duree = time.perf_counter() - start
+        erreur = np.max(np.abs(Y[temps > 1e-3, 1] - y_exact(temps[temps > 1e-3])))
+        print(f"   {methode:<16}: {temps.size - 1:>9} pas, erreur {erreur:.1e}, "
+              f"{stats['factorisations']} LU, {duree:.3f} s")
+
+    # Problème non linéaire de Robertson (constantes 0.04, 10⁴, 3·10⁷)
+    def robertson(t, y, params):
+        return np.array([-0.04 * y[0] + 1e4 * y[1] * y[2],
+                         0.04 * y[0] - 1e4 * y[1] * y[2] - 3e7 * y[1] ** 2,
+                         3e7 * y[1] ** 2])
+
+    print("\n📊 Robertson (non linéaire, jacobienne par différences finies)")
+    temps = grille_par_paliers(1e-5, 1e3)
+    from scipy.integrate import solve_ivp
+    reference = solve_ivp(robertson, (0.0, 1e3), [1.0, 0.0, 0.0], method="Radau",
+                          t_eval=temps, rtol=1e-10, atol=1e-14, args=(None,)).y.T
+    for methode in METHODES_IMPLICITES:
+        temps, Y, stats = integrer_implicite(robertson, [1.0, 0.0, 0.0], temps, None, methode)
+        erreur = np.max(np.abs(Y - reference) / (np.abs(reference) + 1e-8))
+        print(f"   {methode:<16}: erreur relative {erreur:.1e}, "
+              f"{stats['jacobiens']} jacobiennes, {stats['factorisations']} LU, "
+              f"{stats['evaluations']} appels")
+    print("=" * 70)
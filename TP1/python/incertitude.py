@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+"""
+Propagation d'incertitudes par Monte-Carlo pour X → Y → Z.
+
+q01.py et q02.py traitent un seul jeu (k, k2, x0). Quand les taux sont mal
+connus, on tire ces paramètres selon des lois données et on évalue le modèle
+pour chaque tirage, afin d'obtenir des bandes de confiance sur x(t) et y(t).
+
+Le modèle est évalué en forme close, vectorisée sur tout un lot de tirages
+et tous les instants à la fois (aucune boucle sur le temps) :
+    - "analytique" : x = x0 e^{-kt}, y = x0 k (e^{-kt} - e^{-k2 t}) / (k2 - k) ;
+    - "euler"      : suite d'Euler de pas dt, x_n = x0 a^n et
+                     y_n = x0 k dt (a^n - b^n) / (a - b), a = 1 - k dt,
+                     b = 1 - k2 dt (mêmes valeurs que la récurrence de q02).
+
+Les tirages sont traités par lots de taille_lot, puis oubliés : on ne garde
+par instant et par espèce que
+    - moyenne et variance (accumulateurs de stochastique.py, formule de
+      Chan) ;
+    - un histogramme à n_classes classes dont on tire les quantiles, à
+      une largeur de classe près. Les bornes sont fixées par un échantillon
+      pilote de n_pilote tirages, pris sur un flux aléatoire séparé : elles
+      ne dépendent donc pas de taille_lot. Les valeurs hors des bornes sont
+      comptées dans deux classes de débordement, [min, bas[ et [haut, max] ;
+      un quantile qui y tombe est signalé par une résolution égale à la
+      largeur de cette classe.
+La mémoire ne dépend donc pas du nombre de tirages.
+"""
+import numpy as np
+from stochastique import nouvelles_statistiques, fusionner_statistiques
+
+
+ESPECES = ("x", "y")
+
+
+def echantillonner(lois, n, rng):
+    """
+    Tire n jeux de paramètres.
+
+    Paramètres
+    ----------
+    lois : dict
+        Pour "k", "k2" et "x0" : une constante, ou ("normale", moyenne,
+        écart type), ("lognormale", médiane, écart type du logarithme),
+        ("uniforme", bas, haut).
+    n : int
+        Nombre de tirages.
+    rng : np.random.Generator
+        Générateur aléatoire.
+
+    Retour
+    ------
+    dict
+        Tableaux (n,) pour "k", "k2" et "x0".
+    """
+    echantillon = {}
+    for nom in ("k", "k2", "x0"):
+        loi = lois[nom]
+        if np.isscalar(loi):
+            echantillon[nom] = np.full(n, float(loi))
+        elif loi[0] == "normale":
+            echantillon[nom] = rng.normal(loi[1], loi[2], n)
+        elif loi[0] == "lognormale":
+            echantillon[nom] = loi[1] * np.exp(rng.normal(0.0, loi[2], n))
+        elif loi[0] == "uniforme":
+            echantillon[nom] = rng.uniform(loi[1], loi[2], n)
+        else:
+            raise ValueError(f"Loi inconnue pour {nom} : {loi[0]} "
+                             f"(choix : normale, lognormale, uniforme)")
+    return echantillon
+
+
+def modele_analytique(echantillon, temps):
+    """
+    Solution exacte de q02 pour chaque tirage.
+
+    Retour
+    ------
+    ndarray
+        Tableau (n, temps.size, 2) des valeurs de x et y.
+    """
+    k = echantillon["k"][:, np.newaxis]
+    k2 = echantillon["k2"][:, np.newaxis]
+    x0 = echantillon["x0"][:, np.newaxis]
+    ex = np.exp(-k * temps)
+    ey = np.exp(-k2 * temps)
+    ecart = k2 - k
+    # Taux presque égaux : limite y = x0 k t e^{-kt}
+    proche = np.abs(ecart) < 1e-8 * np.abs(k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = np.where(proche, x0 * k * temps * ex, x0 * k * (ex - ey) / ecart)
+    return np.stack([x0 * ex, y], axis=-1)
+
+
+def modele_euler(echantillon, temps, dt):
+    """
+    Suite d'Euler de q02 (pas dt) aux instants demandés, pour chaque tirage.
+
+    Les instants doivent être des multiples de dt.
+
+    Retour
+    ------
+    ndarray
+        Tableau (n, temps.size, 2) des valeurs de x et y.
+    """
+    n_pas = np.rint(np.asarray(temps) / dt)
+    if not np.allclose(n_pas * dt, temps, rtol=1e-9, atol=1e-12):
+        raise ValueError("Les instants doivent être des multiples de dt")
+    k = echantillon["k"][:, np.newaxis]
+    k2 = echantillon["k2"][:, np.newaxis]
+    x0 = echantillon["x0"][:, np.newaxis]
+    a = 1.0 - k * dt
+    b = 1.0 - k2 * dt
+    puissance_a = a ** n_pas
+    ecart = a - b
+    proche = np.abs(ecart) < 1e-8 * np.abs(a)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = np.where(proche, x0 * k * dt * n_pas * a ** (n_pas - 1.0),
+                     x0 * k * dt * (puissance_a - b ** n_pas) / ecart)
+    return np.stack([x0 * puissance_a, y], axis=-1)
+
+
+def nouvel_histogramme(valeurs, n_classes, marge=0.1):
+    """
+    Histogramme vide dont les bornes couvrent l'échantillon pilote valeurs
+    (n, m, e), élargies de marge fois leur étendue de chaque côté.
+
+    Les comptes ont n_classes + 2 classes : la première et la dernière
+    reçoivent les valeurs sous bas et au-dessus de bas + n_classes largeur.
+    """
+    bas = valeurs.min(axis=0)
+    haut = valeurs.max(axis=0)
+    etendue = np.maximum(haut - bas, 1e-12 * (np.abs(haut) + 1.0))
+    bas = bas - marge * etendue
+    largeur = (1.0 + 2.0 * marge) * etendue / n_classes
+    return {"bas": bas, "largeur": largeur, "n_classes": n_classes,
+            "comptes": np.zeros(bas.shape + (n_classes + 2,), dtype=np.int64),
+            "min": np.full(bas.shape, np.inf), "max": np.full(bas.shape, -np.inf)}
+
+
+def ajouter_histogramme(histogramme, valeurs):
+    """Compte un lot valeurs (n, m, e) dans l'histogramme, sur place."""
+    n_classes = histogramme["n_classes"]
+    # Classe 0 : sous les bornes, n_classes + 1 : au-dessus
+    classe = np.floor((valeurs - histogramme["bas"]) / histogramme["largeur"])
+    np.clip(classe, -1, n_classes, out=classe)
+    classe = classe.astype(np.int64) + 1
+    # Indice à plat (instant, espèce, classe) puis un seul bincount
+    case = np.arange(histogramme["bas"].size).reshape(histogramme["bas"].shape)
+    classe += case * (n_classes + 2)
+    histogramme["comptes"] += np.bincount(
+        classe.ravel(), minlength=histogramme["comptes"].size
+    ).reshape(histogramme["comptes"].shape)
+    np.minimum(histogramme["min"], valeurs.min(axis=0), out=histogramme["min"])
+    np.maximum(histogramme["max"], valeurs.max(axis=0), out=histogramme["max"])
+
+
+def quantiles_histogramme(histogramme, niveaux):
+    """
+    Quantiles estimés par interpolation linéaire dans les classes.
+
+    Les classes de débordement vont du minimum observé à bas et de haut au
+    maximum observé.
+
+    Retour
+    ------
+    quantiles : ndarray
+        Tableau (len(niveaux),) + forme des cases (instants, espèces).
+    resolution : ndarray
+        Largeur de la classe contenant chaque quantile (borne de l'erreur
+        due à l'histogramme), de même forme.
+    """
+    comptes = histogramme["comptes"]
+    n_classes = histogramme["n_classes"]
+    bas = histogramme["bas"][..., np.newaxis]
+    largeur = histogramme["largeur"][..., np.newaxis]
+    # Bords des n_classes + 2 classes
+    interieurs = bas + np.arange(n_classes + 1) * largeur
+    bords = np.concatenate([np.minimum(histogramme["min"][..., np.newaxis], bas),
+                            interieurs,
+                            np.maximum(histogramme["max"][..., np.newaxis],
+                                       interieurs[..., -1:])], axis=-1)
+    cumul = np.cumsum(comptes, axis=-1)
+    total = cumul[..., -1:]
+    quantiles, resolution = [], []
+    for niveau in niveaux:
+        cible = niveau * total
+        classe = np.minimum((cumul < cible).sum(axis=-1, keepdims=True), n_classes + 1)
+        avant = np.take_along_axis(cumul, classe, axis=-1) \
+            - np.take_along_axis(comptes, classe, axis=-1)
+        dans = np.maximum(np.take_along_axis(comptes, classe, axis=-1), 1)
+        fraction = np.clip((cible - avant) / dans, 0.0, 1.0)[..., 0]
+        gauche = np.take_along_axis(bords, classe, axis=-1)[..., 0]
+        droite = np.take_along_axis(bords, classe + 1, axis=-1)[..., 0]
+        valeur = gauche + fraction * (droite - gauche)
+        quantiles.append(np.clip(valeur, histogramme["min"], histogramme["max"]))
+        resolution.append(droite - gauche)
+    return np.array(quantiles), np.array(resolution)
+
+
+def propager(lois, temps, n_echantillons, modele="analytique", dt=None,
+             taille_lot=20_000, graine=0, niveaux=(0.05, 0.5, 0.95), n_classes=2000,
+             n_pilote=10_000):
+    """
+    Statistiques de x(t) et y(t) quand k, k2 et x0 sont aléatoires.
+
+    Paramètres
+    ----------
+    lois : dict
+        Lois de "k", "k2" et "x0" (voir echantillonner()).
+    temps : ndarray
+        Instants de sortie.
+    n_echantillons : int
+        Nombre total de tirages.
+    modele : str
+        "analytique" ou "euler".
+    dt : float ou None
+        Pas de temps du modèle "euler".
+    taille_lot : int
+        Nombre de tirages évalués à la fois (fixe la mémoire utilisée).
+    graine : int
+        Graine du générateur.
+    niveaux : sequence
+        Niveaux des quantiles demandés.
+    n_classes : int
+        Nombre de classes des histogrammes.
+    n_pilote : int
+        Nombre de tirages de l'échantillon pilote qui fixe les bornes des
+        histogrammes (flux aléatoire séparé, indépendant de taille_lot).
+
+    Retour
+    ------
+    dict
+        "temps", "moyenne" et "ecart_type" (tableaux (temps.size, 2), x puis
+        y), "niveaux", "quantiles" et "resolution" (largeur de la classe
+        contenant chaque quantile, plus grande si le quantile tombe hors des
+        bornes ; tableaux (len(niveaux), temps.size, 2)), "hors_bornes"
+        (nombre de valeurs sous et au-dessus des bornes, (temps.size, 2, 2))
+        et "n" (nombre de tirages).
+    """
+    if modele == "analytique":
+        evaluer = modele_analytique
+    elif modele == "euler":
+        if dt is None:
+            raise ValueError("Le modèle euler demande le pas de temps dt")
+        def evaluer(echantillon, temps):
+            return modele_euler(echantillon, temps, dt)
+    else:
+        raise ValueError(f"Modèle inconnu : {modele} (choix : analytique, euler)")
+
+    temps = np.asarray(temps, dtype=float)
+    rng = np.random.default_rng(graine)
+    rng_pilote = np.random.default_rng(np.random.SeedSequence(graine).spawn(1)[0])
+    histogramme = nouvel_histogramme(
+        evaluer(echantillonner(lois, n_pilote, rng_pilote), temps), n_classes)
+    stats = nouvelles_statistiques(temps.size, len(ESPECES))
+    restant = n_echantillons
+    while restant > 0:
+        n = min(taille_lot, restant)
+        restant -= n
+        valeurs = evaluer(echantillonner(lois, n, rng), temps)
+        moyenne = valeurs.mean(axis=0)
+        stats = fusionner_statistiques(stats, {
+            "n": n, "moyenne": moyenne, "m2": ((valeurs - moyenne) ** 2).sum(axis=0)})
+        ajouter_histogramme(histogramme, valeurs)
+
+    quantiles, resolution = quantiles_histogramme(histogramme, niveaux)
+    return {"temps": temps, "moyenne": stats["moyenne"],
+            "ecart_type": np.sqrt(stats["m2"] / max(stats["n"] - 1, 1)),
+            "niveaux": np.asarray(niveaux), "quantiles": quantiles,
+            "resolution": resolution,
+            "hors_bornes": histogramme["comptes"][..., [0, -1]],
+            "n": stats["n"]}
+
+
+# ========== Vérification et performances ==========
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    print("=" * 70)
+    print("Propagation d'incertitudes Monte-Carlo (q02 : X → Y → Z)")
+    print("=" * 70)
+
+    # k connu à 20 % (lognormale), k2 à 10 %, x0 à ±5 %
+    lois = {"k": ("lognormale", 1.0, 0.2), "k2": ("normale", 0.1, 0.01),
+            "x0": ("uniforme", 0.95, 1.05)}
+    temps = np.linspace(0.0, 20.0, 41)
+    niveaux = (0.05, 0.5, 0.95)
+
+    # Quantiles des histogrammes contre quantiles exacts des mêmes tirages
+    # (un seul lot pour retrouver les tirages, gardés ici)
+    n = 200_000
+    resultat = propager(lois, temps, n, niveaux=niveaux, taille_lot=n)
+    valeurs = modele_analytique(echantillonner(lois, n, np.random.default_rng(0)), temps)
+    exacts = np.quantile(valeurs, niveaux, axis=0)
+    print(f"   {n} tirages : écart max des quantiles aux quantiles exacts "
+          f"{np.max(np.abs(resultat['quantiles'] - exacts)):.1e} "
+          f"(résolution max {np.max(resultat['resolution']):.1e})")
+    del valeurs
+
+    # k très dispersé (lognormale σ = 0.5), quantiles à 1 % et 99 % : les
+    # bornes viennent de l'échantillon pilote, quelle que soit la taille des
+    # lots (k seul est aléatoire, les tirages sont donc les mêmes par lots)
+    lois_larges = {"k": ("lognormale", 1.0, 0.5), "k2": 0.1, "x0": 1.0}
+    exacts = np.quantile(modele_analytique(echantillonner(
+        lois_larges, n, np.random.default_rng(0)), temps), (0.01, 0.99), axis=0)
+    for taille_lot in (20, 100, 20_000):
+        r = propager(lois_larges, temps, n, taille_lot=taille_lot, niveaux=(0.01, 0.99))
+        print(f"   σ(ln k) = 0.5, lots de {taille_lot:>6} : quantiles 1 % / 99 % à "
+              f"{np.max(np.abs(r['quantiles'] - exacts)):.1e} des exacts "
+              f"(résolution max {np.max(r['resolution']):.1e}, "
+              f"{r['hors_bornes'].sum()} valeurs hors bornes)")
+
+    # Bande de confiance sur y
+    i = np.searchsorted(temps, 5.0)
+    bas, mediane, haut = resultat["quantiles"][:, i, 1]
+    print(f"   y(5) : médiane {mediane:.4f}, intervalle à 90 % [{bas:.4f}, {haut:.4f}]")
+
+    # Modèle d'Euler (dt = 0.05 comme q02) contre analytique
+    euler = propager(lois, temps, n, modele="euler", dt=0.05)
+    print(f"   Euler dt = 0.05 : écart des médianes de y à l'analytique "
+          f"{np.max(np.abs(euler['quantiles'][1, :, 1] - resultat['quantiles'][1, :, 1])):.1e}")
+
+    # Débit et mémoire indépendante du nombre de tirages
+    print("\n📊 Débit et pic mémoire")
+    for n in [100_000, 1_000_000]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        propager(lois, temps, n)
+        duree = time.perf_counter() - start
+        pic = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"   {n:>9} tirages : {duree:.2f} s ({n / duree:.2e} tirages/s), "
+              f"pic mémoire {pic / 1e6:.0f} Mo")
+    print("=" * 70)
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""
+Méthode des lignes : équations de la chaleur et des ondes en 1-D et 2-D.
+
+Les pas euler et rk4 acceptent un état de taille quelconque, mais n'ont
+servi qu'avec 2 à 4 composantes. Ici l'espace est discrétisé sur une grille
+régulière de pas dx et le laplacien remplacé par le schéma à 3 points (1-D)
+ou 5 points (2-D) ; il reste un système d'EDO de très grande taille
+(10⁶ inconnues et plus) :
+    - chaleur : du/dt = D Δu ;
+    - ondes   : du/dt = v, dv/dt = c² Δu (état [u, v] mis bout à bout).
+L'état ne contient que les nœuds intérieurs ; les bords sont fixés à zéro
+(conditions de Dirichlet), ce qui revient à des voisins nuls au bord.
+
+Le laplacien est appliqué sans former de matrice, sur place, dans le
+tableau out du protocole deriv(t, y, params, out) : avec rk4_inplace et
+euler_inplace, un pas ne fait aucune allocation et son coût est
+proportionnel au nombre d'inconnues. Deux moteurs pour le laplacien :
+    - "numpy" : cinq passes de sommes de tranches décalées, sur place ;
+    - "numba" : une seule passe compilée et parallèle (prange), si numba
+      est installé.
+matrice_laplacien() construit la même matrice creuse (scipy.sparse), pour
+la vérification ou les méthodes implicites.
+
+Le pas de temps explicite est limité par la plus grande valeur propre du
+laplacien discret, -4 D / dx² par dimension : voir pas_maximal().
+"""
+import numpy as np
+from scipy import sparse
+from rk4 import rk4_inplace, euler_inplace, espace_travail_rk4, espace_travail_euler
+from stabilite import dt_max
+
+try:
+    from numba import njit, prange
+    NUMBA_OK = True
+except Exception:
+    NUMBA_OK = False
+
+
+def laplacien(u, coefficient, out):
+    """
+    out = coefficient × Δu (schéma à 3 ou 5 points, bords nuls), sur place.
+
+    Paramètres
+    ----------
+    u : ndarray
+        Valeurs aux nœuds intérieurs, tableau 1-D ou 2-D.
+    coefficient : float
+        Facteur D / dx² (ou c² / dx²).
+    out : ndarray
+        Tableau de même forme que u, rempli sur place (distinct de u).
+    """
+    np.multiply(u, -2.0 * u.ndim, out=out)
+    for axe in range(u.ndim):
+        avant = [slice(None)] * u.ndim
+        apres = [slice(None)] * u.ndim
+        avant[axe] = slice(1, None)
+        apres[axe] = slice(None, -1)
+        avant, apres = tuple(avant), tuple(apres)
+        np.add(out[avant], u[apres], out=out[avant])
+        np.add(out[apres], u[avant], out=out[apres])
+    out *= coefficient
+
+
+if NUMBA_OK:
+    @njit(cache=True)
+    def _laplacien_1d_nb(u, coefficient, out):
+        """Même calcul que laplacien() en 1-D, compilé."""
+        n = u.shape[0]
+        for i in range(n):
+            s = -2.0 * u[i]
+            if i > 0:
+                s += u[i - 1]
+            if i < n - 1:
+                s += u[i + 1]
+            out[i] = coefficient * s
+
+
+    @njit(parallel=True, cache=True)
+    def _laplacien_2d_nb(u, coefficient, out):
+        """Même calcul que laplacien() en 2-D, compilé et parallèle."""
+        nx, ny = u.shape
+        for i in prange(nx):
+            for j in range(ny):
+                s = -4.0 * u[i, j]
+                if i > 0:
+                    s += u[i - 1, j]
+                if i < nx - 1:
+                    s += u[i + 1, j]
+                if j > 0:
+                    s += u[i, j - 1]
+                if j < ny - 1:
+                    s += u[i, j + 1]
+                out[i, j] = coefficient * s
+
+
+def _appliquer_laplacien(u, coefficient, out, moteur):
+    """Laplacien avec le moteur choisi."""
+    if moteur == "numba":
+        if u.ndim == 1:
+            _laplacien_1d_nb(u, coefficient, out)
+        else:
+            _laplacien_2d_nb(u, coefficient, out)
+    else:
+        laplacien(u, coefficient, out)
+
+
+def _choisir_moteur(moteur):
+    """Vérifie le moteur demandé ("auto" : numba s'il est installé)."""
+    if moteur == "auto":
+        moteur = "numba" if NUMBA_OK else "numpy"
+    if moteur not in ("numpy", "numba"):
+        raise ValueError(f"Moteur inconnu : {moteur} (choix : numpy, numba)")
+    if moteur == "numba" and not NUMBA_OK:
+        raise ValueError("Le moteur numba demande le paquet numba")
+    return moteur
+
+
+def parametres(forme, dx, coefficient, moteur="auto"):
+    """
+    params de deriv_chaleur et deriv_onde.
+
+    Paramètres
+    ----------
+    forme : tuple
+        Nombre de nœuds intérieurs par direction, (nx,) ou (nx, ny).
+    dx : float
+        Pas d'espace (identique dans les deux directions).
+    coefficient : float
+        Diffusivité D (chaleur) ou vitesse c (ondes).
+    moteur : str
+        "numpy", "numba" ou "auto".
+
+    Retour
+    ------
+    tuple
+        (forme, dx, coefficient, moteur).
+    """
+    forme = tuple(int(n) for n in np.atleast_1d(forme))
+    if len(forme) not in (1, 2):
+        raise ValueError("Seules les grilles 1-D et 2-D sont prises en charge")
+    return forme, float(dx), float(coefficient), _choisir_moteur(moteur)
+
+
+def deriv_chaleur(t, y, params, out=None):
+    """Équation de la chaleur du/dt = D Δu, y de taille prod(forme)."""
+    forme, dx, D, moteur = params
+    if out is None:
+        out = np.empty_like(y)
+    _appliquer_laplacien(y.reshape(forme), D / dx**2, out.reshape(forme), moteur)
+    return out
+
+
+def deriv_onde(t, y, params, out=None):
+    """Équation des ondes, y = [u, v] de taille 2 prod(forme)."""
+    forme, dx, c, moteur = params
+    if out is None:
+        out = np.empty_like(y)
+    n = y.size // 2
+    out[:n] = y[n:]
+    _appliquer_laplacien(y[:n].reshape(forme), c**2 / dx**2, out[n:].reshape(forme), moteur)
+    return out
+
+
+def matrice_laplacien(forme, dx):
+    """Matrice creuse (CSR) du laplacien discret, mêmes conventions que laplacien()."""
+    forme = tuple(np.atleast_1d(forme))
+    blocs = [sparse.diags([1.0, -2.0, 1.0], [-1, 0, 1], shape=(n, n)) for n in forme]
+    if len(blocs) == 1:
+        A = blocs[0]
+    else:
+        A = sparse.kronsum(blocs[1], blocs[0])
+    return sparse.csr_matrix(A) / dx**2
+
+
+def spectre_extreme(params, equation="chaleur"):
+    """
+    Valeurs propres extrêmes du système semi-discrétisé.
+
+    Le laplacien discret de Dirichlet a pour plus grande valeur propre (en
+    module) -Σ_k 4/dx² sin²(π n_k / (2 (n_k + 1))).
+
+    Retour
+    ------
+    ndarray
+        [λ] pour la chaleur (λ réel négatif), [±iω] pour les ondes.
+    """
+    if equation not in ("chaleur", "ondes"):
+        raise ValueError(f"Équation inconnue : {equation} (choix : chaleur, ondes)")
+    forme, dx, coefficient, _ = params
+    extreme = -sum(4.0 / dx**2 * np.sin(np.pi * n / (2.0 * (n + 1)))**2 for n in forme)
+    if equation == "chaleur":
+        return np.array([coefficient * extreme])
+    omega = coefficient * np.sqrt(-extreme)
+    return np.array([1j * omega, -1j * omega])
+
+
+def pas_maximal(pas, params, equation="chaleur", marge=0.9):
+    """Pas de temps stable de pas (euler, rk4...) pour l'équation discrétisée."""
+    return dt_max(pas, spectre_extreme(params, equation), marge)
+
+
+def integrer_lignes(deriv, y, dt, n_pas, params, methode="rk4", t0=0.0, travail=None):
+    """
+    Avance y de n_pas pas constants, sur place, sans allocation.
+
+    Paramètres
+    ----------
+    deriv : callable
+        deriv_chaleur, deriv_onde ou toute fonction du protocole out=.
+    y : ndarray
+        État (float64 contigu), modifié sur place.
+    dt : float
+        Pas de temps.
+    n_pas : int
+        Nombre de pas.
+    params : tuple
+        Paramètres renvoyés par parametres().
+    methode : str
+        "euler" ou "rk4".
+    t0 : float
+        Temps initial.
+    travail : tuple ou None
+        Espace de travail de rk4_inplace / euler_inplace (alloué si None).
+
+    Retour
+    ------
+    ndarray
+        Le tableau y lui-même, au temps t0 + n_pas dt.
+    """
+    if methode == "rk4":
+        pas = rk4_inplace
+        travail = espace_travail_rk4(y.size) if travail is None else travail
+    elif methode == "euler":
+        pas = euler_inplace
+        travail = espace_travail_euler(y.size) if travail is None else travail
+    else:
+        raise ValueError(f"Méthode inconnue : {methode} (choix : euler, rk4)")
+    for i in range(n_pas):
+        pas(t0 + i * dt, dt, y, deriv, params, travail)
+    return y
+
+
+# ========== Vérification et débit ==========
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+    from rk4 import rk4
+
+    print("=" * 70)
+    print("Méthode des lignes")
+    print("=" * 70)
+
+    # Chaleur 1-D : u0 = sin(πx) sur [0, 1] décroît en exp(λ t) avec la valeur
+    # propre discrète λ = -4 D / dx² sin²(π dx / 2)
+    n, D, t_max = 199, 1.0, 0.1
+    dx = 1.0 / (n + 1)
+    x = dx * np.arange(1, n + 1)
+    params = parametres((n,), dx, D, "numpy")
+    dt = pas_maximal(rk4, params)
+    n_pas = int(np.ceil(t_max / dt))
+    dt = t_max / n_pas
+    u = integrer_lignes(deriv_chaleur, np.sin(np.pi * x), dt, n_pas, params)
+    lam = -4.0 * D / dx**2 * np.sin(np.pi * dx / 2.0)**2
+    print(f"   Chaleur 1-D, {n} nœuds, {n_pas} pas RK4 (dt = {dt:.2e}) : "
+          f"écart au mode exact {np.max(np.abs(u - np.exp(lam * t_max) * np.sin(np.pi * x))):.1e}")
+
+    # Stencil contre matrice creuse, 2-D
+    forme = (300, 200)
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=forme[0] * forme[1])
+    A = matrice_laplacien(forme, 0.01)
+    for moteur in ["numpy", "numba"] if NUMBA_OK else ["numpy"]:
+        p = parametres(forme, 0.01, 1.0, moteur)
+        print(f"   Laplacien 2-D ({moteur}) contre matrice creuse : "
+              f"{np.max(np.abs(deriv_chaleur(0.0, y, p) - A @ y)) / np.max(np.abs(A @ y)):.1e}")
+
+    # Ondes 2-D : l'énergie discrète ½ (|v|² - u·Δu) est presque conservée
+    forme, c = (200, 200), 1.0
+    dx = 1.0 / (forme[0] + 1)
+    params = parametres(forme, dx, c)
+    X, Y = np.meshgrid(dx * np.arange(1, forme[0] + 1), dx * np.arange(1, forme[1] + 1),
+                       indexing="ij")
+    y = np.zeros(2 * X.size)
+    y[:X.size] = np.exp(-200.0 * ((X - 0.5)**2 + (Y - 0.5)**2)).ravel()
+    A = matrice_laplacien(forme, dx)
+
+    def energie(y):
+        u, v = y[:y.size // 2], y[y.size // 2:]
+        return 0.5 * (v @ v - c**2 * u @ (A @ u))
+
+    e0 = energie(y)
+    dt = pas_maximal(rk4, params, "ondes", marge=0.5)
+    integrer_lignes(deriv_onde, y, dt, 500, params)
+    print(f"   Ondes 2-D, {forme}, 500 pas RK4 (dt = {dt:.2e}) : "
+          f"dérive relative d'énergie {abs(energie(y) / e0 - 1):.1e}")
+
+    # Débit : inconnues × pas par seconde, et allocations pendant la boucle
+    print("\n📊 Chaleur 2-D, RK4 : débit selon la taille")
+    moteurs = ["numpy", "numba"] if NUMBA_OK else ["numpy"]
+    for moteur in moteurs:
+        for cote in [100, 316, 1000, 2000]:
+            params = parametres((cote, cote), 1.0 / (cote + 1), 1.0, moteur)
+            y = rng.uniform(size=cote * cote)
+            travail = espace_travail_rk4(y.size)
+            dt = pas_maximal(rk4, params)
+            integrer_lignes(deriv_chaleur, y, dt, 1, params, travail=travail)  # compilation
+            n_pas = max(5, int(2e7 / y.size))
+            tracemalloc.start()
+            start = time.perf_counter()
+            integrer_lignes(deriv_chaleur, y, dt, n_pas, params, travail=travail)
+            duree = time.perf_counter() - start
+            pic = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"   {moteur:<6} {cote:>5}² = {y.size:>9} inconnues : "
+                  f"{y.size * n_pas / duree:.2e} inconnues·pas/s, "
+                  f"pic d'allocation {pic / 1e3:.1f} ko")
+    print("=" * 70)
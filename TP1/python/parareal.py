@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+Intégration parallèle en temps (algorithme Parareal).
+
+L'intervalle [t0, t_fin] est découpé en n_tranches tranches. Deux
+propagateurs avancent l'état d'un bout à l'autre d'une tranche :
+    - G, grossier : euler ou rk4 avec un grand pas dt_grossier (peu coûteux,
+      exécuté en séquence) ;
+    - F, fin : rk4 avec le pas dt_fin de la simulation de référence (coûteux,
+      exécuté en parallèle, une tranche par processus).
+
+À l'itération k, les états de début de tranche sont corrigés par
+    U_{n+1} = G(U_n nouveau) + F(U_n ancien) - G(U_n ancien).
+Après k itérations, les k premières tranches sont exactes (identiques à la
+simulation fine séquentielle) ; en pratique on converge bien avant
+n_tranches itérations pour les systèmes réguliers. Pour un système
+chaotique (TP2/q03 avec Fe = 1.5), la convergence est lente et le gain
+disparaît.
+
+Si deriv est compilée par numba (@njit), chaque propagation passe par la
+boucle compilée de integration.integrer.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from integration import integrer, METHODES
+
+
+def _propager(deriv, y, t_debut, t_fin, params, dt, methode, pas_sortie=None):
+    """
+    Avance y de t_debut à t_fin avec des pas d'environ dt.
+
+    Retour
+    ------
+    ndarray
+        État final si pas_sortie est None, sinon les états conservés
+        (un pas sur pas_sortie, état initial compris).
+    """
+    n_pas = max(1, int(round((t_fin - t_debut) / dt)))
+    temps = np.linspace(t_debut, t_fin, n_pas + 1)
+    if pas_sortie is None:
+        return integrer(deriv, y, temps, params, methode, pas_sortie=n_pas)[1][-1]
+    return integrer(deriv, y, temps, params, methode, pas_sortie=pas_sortie)[1]
+
+
+def parareal(deriv, y0, t0, t_fin, params, n_tranches, dt_fin, dt_grossier,
+             methode_grossiere="rk4", n_iterations=None, tol=1e-10,
+             parallele=True, n_processus=None):
+    """
+    Intègre dy/dt = deriv(t, y, params) de t0 à t_fin par Parareal.
+
+    Paramètres
+    ----------
+    deriv : callable
+        Fonction deriv(t, y, params) -> dy, définie au niveau d'un module
+        (ou compilée par numba) pour pouvoir être envoyée aux processus.
+    y0 : ndarray
+        État initial au temps t0.
+    t0, t_fin : float
+        Bornes de l'intégration.
+    params : float, ndarray ou tuple
+        Paramètres physiques transmis à deriv.
+    n_tranches : int
+        Nombre de tranches de temps (une propagation fine par tranche).
+    dt_fin : float
+        Pas du propagateur fin (rk4).
+    dt_grossier : float
+        Pas du propagateur grossier.
+    methode_grossiere : str
+        "euler" ou "rk4".
+    n_iterations : int ou None
+        Nombre maximal d'itérations (par défaut n_tranches, valeur pour
+        laquelle le résultat est exactement celui de la simulation fine).
+    tol : float
+        Critère d'arrêt : plus grande correction relative des états de début
+        de tranche.
+    parallele : bool
+        Exécute les propagations fines dans un ProcessPoolExecutor.
+    n_processus : int ou None
+        Nombre de processus (par défaut, le nombre de cœurs).
+
+    Retour
+    ------
+    temps : ndarray
+        Bornes des tranches (taille n_tranches + 1).
+    U : ndarray
+        Tableau (n_tranches + 1, n) des états aux bornes des tranches.
+    infos : dict
+        "iterations" (nombre d'itérations effectuées), "corrections" (plus
+        grande correction relative à chaque itération) et "converge".
+    """
+    if methode_grossiere not in METHODES:
+        raise ValueError(f"Méthode inconnue : {methode_grossiere} "
+                         f"(choix : {', '.join(METHODES)})")
+    if n_iterations is None:
+        n_iterations = n_tranches
+
+    temps = np.linspace(t0, t_fin, n_tranches + 1)
+    debuts, fins = temps[:-1], temps[1:]
+
+    def grossier(n, y):
+        return _propager(deriv, y, debuts[n], fins[n], params, dt_grossier,
+                         methode_grossiere)
+
+    # Prédiction initiale : propagateur grossier seul
+    U = np.empty((n_tranches + 1, np.size(y0)))
+    U[0] = y0
+    G = np.empty_like(U)
+    for n in range(n_tranches):
+        G[n + 1] = grossier(n, U[n])
+        U[n + 1] = G[n + 1]
+
+    executeur = ProcessPoolExecutor(max_workers=n_processus) if parallele else None
+    corrections = []
+    converge = False
+    try:
+        for k in range(n_iterations):
+            # Propagations fines indépendantes ; les k premières tranches
+            # sont déjà exactes et ne sont pas recalculées
+            tranches = range(k, n_tranches)
+            arguments = ([deriv] * len(tranches), [U[n] for n in tranches],
+                         debuts[k:], fins[k:], [params] * len(tranches),
+                         [dt_fin] * len(tranches), ["rk4"] * len(tranches))
+            if executeur is not None:
+                F = list(executeur.map(_propager, *arguments))
+            else:
+                F = list(map(_propager, *arguments))
+
+            # Correction séquentielle avec le propagateur grossier
+            U_nouveau = U.copy()
+            U_nouveau[k + 1] = F[0]
+            for n in range(k + 1, n_tranches):
+                g = grossier(n, U_nouveau[n])
+                U_nouveau[n + 1] = g + F[n - k] - G[n + 1]
+                G[n + 1] = g
+
+            correction = np.max(np.abs(U_nouveau - U)) / (1.0 + np.max(np.abs(U_nouveau)))
+            corrections.append(correction)
+            U = U_nouveau
+            if correction < tol or k + 1 == n_tranches:
+                converge = True
+                break
+    finally:
+        if executeur is not None:
+            executeur.shutdown()
+
+    infos = {"iterations": len(corrections), "corrections": corrections,
+             "converge": converge}
+    return temps, U, infos
+
+
+def trajectoire_parareal(deriv, temps_tranches, U, params, dt_fin, pas_sortie=1,
+                         parallele=True, n_processus=None):
+    """
+    Reconstruit la trajectoire fine à partir des états de début de tranche.
+
+    Une dernière propagation fine, parallèle, part de chaque U[n].
+
+    Retour
+    ------
+    t : ndarray
+        Temps des points conservés.
+    Y : ndarray
+        Tableau (t.size, n) des états.
+    """
+    n_tranches = temps_tranches.size - 1
+    arguments = ([deriv] * n_tranches, list(U[:-1]), temps_tranches[:-1],
+                 temps_tranches[1:], [params] * n_tranches, [dt_fin] * n_tranches,
+                 ["rk4"] * n_tranches, [pas_sortie] * n_tranches)
+    if parallele:
+        with ProcessPoolExecutor(max_workers=n_processus) as executeur:
+            blocs = list(executeur.map(_propager, *arguments))
+    else:
+        blocs = list(map(_propager, *arguments))
+
+    # Mêmes grilles que _propager ; le premier point de chaque tranche est le
+    # dernier de la précédente (si pas_sortie divise le nombre de pas)
+    t, Y = [], []
+    for n, bloc in enumerate(blocs):
+        debut, fin = temps_tranches[n], temps_tranches[n + 1]
+        n_pas = max(1, int(round((fin - debut) / dt_fin)))
+        t_bloc = np.linspace(debut, fin, n_pas + 1)[::pas_sortie]
+        premier = 1 if n > 0 and np.isclose(t_bloc[0], t[-1][-1]) else 0
+        t.append(t_bloc[premier:])
+        Y.append(bloc[premier:])
+    return np.concatenate(t), np.concatenate(Y)
+
+
+# ========== Démonstration : oscillateur harmonique de q09 ==========
+def deriv_oscillateur(t, y, params, out=None):
+    """Dérivées pour l'oscillateur harmonique."""
+    omega = params
+    dy = np.zeros(2) if out is None else out
+    dy[0] = y[1]
+    dy[1] = -omega**2 * y[0]
+    return dy
+
+
+if __name__ == "__main__":
+    import os
+    import time
+
+    omega, t_max, dt_fin = 1.0, 200.0, 0.01
+    y0 = np.array([1.0, 0.0])
+    n_tranches = 32
+
+    print("=" * 70)
+    print(f"Parareal : oscillateur, t_max = {t_max}, dt fin = {dt_fin}, "
+          f"{n_tranches} tranches, {os.cpu_count()} cœur(s)")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    _, Y = integrer(deriv_oscillateur, y0, np.linspace(0.0, t_max, int(t_max / dt_fin) + 1),
+                    omega, pas_sortie=int(t_max / dt_fin))
+    duree_sequentielle = time.perf_counter() - start
+    print(f"   RK4 séquentiel      : {duree_sequentielle:.2f} s, "
+          f"x(t_max) = {Y[-1, 0]:+.10f}")
+
+    start = time.perf_counter()
+    temps, U, infos = parareal(deriv_oscillateur, y0, 0.0, t_max, omega, n_tranches,
+                               dt_fin, dt_grossier=0.5, tol=1e-10)
+    duree = time.perf_counter() - start
+    print(f"   Parareal            : {duree:.2f} s, x(t_max) = {U[-1, 0]:+.10f}, "
+          f"{infos['iterations']} itération(s)")
+    print(f"   Écart au séquentiel : {np.max(np.abs(U[-1] - Y[-1])):.1e}")
+    print("   Corrections         : " + ", ".join(f"{c:.1e}" for c in infos["corrections"]))
+
+    # Gain idéal avec un cœur par tranche (coût grossier négligé)
+    print(f"   Gain idéal avec {n_tranches} cœurs : "
+          f"{n_tranches / infos['iterations']:.1f}x")
+    print("=" * 70)
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Propagateur exact pour les systèmes linéaires à coefficients constants.
+
+Pour dy/dt = A y, la solution est y(t + dt) = exp(A dt) y(t). On calcule
+une fois la matrice exp(A dt) (mise en cache pour chaque couple (A, dt)) puis
+on avance par de simples produits matrice-vecteur : il n'y a plus d'erreur
+de discrétisation en temps, quel que soit le pas.
+
+Systèmes concernés : chaîne X → Y → Z (q02), oscillateur harmonique
+(q03, q05, q07) et pendule linéarisé amorti (TP2/q01).
+"""
+from functools import lru_cache
+import numpy as np
+from scipy.linalg import expm
+
+
+# ========== Matrices des systèmes du TP ==========
+def matrice_chaine(k, k2):
+    """Matrice de la chaîne X → Y → Z pour l'état [x, y]."""
+    return np.array([[-k, 0.0],
+                     [k, -k2]])
+
+
+def matrice_oscillateur(omega):
+    """Matrice de l'oscillateur harmonique pour l'état [x, v]."""
+    return np.array([[0.0, 1.0],
+                     [-omega**2, 0.0]])
+
+
+def matrice_pendule_lineaire(Omega, q):
+    """Matrice du pendule linéarisé amorti (TP2/q01) pour l'état [θ, dθ/dt]."""
+    return np.array([[0.0, 1.0],
+                     [-Omega**2, -q]])
+
+
+# ========== Exponentielle de matrice en cache ==========
+# Seules les petites matrices sont mises en cache : une entrée (n, n) coûte
+# 8 n² octets, soit 18 Mo pour n = 1500
+TAILLE_MAX_CACHE = 64
+
+
+@lru_cache(maxsize=256)
+def _expm_cache(forme, octets, dt):
+    """exp(A dt) pour la matrice A décrite par sa forme et ses octets."""
+    A = np.frombuffer(octets, dtype=float).reshape(forme)
+    P = expm(A * dt)
+    P.setflags(write=False)
+    return P
+
+
+def propagateur(A, dt):
+    """
+    Renvoie la matrice exp(A dt), calculée une seule fois par couple (A, dt).
+
+    Au-delà de TAILLE_MAX_CACHE lignes, exp(A dt) est recalculée à chaque
+    appel : l'appelant doit garder lui-même la matrice s'il la réutilise.
+
+    Paramètres
+    ----------
+    A : ndarray
+        Matrice carrée (n, n) du système dy/dt = A y.
+    dt : float
+        Durée de propagation.
+
+    Retour
+    ------
+    ndarray
+        Matrice (n, n) en lecture seule.
+    """
+    A = np.ascontiguousarray(A, dtype=float)
+    if A.shape[0] > TAILLE_MAX_CACHE:
+        P = expm(A * float(dt))
+        P.setflags(write=False)
+        return P
+    return _expm_cache(A.shape, A.tobytes(), float(dt))
+
+
+def propager_lineaire(A, y0, temps):
+    """
+    Solution exacte de dy/dt = A y sur une grille de temps.
+
+    Si la grille est uniforme, exp(A dt) est calculée une seule fois et
+    chaque point coûte un produit matrice-vecteur ; sinon on utilise
+    exp(A (t_i - t_0)) pour chaque point.
+
+    Paramètres
+    ----------
+    A : ndarray
+        Matrice (n, n) du système.
+    y0 : ndarray
+        État au temps temps[0].
+    temps : ndarray
+        Grille des temps de sortie.
+
+    Retour
+    ------
+    ndarray
+        Tableau (temps.size, n) des états.
+    """
+    temps = np.asarray(temps, dtype=float)
+    y0 = np.asarray(y0, dtype=float)
+    Y = np.empty((temps.size, y0.size))
+    Y[0] = y0
+    if temps.size == 1:
+        return Y
+
+    ecarts = np.diff(temps)
+    dt = (temps[-1] - temps[0]) / (temps.size - 1)
+    if np.allclose(ecarts, dt, rtol=1e-9, atol=0.0):
+        P = propagateur(A, dt)
+        for i in range(1, temps.size):
+            np.dot(P, Y[i - 1], out=Y[i])
+    else:
+        Y[1:] = evaluer_lineaire(A, y0, temps[1:] - temps[0])
+    return Y
+
+
+def evaluer_lineaire(A, y0, t):
+    """
+    Saute directement aux instants t : y(t) = exp(A t) y0.
+
+    Le coût ne dépend que du nombre d'instants demandés, pas de leur valeur,
+    ce qui rend les très longues durées aussi peu coûteuses que les courtes.
+
+    Paramètres
+    ----------
+    A : ndarray
+        Matrice (n, n) du système.
+    y0 : ndarray
+        État au temps 0.
+    t : float ou ndarray
+        Instant(s) de sortie.
+
+    Retour
+    ------
+    ndarray
+        État (n,) si t est un scalaire, tableau (t.size, n) sinon.
+    """
+    y0 = np.asarray(y0, dtype=float)
+    t = np.asarray(t, dtype=float)
+    if t.ndim == 0:
+        return propagateur(A, t) @ y0
+    return np.array([propagateur(A, ti) @ y0 for ti in t])
+
+
+# ========== Vérification ==========
+if __name__ == "__main__":
+    print("Test du propagateur exact :\n")
+
+    # Oscillateur harmonique : x(t) = cos(t) pour x0 = 1, v0 = 0
+    omega = 1.0
+    A = matrice_oscillateur(omega)
+    temps = np.arange(0.0, 100.0 + 0.1, 0.1)
+    Y = propager_lineaire(A, [1.0, 0.0], temps)
+    print(f"Oscillateur, dt = 0.1 : erreur max = {np.max(np.abs(Y[:, 0] - np.cos(temps))):.2e}")
+
+    # Saut direct à t = 10⁶ sans aucun pas intermédiaire
+    y = evaluer_lineaire(A, [1.0, 0.0], 1e6)
+    print(f"Oscillateur, t = 1e6 : x = {y[0]:+.8f} (exact {np.cos(1e6):+.8f})")
+
+    # Chaîne X → Y → Z : y(t) = k x0 (e^{-k t} - e^{-k2 t}) / (k2 - k)
+    k, k2 = 1.0, 0.1
+    temps = np.arange(0.0, 20.0 + 0.05, 0.05)
+    Y = propager_lineaire(matrice_chaine(k, k2), [1.0, 0.0], temps)
+    y_exact = k * (np.exp(-k * temps) - np.exp(-k2 * temps)) / (k2 - k)
+    print(f"Chaîne X → Y → Z : erreur max sur y = {np.max(np.abs(Y[:, 1] - y_exact)):.2e}")
+
+    print("\n✓ Propagateur exact vérifié")
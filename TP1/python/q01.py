@@ -5,6 +5,7 @@ Méthode d'Euler pour dx/dt = -kx
 """
 import numpy as np
 import matplotlib.pyplot as plt
+from recurrence import euler_lineaire
 
 # ========== Paramètres ==========
 k = 1.0         # Taux de désintégration
@@ -13,16 +14,9 @@ dt = 0.1        # Pas de temps
 t_max = 10.0    # Temps maximal
 
 # ========== Calcul numérique (Euler) ==========
-temps = np.arange(0.0, t_max + dt, dt)
-n_points = temps.size
-
-x_numerique = np.empty(n_points)
-x = x0
-
-for i in range(n_points):
-    x_numerique[i] = x
-    v = -k * x  # dx/dt = -kx
-    x = x + dt * v
+# Euler donne x_{n+1} = (1 - k dt) x_n : la suite est évaluée d'un coup
+temps, X = euler_lineaire(-k, x0, dt, t_max)
+x_numerique = X[:, 0]
 
 # ========== Solution analytique ==========
 x_analytique = x0 * np.exp(-k * temps)
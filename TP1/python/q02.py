@@ -5,6 +5,7 @@ Système d'EDO : dx/dt = -kx, dy/dt = kx - k2*y
 """
 import numpy as np
 import matplotlib.pyplot as plt
+from recurrence import euler_lineaire
 
 # ========== Paramètres ==========
 k = 1.0
@@ -15,24 +16,13 @@ dt = 0.05
 t_max = 20.0
 
 # ========== Calcul numérique (Euler) ==========
-temps = np.arange(0.0, t_max + dt, dt)
-n_points = temps.size
-
-x_values = np.empty(n_points)
-y_values = np.empty(n_points)
-
-x = x0
-y = y0
-
-for i in range(n_points):
-    x_values[i] = x
-    y_values[i] = y
-    
-    dx = -k * x
-    dy = k * x - k2 * y
-    
-    x = x + dt * dx
-    y = y + dt * dy
+# Système linéaire d[x, y]/dt = A [x, y] : Euler est la récurrence
+# [x, y]_{n+1} = (I + dt A) [x, y]_n, évaluée sans boucle Python
+A = np.array([[-k, 0.0],
+              [k, -k2]])
+temps, X = euler_lineaire(A, [x0, y0], dt, t_max)
+x_values = X[:, 0]
+y_values = X[:, 1]
 
 # ========== Graphe ==========
 plt.figure(figsize=(8, 5))
@@ -5,6 +5,8 @@ Question 3 : Oscillateur harmonique avec Euler
 """
 import numpy as np
 import matplotlib.pyplot as plt
+from rk4 import euler, rk4
+from stabilite import dt_max
 
 # ========== Paramètres ==========
 omega = 1.0
@@ -56,3 +58,16 @@ plt.show()
 print("\n📊 Observation :")
 print("Avec un pas de temps trop grand, l'amplitude diverge.")
 print("L'erreur s'accumule et l'énergie n'est pas conservée.")
+
+# ========== Pas maximal stable (analyse linéaire) ==========
+# Valeurs propres de l'oscillateur : ±iω. Euler amplifie ces modes de
+# |1 + iω dt| > 1 quel que soit dt ; RK4 est stable jusqu'à 2√2 / ω.
+spectre = np.array([1j * omega, -1j * omega])
+print("\n📊 Pas maximal stable :")
+for nom, pas in [("Euler", euler), ("RK4", rk4)]:
+    dt_limite = dt_max(pas, spectre)
+    if dt_limite == 0.0:
+        print(f"   {nom} : aucun (amplitude multipliée par "
+              f"{np.sqrt(1 + (omega * pas_temps[0])**2):.4f} par pas pour dt = {pas_temps[0]})")
+    else:
+        print(f"   {nom} : dt < {dt_limite:.4f}")
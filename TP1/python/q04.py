@@ -6,7 +6,7 @@ Définition de la fonction générique pour calculer les dérivées
 import numpy as np
 
 
-def deriv(t, y, params):
+def deriv(t, y, params, out=None):
     """
     Calcule les dérivées pour l'oscillateur harmonique.
     
@@ -22,6 +22,9 @@ def deriv(t, y, params):
         Tableau [x, v] contenant position et vitesse.
     params : float
         Pulsation propre ω₀.
+    out : ndarray, optionnel
+        Tableau de taille 2 dans lequel écrire les dérivées (aucune
+        allocation). Si None, un nouveau tableau est créé.
     
     Retour
     ------
@@ -29,7 +32,7 @@ def deriv(t, y, params):
         Tableau [dx/dt, dv/dt] des dérivées.
     """
     omega = params
-    dy = np.zeros(2)
+    dy = np.zeros(2) if out is None else out
     dy[0] = y[1]                # dx/dt = v
     dy[1] = -omega**2 * y[0]    # dv/dt = -ω² x
     return dy
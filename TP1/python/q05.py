@@ -7,10 +7,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 
-def deriv(t, y, params):
+def deriv(t, y, params, out=None):
     """Calcule les dérivées pour l'oscillateur harmonique."""
     omega = params
-    dy = np.zeros(2)
+    dy = np.zeros(2) if out is None else out
     dy[0] = y[1]
     dy[1] = -omega**2 * y[0]
     return dy
@@ -2,10 +2,19 @@
 """
 Question 6 : Particule chargée dans des champs E et B uniformes
 Trajectoire dans le plan x-y avec E = E ux et B = B uz
+
+La trajectoire est écrite par blocs dans un .npy projeté en mémoire
+(trajectoire_flux.py) puis relue paresseusement pour le graphe : la mémoire
+reste bornée même pour 10⁹ pas (augmenter pas_sortie pour alléger le fichier).
 """
+import os
+import tempfile
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+from trajectoire_flux import integrer_vers_fichier, lire_trajectoire
+
 
 def deriv(t, y, params):
     """
@@ -29,33 +38,26 @@ def deriv(t, y, params):
     return dy
 
 
-def euler(t, dt, y, deriv, params):
-    """Un pas d'Euler."""
-    dy = deriv(t, y, params)
-    return y + dt * dy
-
-
 # ========== Paramètres ==========
 # Unités : q/m = E = B = 1
 x0, y0 = 0.0, 0.0
 vx0, vy0 = 0.0, 1.0
 dt = 0.01
 t_max = 50.0
+pas_sortie = 1          # un point sur pas_sortie est écrit
+chemin = os.path.join(tempfile.gettempdir(), 'q06_trajectoire.npy')
 
 # ========== Simulation ==========
-temps = np.arange(0.0, t_max + dt, dt)
-n_points = temps.size
-
-x_traj = np.empty(n_points)
-y_traj = np.empty(n_points)
-
+n_pas = int(round(t_max / dt))
 y = np.array([x0, y0, vx0, vy0])
+n_points = integrer_vers_fichier(chemin, deriv, y, 0.0, dt, n_pas, None,
+                                 methode="euler", pas_sortie=pas_sortie)
 
-for i in range(n_points):
-    x_traj[i] = y[0]
-    y_traj[i] = y[1]
-    t = temps[i]
-    y = euler(t, dt, y, deriv, None)
+# Lecture paresseuse : seules les colonnes tracées sont chargées
+temps, etats = lire_trajectoire(chemin)
+x_traj = etats[:, 0]
+y_traj = etats[:, 1]
+print(f"✓ {n_points} points écrits dans {chemin}")
 
 # ========== Graphe ==========
 plt.figure(figsize=(10, 6))
@@ -5,41 +5,36 @@ Comparaison avec la solution analytique pour l'oscillateur harmonique
 """
 import numpy as np
 import matplotlib.pyplot as plt
+from integration import integrer
+from extrapolation import combiner_richardson
+from diagnostics import ErreurReference, Derive, integrer_avec_diagnostics, tableau_resume
 
 
-def deriv(t, y, params):
+def deriv(t, y, params, out=None):
     """Dérivées pour l'oscillateur harmonique."""
     omega = params
-    dy = np.zeros(2)
+    dy = np.zeros(2) if out is None else out
     dy[0] = y[1]
     dy[1] = -omega**2 * y[0]
     return dy
 
 
-def euler(t, dt, y, deriv, params):
-    """Un pas d'Euler."""
-    dy = deriv(t, y, params)
-    return y + dt * dy
-
-
 def solution_analytique(t, x0, v0, omega):
     """Solution exacte : x(t) = x0*cos(ωt) + (v0/ω)*sin(ωt)"""
     return x0 * np.cos(omega * t) + (v0 / omega) * np.sin(omega * t)
 
 
-def simuler_euler(dt, t_max, omega, x0, v0):
-    """Simule l'oscillateur avec Euler et retourne t, x."""
+def simuler_euler(dt, t_max, omega, x0, v0, pas_sortie=1):
+    """Simule l'oscillateur avec Euler et retourne t, x (un point sur pas_sortie)."""
     temps = np.arange(0.0, t_max + dt, dt)
-    n_points = temps.size
-    x_values = np.empty(n_points)
-    
-    y = np.array([x0, v0])
-    for i in range(n_points):
-        x_values[i] = y[0]
-        t = temps[i]
-        y = euler(t, dt, y, deriv, omega)
-    
-    return temps, x_values
+    temps, Y = integrer(deriv, np.array([x0, v0]), temps, omega, methode="euler",
+                        pas_sortie=pas_sortie)
+    return temps, Y[:, 0]
+
+
+def energie(t, Y, omega=1.0):
+    """Énergie mécanique (par unité de masse) d'un bloc d'états."""
+    return 0.5 * (Y[:, 1]**2 + omega**2 * Y[:, 0]**2)
 
 
 # ========== Paramètres ==========
@@ -52,13 +47,19 @@ t_max = 50.0
 pas_temps = [0.01, 0.005]
 
 # ========== Graphe ==========
+# L'erreur et la dérive d'énergie sont accumulées pendant l'intégration :
+# seule une courbe d'erreur réduite (quelques centaines de points) est gardée.
 plt.figure(figsize=(10, 6))
 
+diagnostics = []
 for dt in pas_temps:
-    temps, x_num = simuler_euler(dt, t_max, omega, x0, v0)
-    x_theo = solution_analytique(temps, x0, v0, omega)
-    erreur = x_num - x_theo
-    plt.plot(temps, erreur, label=f'dt = {dt}')
+    erreur = ErreurReference(lambda t: solution_analytique(t, x0, v0, omega), 0,
+                             f"erreur sur x, dt = {dt}")
+    derive = Derive(lambda t, Y: energie(t, Y, omega), f"énergie, dt = {dt}")
+    integrer_avec_diagnostics(deriv, np.array([x0, v0]), 0.0, dt, int(round(t_max / dt)),
+                              omega, [erreur, derive], methode="euler")
+    diagnostics += [erreur, derive]
+    plt.plot(*erreur.courbe.donnees(), label=f'dt = {dt}')
 
 plt.xlabel('Temps t')
 plt.ylabel('x(t) - x_th(t)')
@@ -71,6 +72,22 @@ print("✓ Graphe q07.pdf sauvegardé")
 
 plt.show()
 
+print("\n📊 Diagnostics (sur tous les pas, sans trajectoire stockée) :")
+print(tableau_resume(diagnostics))
+
+# ========== Extrapolation de Richardson des deux pas de temps ==========
+# Les deux simulations (dt et dt/2) se combinent en un résultat plus précis,
+# et leur écart donne une estimation de l'erreur sans solution analytique.
+# Un point sur 10 du pas grossier suffit (mêmes instants pour les deux pas)
+temps, x_grossier = simuler_euler(pas_temps[0], t_max, omega, x0, v0, pas_sortie=10)
+_, x_fin = simuler_euler(pas_temps[1], t_max, omega, x0, v0, pas_sortie=10)
+x_extrapole, estimation = combiner_richardson(x_grossier, x_fin, ordre=1)
+x_theo = solution_analytique(temps, x0, v0, omega)
+print(f"\n📊 Extrapolation de Richardson (Euler, dt = {pas_temps[0]} et {pas_temps[1]}) :")
+print(f"   Erreur max avec dt = {pas_temps[1]} : {np.max(np.abs(x_fin[::2] - x_theo)):.1e} "
+      f"(estimée : {np.max(np.abs(estimation)):.1e})")
+print(f"   Erreur max extrapolée      : {np.max(np.abs(x_extrapole - x_theo)):.1e}")
+
 print("\n📊 Observation :")
 print("- L'erreur croît avec le temps")
 print("- Réduire dt diminue l'erreur mais ne la supprime pas complètement")
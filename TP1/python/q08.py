@@ -5,13 +5,16 @@ Comparaison de l'erreur avec la méthode d'Euler
 """
 import numpy as np
 import matplotlib.pyplot as plt
-from rk4 import rk4
+from integration import integrer
+from extrapolation import combiner_richardson
+from diagnostics import ErreurReference, Derive, integrer_avec_diagnostics, tableau_resume
+from rk4 import dopri5
 
 
-def deriv(t, y, params):
+def deriv(t, y, params, out=None):
     """Dérivées pour l'oscillateur harmonique."""
     omega = params
-    dy = np.zeros(2)
+    dy = np.zeros(2) if out is None else out
     dy[0] = y[1]
     dy[1] = -omega**2 * y[0]
     return dy
@@ -22,19 +25,17 @@ def solution_analytique(t, x0, v0, omega):
     return x0 * np.cos(omega * t) + (v0 / omega) * np.sin(omega * t)
 
 
-def simuler_rk4(dt, t_max, omega, x0, v0):
-    """Simule l'oscillateur avec RK4."""
+def simuler_rk4(dt, t_max, omega, x0, v0, pas_sortie=1):
+    """Simule l'oscillateur avec RK4 (un point sur pas_sortie)."""
     temps = np.arange(0.0, t_max + dt, dt)
-    n_points = temps.size
-    x_values = np.empty(n_points)
-    
-    y = np.array([x0, v0])
-    for i in range(n_points):
-        x_values[i] = y[0]
-        t = temps[i]
-        y = rk4(t, dt, y, deriv, omega)
-    
-    return temps, x_values
+    temps, Y = integrer(deriv, np.array([x0, v0]), temps, omega, methode="rk4",
+                        pas_sortie=pas_sortie)
+    return temps, Y[:, 0]
+
+
+def energie(t, Y, omega=1.0):
+    """Énergie mécanique (par unité de masse) d'un bloc d'états."""
+    return 0.5 * (Y[:, 1]**2 + omega**2 * Y[:, 0]**2)
 
 
 # ========== Paramètres ==========
@@ -47,13 +48,19 @@ t_max = 100.0  # Temps plus long pour voir l'avantage de RK4
 pas_temps = [0.01, 0.005]
 
 # ========== Graphe ==========
+# L'erreur et la dérive d'énergie sont accumulées pendant l'intégration :
+# seule une courbe d'erreur réduite (quelques centaines de points) est gardée.
 plt.figure(figsize=(10, 6))
 
+diagnostics = []
 for dt in pas_temps:
-    temps, x_num = simuler_rk4(dt, t_max, omega, x0, v0)
-    x_theo = solution_analytique(temps, x0, v0, omega)
-    erreur = x_num - x_theo
-    plt.plot(temps, erreur, label=f'RK4, dt = {dt}')
+    erreur = ErreurReference(lambda t: solution_analytique(t, x0, v0, omega), 0,
+                             f"erreur sur x, dt = {dt}")
+    derive = Derive(lambda t, Y: energie(t, Y, omega), f"énergie, dt = {dt}")
+    integrer_avec_diagnostics(deriv, np.array([x0, v0]), 0.0, dt, int(round(t_max / dt)),
+                              omega, [erreur, derive], methode="rk4")
+    diagnostics += [erreur, derive]
+    plt.plot(*erreur.courbe.donnees(), label=f'RK4, dt = {dt}')
 
 plt.xlabel('Temps t')
 plt.ylabel('x(t) - x_th(t)')
@@ -66,6 +73,42 @@ print("✓ Graphe q08.pdf sauvegardé")
 
 plt.show()
 
+print("\n📊 Diagnostics (sur tous les pas, sans trajectoire stockée) :")
+print(tableau_resume(diagnostics))
+
+# ========== Extrapolation de Richardson des deux pas de temps ==========
+# Les deux simulations (dt et dt/2) se combinent en un résultat plus précis,
+# et leur écart donne une estimation de l'erreur sans solution analytique.
+# Un point sur 10 du pas grossier suffit (mêmes instants pour les deux pas)
+temps, x_grossier = simuler_rk4(pas_temps[0], t_max, omega, x0, v0, pas_sortie=10)
+_, x_fin = simuler_rk4(pas_temps[1], t_max, omega, x0, v0, pas_sortie=10)
+x_extrapole, estimation = combiner_richardson(x_grossier, x_fin, ordre=4)
+x_theo = solution_analytique(temps, x0, v0, omega)
+print(f"\n📊 Extrapolation de Richardson (RK4, dt = {pas_temps[0]} et {pas_temps[1]}) :")
+print(f"   Erreur max avec dt = {pas_temps[1]} : {np.max(np.abs(x_fin[::2] - x_theo)):.1e} "
+      f"(estimée : {np.max(np.abs(estimation)):.1e})")
+print(f"   Erreur max extrapolée      : {np.max(np.abs(x_extrapole - x_theo)):.1e}")
+
+# ========== Comparaison avec le pas adaptatif (Dormand-Prince 5(4)) ==========
+print("\n📊 Appels à deriv pour une même précision :")
+for i, dt in enumerate(pas_temps):
+    erreur_rk4 = diagnostics[2 * i].maximum
+    evaluations_rk4 = 4 * int(round(t_max / dt))
+
+    # Tolérance la plus large qui atteint au moins la précision de RK4
+    tol = 1e-4
+    while True:
+        t_ad, Y_ad, stats = dopri5(0.0, t_max, np.array([x0, v0]), deriv, omega,
+                                   rtol=tol, atol=tol)
+        erreur_ad = np.max(np.abs(Y_ad[:, 0] - solution_analytique(t_ad, x0, v0, omega)))
+        if erreur_ad <= erreur_rk4 or tol < 1e-14:
+            break
+        tol /= 10.0
+
+    print(f"   RK4 dt = {dt} : erreur max {erreur_rk4:.1e}, {evaluations_rk4} appels")
+    print(f"   DOPRI5 tol = {tol:.0e} : erreur max {erreur_ad:.1e}, {stats['evaluations']} appels "
+          f"({stats['acceptes']} pas acceptés, {stats['rejetes']} rejetés)")
+
 print("\n📊 Observation :")
 print("- RK4 est beaucoup plus précis qu'Euler")
 print("- L'erreur reste très petite même sur de longues durées")
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Évaluation vectorisée des récurrences linéaires x_{n+1} = M x_n.
+
+Pour un système linéaire dx/dt = A x, la méthode d'Euler donne
+x_{n+1} = (I + dt A) x_n. Au lieu d'itérer en Python, on calcule toute la
+suite d'un coup :
+    - en dimension 1 par les puissances successives m^n ;
+    - en dimension d par doublements successifs : les termes x_m à
+      x_{2m-1} sont obtenus d'un seul produit matriciel x_{i+m} = M^m x_i
+      à partir des m premiers, puis M^m est élevée au carré. Il suffit de
+      log2(n) produits, et chaque terme ne subit qu'environ log2(n)
+      arrondis : le résultat reste à la précision machine de la boucle,
+      même pour 10^7 pas.
+
+Une récurrence scalaire déduite du polynôme caractéristique de M
+(Cayley-Hamilton) serait aussi vectorisable (scipy.signal.lfilter), mais
+elle est instable quand dt est petit : les racines de ce polynôme sont
+presque confondues près de 1 et les arrondis s'amplifient avec n.
+"""
+import numpy as np
+
+
+def matrice_euler(A, dt):
+    """
+    Matrice d'itération de la méthode d'Euler : M = I + dt A.
+
+    Paramètres
+    ----------
+    A : float ou ndarray
+        Coefficient (dimension 1) ou matrice (d, d) du système dx/dt = A x.
+    dt : float
+        Pas de temps.
+
+    Retour
+    ------
+    ndarray
+        Matrice (d, d).
+    """
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    return np.eye(A.shape[0]) + dt * A
+
+
+def recurrence_lineaire(M, x0, n_points):
+    """
+    Calcule les n_points premiers termes de x_{i+1} = M x_i sans boucle Python.
+
+    Paramètres
+    ----------
+    M : float ou ndarray
+        Coefficient ou matrice (d, d) de la récurrence.
+    x0 : float ou ndarray
+        Premier terme (taille d).
+    n_points : int
+        Nombre de termes calculés (x_0 compris).
+
+    Retour
+    ------
+    ndarray
+        Tableau (n_points, d) : la ligne i contient x_i = M^i x0.
+    """
+    M = np.atleast_2d(np.asarray(M, dtype=float))
+    x0 = np.atleast_1d(np.asarray(x0, dtype=float))
+    d = x0.size
+
+    # Dimension 1 : puissances successives
+    if d == 1:
+        return (x0[0] * M[0, 0] ** np.arange(n_points))[:, np.newaxis]
+
+    # Doublements : X[m:2m] = X[:m] (M^m)ᵀ, puis M^m → M^2m
+    X = np.empty((n_points, d))
+    X[0] = x0
+    puissance = M.T.copy()
+    rempli = 1
+    while rempli < n_points:
+        m = min(rempli, n_points - rempli)
+        np.matmul(X[:m], puissance, out=X[rempli:rempli + m])
+        rempli += m
+        if rempli < n_points:
+            puissance = puissance @ puissance
+    return X
+
+
+def euler_lineaire(A, x0, dt, t_max):
+    """
+    Trajectoire d'Euler complète pour dx/dt = A x sur [0, t_max].
+
+    Retour
+    ------
+    temps : ndarray
+        Grille np.arange(0, t_max + dt, dt), comme dans q01.py et q02.py.
+    X : ndarray
+        Tableau (temps.size, d) des valeurs calculées par Euler.
+    """
+    temps = np.arange(0.0, t_max + dt, dt)
+    return temps, recurrence_lineaire(matrice_euler(A, dt), x0, temps.size)
+
+
+# ========== Vérification et performances ==========
+if __name__ == "__main__":
+    import time
+
+    print("Test de recurrence_lineaire() :\n")
+
+    # Chaîne X → Y → Z : comparaison avec la boucle d'Euler de q02.py
+    k, k2 = 1.0, 0.1
+    dt, t_max = 0.05, 20.0
+    A = np.array([[-k, 0.0], [k, -k2]])
+    temps, X = euler_lineaire(A, [1.0, 0.0], dt, t_max)
+    x, y = 1.0, 0.0
+    X_boucle = np.empty_like(X)
+    for i in range(temps.size):
+        X_boucle[i] = x, y
+        x, y = x + dt * (-k * x), y + dt * (k * x - k2 * y)
+    print(f"Chaîne X → Y → Z : écart avec la boucle = {np.max(np.abs(X - X_boucle)):.2e}")
+
+    # Comparaison avec la boucle sur un million de pas
+    n = 1_000_000
+    dt = 20.0 / n
+    temps, X = euler_lineaire(A, [1.0, 0.0], dt, 20.0)
+    x, y = 1.0, 0.0
+    ecart = 0.0
+    for i in range(temps.size):
+        ecart = max(ecart, abs(X[i, 0] - x), abs(X[i, 1] - y))
+        x, y = x + dt * (-k * x), y + dt * (k * x - k2 * y)
+    print(f"{temps.size} pas : écart avec la boucle = {ecart:.2e}")
+
+    # Oscillateur de q03 (valeurs propres 1 ± i dt) sur t = 100
+    dt = 1e-4
+    temps, X = euler_lineaire([[0.0, 1.0], [-1.0, 0.0]], [1.0, 0.0], dt, 100.0)
+    x, v = 1.0, 0.0
+    ecart = 0.0
+    for i in range(temps.size):
+        ecart = max(ecart, abs(X[i, 0] - x), abs(X[i, 1] - v))
+        x, v = x + dt * v, v - dt * x
+    print(f"Oscillateur, {temps.size} pas : écart avec la boucle = {ecart:.2e}")
+
+    # Courbe d'erreur sur 10 millions de pas
+    n = 10_000_000
+    dt = 20.0 / n
+    start = time.perf_counter()
+    temps, X = euler_lineaire(A, [1.0, 0.0], dt, 20.0)
+    y_exact = k * (np.exp(-k * temps) - np.exp(-k2 * temps)) / (k2 - k)
+    erreur = X[:, 1] - y_exact
+    duree = time.perf_counter() - start
+    print(f"{temps.size} pas : erreur max = {np.max(np.abs(erreur)):.2e}, "
+          f"calculée en {1e3 * duree:.0f} ms")
@@ -47,3 +47,328 @@ def rk4(t, dt, y, deriv, params):
 
     # Moyenne pondérée : 1/6 + 1/3 + 1/3 + 1/6 = 1
     return y + dt * (d1 + 2 * d2 + 2 * d3 + d4) / 6.0
+
+
+def rk4_ensemble(t, dt, Y, deriv, params):
+    """
+    Pas RK4 appliqué simultanément à tout un ensemble de systèmes.
+
+    Chaque ligne de Y est l'état d'un membre de l'ensemble ; les quatre
+    estimations sont calculées d'un seul coup sur tous les membres, ce qui
+    remplace la boucle Python sur les conditions initiales ou les paramètres.
+
+    Paramètres
+    ----------
+    t : float ou ndarray
+        Temps actuel (scalaire, ou tableau de taille n_membres).
+    dt : float ou ndarray
+        Pas de temps (scalaire, ou un pas par membre de taille n_membres).
+    Y : ndarray
+        Tableau (n_membres, n_etat) des états de chaque membre.
+    deriv : callable
+        Fonction vectorisée deriv(t, Y, params) -> dY de forme (n_membres, n_etat).
+    params : float, ndarray ou tuple
+        Paramètres physiques ; un tableau de taille n_membres donne une valeur
+        différente à chaque membre.
+
+    Retour
+    ------
+    ndarray
+        Nouveaux états (n_membres, n_etat) au temps t + dt.
+    """
+    dt = np.asarray(dt, dtype=float)
+    # Un pas par membre : on l'aligne sur les lignes de Y
+    h = dt[:, np.newaxis] if dt.ndim == 1 else dt
+    demi_pas = h / 2.0
+    t_demi = t + dt / 2.0
+
+    # Première estimation
+    d1 = deriv(t, Y, params)
+    yp = Y + d1 * demi_pas
+
+    # Deuxième estimation (demi-pas)
+    d2 = deriv(t_demi, yp, params)
+    yp = Y + d2 * demi_pas
+
+    # Troisième estimation (demi-pas)
+    d3 = deriv(t_demi, yp, params)
+    yp = Y + d3 * h
+
+    # Quatrième estimation (pas complet)
+    d4 = deriv(t + dt, yp, params)
+
+    return Y + h * (d1 + 2 * d2 + 2 * d3 + d4) / 6.0
+
+
+# ========== Versions sans allocation (protocole out=) ==========
+# Les fonctions deriv compatibles acceptent un quatrième argument optionnel :
+# deriv(t, y, params, out) écrit les dérivées dans le tableau out au lieu
+# d'en allouer un nouveau. Les pas *_inplace modifient y sur place et
+# réutilisent un espace de travail alloué une seule fois avant la boucle.
+
+def espace_travail_rk4(n):
+    """
+    Alloue l'espace de travail de rk4_inplace pour un état de taille n.
+
+    Retour
+    ------
+    tuple de ndarray
+        Les cinq tampons de taille n : d1, d2, d3, d4 et yp.
+    """
+    return tuple(np.empty(n) for _ in range(5))
+
+
+def espace_travail_euler(n):
+    """
+    Alloue l'espace de travail de euler_inplace pour un état de taille n.
+
+    Retour
+    ------
+    tuple de ndarray
+        Le tampon des dérivées (taille n), seul élément du tuple.
+    """
+    return (np.empty(n),)
+
+
+def euler(t, dt, y, deriv, params):
+    """
+    Effectue un pas d'intégration par la méthode d'Euler.
+
+    Paramètres
+    ----------
+    t : float
+        Temps actuel.
+    dt : float
+        Pas de temps.
+    y : ndarray
+        Tableau des valeurs au temps t.
+    deriv : callable
+        Fonction qui calcule les dérivées : deriv(t, y, params) -> dy.
+    params : float ou ndarray
+        Paramètres physiques.
+
+    Retour
+    ------
+    ndarray
+        Nouvelles valeurs au temps t + dt.
+    """
+    dy = deriv(t, y, params)
+    return y + dt * dy
+
+
+def euler_inplace(t, dt, y, deriv, params, work):
+    """
+    Pas d'Euler sans allocation : y est remplacé par sa valeur au temps t + dt.
+
+    Paramètres
+    ----------
+    t, dt : float
+        Temps actuel et pas de temps.
+    y : ndarray
+        État au temps t, modifié sur place.
+    deriv : callable
+        Fonction deriv(t, y, params, out) qui écrit les dérivées dans out.
+    params : float ou ndarray
+        Paramètres physiques.
+    work : tuple de ndarray
+        Espace de travail renvoyé par espace_travail_euler(y.size).
+
+    Retour
+    ------
+    ndarray
+        Le tableau y lui-même (mis à jour).
+    """
+    d, = work
+    deriv(t, y, params, d)
+    d *= dt
+    y += d
+    return y
+
+
+def rk4_inplace(t, dt, y, deriv, params, work):
+    """
+    Pas RK4 sans allocation : y est remplacé par sa valeur au temps t + dt.
+
+    Mêmes étapes que rk4(), mais les quatre estimations et l'état
+    intermédiaire sont écrits dans les tampons de work.
+
+    Paramètres
+    ----------
+    t, dt : float
+        Temps actuel et pas de temps.
+    y : ndarray
+        État au temps t, modifié sur place.
+    deriv : callable
+        Fonction deriv(t, y, params, out) qui écrit les dérivées dans out.
+    params : float ou ndarray
+        Paramètres physiques.
+    work : tuple de ndarray
+        Espace de travail renvoyé par espace_travail_rk4(y.size).
+
+    Retour
+    ------
+    ndarray
+        Le tableau y lui-même (mis à jour).
+    """
+    d1, d2, d3, d4, yp = work
+    demi_pas = dt / 2.0
+
+    # Première estimation
+    deriv(t, y, params, d1)
+    np.multiply(d1, demi_pas, out=yp)
+    yp += y
+
+    # Deuxième estimation (demi-pas)
+    deriv(t + demi_pas, yp, params, d2)
+    np.multiply(d2, demi_pas, out=yp)
+    yp += y
+
+    # Troisième estimation (demi-pas)
+    deriv(t + demi_pas, yp, params, d3)
+    np.multiply(d3, dt, out=yp)
+    yp += y
+
+    # Quatrième estimation (pas complet)
+    deriv(t + dt, yp, params, d4)
+
+    # Moyenne pondérée accumulée dans d1 : d1 + 2 (d2 + d3) + d4
+    d2 += d3
+    d2 *= 2.0
+    d1 += d2
+    d1 += d4
+    d1 *= dt / 6.0
+    y += d1
+    return y
+
+
+# ========== Méthode adaptative de Dormand-Prince 5(4) ==========
+# Coefficients du tableau de Butcher (Hairer, Nørsett & Wanner)
+_DP_C = np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0])
+_DP_A = [
+    np.array([]),
+    np.array([1 / 5]),
+    np.array([3 / 40, 9 / 40]),
+    np.array([44 / 45, -56 / 15, 32 / 9]),
+    np.array([19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729]),
+    np.array([9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656]),
+    np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84]),
+]
+# Différence entre les solutions d'ordre 5 et d'ordre 4 (estimation d'erreur)
+_DP_E = np.array([71 / 57600, 0.0, -71 / 16695, 71 / 1920,
+                  -17253 / 339200, 22 / 525, -1 / 40])
+
+
+def _norme_erreur(erreur, y, y_nouveau, rtol, atol):
+    """Norme RMS de l'erreur locale pondérée par les tolérances."""
+    echelle = atol + rtol * np.maximum(np.abs(y), np.abs(y_nouveau))
+    return np.sqrt(np.mean((erreur / echelle) ** 2))
+
+
+def _pas_initial(t, y, d0, deriv, params, rtol, atol):
+    """Choix automatique du premier pas (algorithme de Hairer)."""
+    echelle = atol + rtol * np.abs(y)
+    n0 = np.sqrt(np.mean((y / echelle) ** 2))
+    n1 = np.sqrt(np.mean((d0 / echelle) ** 2))
+    h0 = 1e-6 if (n0 < 1e-5 or n1 < 1e-5) else 0.01 * n0 / n1
+    d1 = deriv(t + h0, y + h0 * d0, params)
+    n2 = np.sqrt(np.mean(((d1 - d0) / echelle) ** 2)) / h0
+    if max(n1, n2) <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(n1, n2)) ** (1 / 5)
+    return min(100 * h0, h1)
+
+
+def dopri5(t0, t_fin, y0, deriv, params, rtol=1e-6, atol=1e-9, dt=None, dt_max=np.inf):
+    """
+    Intégration adaptative par la méthode de Dormand-Prince 5(4).
+
+    À chaque pas, deux solutions d'ordres 5 et 4 sont obtenues avec les
+    mêmes estimations de deriv ; leur différence donne l'erreur locale, qui
+    pilote le pas (contrôleur PI). La dernière estimation d'un pas accepté
+    sert de première estimation au pas suivant (FSAL), d'où 6 appels à
+    deriv par pas au lieu de 7.
+
+    Paramètres
+    ----------
+    t0, t_fin : float
+        Temps initial et final.
+    y0 : ndarray
+        Valeurs initiales au temps t0.
+    deriv : callable
+        Fonction qui calcule les dérivées : deriv(t, y, params) -> dy.
+    params : float ou ndarray
+        Paramètres physiques nécessaires au calcul.
+    rtol, atol : float
+        Tolérances relative et absolue sur l'erreur locale.
+    dt : float, optionnel
+        Premier pas ; choisi automatiquement si None.
+    dt_max : float
+        Pas maximal autorisé.
+
+    Retour
+    ------
+    temps : ndarray
+        Temps des pas acceptés (t0 et t_fin compris).
+    Y : ndarray
+        Tableau (temps.size, n) des valeurs correspondantes.
+    stats : dict
+        Nombre de pas acceptés ('acceptes'), rejetés ('rejetes') et
+        d'appels à deriv ('evaluations').
+    """
+    # Paramètres du contrôleur PI (valeurs de Hairer pour DOPRI5)
+    securite = 0.9
+    beta = 0.04
+    alpha = 0.2 - 0.75 * beta
+    fac_min, fac_max = 0.2, 10.0
+
+    t = t0
+    y = np.array(y0, dtype=float)
+    k = [None] * 7
+    k[0] = deriv(t, y, params)
+    evaluations = 1
+    if dt is None:
+        dt = _pas_initial(t, y, k[0], deriv, params, rtol, atol)
+        evaluations += 1
+    dt = min(dt, dt_max)
+
+    liste_t = [t]
+    liste_y = [y]
+    acceptes = 0
+    rejetes = 0
+    err_prec = 1e-4
+
+    while t < t_fin:
+        # Dernier pas : on s'arrête exactement sur t_fin
+        dernier = t + dt >= t_fin
+        h = t_fin - t if dernier else dt
+
+        # Six nouvelles estimations (la première est réutilisée)
+        for s in range(1, 7):
+            yp = y + h * np.dot(_DP_A[s], k[:s])
+            k[s] = deriv(t + _DP_C[s] * h, yp, params)
+        evaluations += 6
+        y_nouveau = yp  # la ligne 7 du tableau donne la solution d'ordre 5
+
+        err = _norme_erreur(h * np.dot(_DP_E, k), y, y_nouveau, rtol, atol)
+
+        if err <= 1.0:
+            # Pas accepté : contrôle PI sur le pas suivant
+            fac = err ** alpha / err_prec ** beta if err > 0 else 1.0 / fac_max
+            fac = min(1.0 / fac_min, max(1.0 / fac_max, fac / securite))
+            err_prec = max(err, 1e-4)
+            t = t_fin if dernier else t + h
+            y = y_nouveau
+            k[0] = k[6]  # FSAL
+            liste_t.append(t)
+            liste_y.append(y)
+            acceptes += 1
+            dt = min(h / fac, dt_max)
+        else:
+            # Pas rejeté : on réduit le pas sans le faire croître
+            fac = min(1.0 / fac_min, err ** alpha / securite)
+            dt = h / fac
+            rejetes += 1
+
+    stats = {"acceptes": acceptes, "rejetes": rejetes, "evaluations": evaluations}
+    return np.array(liste_t), np.array(liste_y), stats
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+Régions de stabilité linéaire et pas de temps maximal.
+
+q03.py constate par essais que dt = 0.2 fait diverger Euler. Pour un
+problème linéarisé dy/dt = J y, un pas de méthode multiplie chaque mode
+propre λ de J par le facteur d'amplification R(z), z = λ dt (R(z) = 1 + z
+pour Euler, 1 + z + z²/2 + z³/6 + z⁴/24 pour RK4). La méthode est stable si
+|R(λ dt)| ≤ 1 pour toutes les valeurs propres λ.
+
+R est obtenu sans formule particulière : on applique le pas lui-même, de
+signature pas(t, dt, y, deriv, params) comme rk4 et euler, à y' = z y avec
+dt = 1 et y = 1, sur tout un tableau de z complexes à la fois. Toute
+nouvelle méthode de même signature est donc prise en charge.
+
+dt_max() combine cette région avec le spectre de la jacobienne du problème
+en un état donné : pour chaque λ, on cherche le long du rayon d'argument
+arg(λ) la distance r à laquelle la région se termine, et dt ≤ r / |λ|.
+"""
+import numpy as np
+from implicite import jacobien_numerique
+
+
+def _deriv_lineaire(t, y, params, out=None):
+    """y' = z y, z étant le tableau des params (un z par composante)."""
+    if out is None:
+        return params * y
+    np.multiply(params, y, out=out)
+    return out
+
+
+def facteur_amplification(pas, z):
+    """
+    Facteur d'amplification R(z) d'une méthode à un pas, vectorisé.
+
+    Paramètres
+    ----------
+    pas : callable
+        Pas pas(t, dt, y, deriv, params) -> y (ou (y, ...) : seul le premier
+        élément est gardé).
+    z : ndarray complexe
+        Valeurs de λ dt, de forme quelconque.
+
+    Retour
+    ------
+    ndarray complexe
+        R(z), de même forme que z.
+    """
+    z = np.asarray(z, dtype=complex)
+    resultat = pas(0.0, 1.0, np.ones(z.size, dtype=complex), _deriv_lineaire, z.ravel())
+    if isinstance(resultat, tuple):
+        resultat = resultat[0]
+    return np.reshape(resultat, z.shape)
+
+
+def region_stabilite(pas, re_min=-5.0, re_max=1.0, im_max=4.0, n=401):
+    """
+    |R(z)| sur une grille complexe, pour tracer la région de stabilité.
+
+    Retour
+    ------
+    Z : ndarray complexe
+        Grille (n, n) des z.
+    module : ndarray
+        |R(Z)| ; la région de stabilité est {module ≤ 1}.
+    """
+    re, im = np.meshgrid(np.linspace(re_min, re_max, n), np.linspace(-im_max, im_max, n))
+    Z = re + 1j * im
+    return Z, np.abs(facteur_amplification(pas, Z))
+
+
+def rayon_stabilite(pas, arguments, r_max=20.0, n=2000, tol=1e-9, n_dichotomie=40):
+    """
+    Distance à l'origine de la frontière de stabilité le long de rayons.
+
+    Paramètres
+    ----------
+    pas : callable
+        Pas de la méthode.
+    arguments : float ou ndarray
+        Arguments θ des rayons z = r e^{iθ}.
+    r_max : float
+        Distance maximale explorée.
+    n : int
+        Nombre de points d'échantillonnage par rayon, avant dichotomie.
+    tol : float
+        Tolérance sur |R| ≤ 1 (les méthodes dont la frontière longe le rayon,
+        comme RK4 sur l'axe imaginaire, restent stables à tol près).
+    n_dichotomie : int
+        Nombre d'itérations de dichotomie sur chaque rayon.
+
+    Retour
+    ------
+    ndarray
+        Plus grand r tel que |R(s e^{iθ})| ≤ 1 pour tout s ≤ r ; 0 si la
+        méthode est instable sur ce rayon dès l'origine, r_max si la
+        frontière n'est pas atteinte.
+    """
+    arguments = np.atleast_1d(np.asarray(arguments, dtype=float))
+    direction = np.exp(1j * arguments)
+    r = np.linspace(0.0, r_max, n + 1)[1:]
+    instable = np.abs(facteur_amplification(pas, np.outer(direction, r))) > 1.0 + tol
+
+    # Premier point instable de chaque rayon, puis dichotomie entre lui et
+    # le point précédent
+    premier = np.where(instable.any(axis=1), instable.argmax(axis=1), n)
+    bas = np.where(premier > 0, r[np.maximum(premier - 1, 0)], 0.0)
+    haut = np.where(premier < n, r[np.minimum(premier, n - 1)], r_max)
+    # Instable dès le premier échantillon : rayon nul
+    a_raffiner = (premier > 0) & (premier < n)
+    for _ in range(n_dichotomie):
+        milieu = 0.5 * (bas + haut)
+        stable = np.abs(facteur_amplification(pas, milieu * direction)) <= 1.0 + tol
+        bas = np.where(a_raffiner & stable, milieu, bas)
+        haut = np.where(a_raffiner & ~stable, milieu, haut)
+    return np.where(premier == 0, 0.0, np.where(a_raffiner, bas, r_max))
+
+
+def valeurs_propres(deriv, t, y, params, jacobien=None):
+    """Spectre de la jacobienne de deriv en (t, y) (différences finies si jacobien est None)."""
+    if jacobien is None:
+        J = jacobien_numerique(deriv, t, y, params)
+    else:
+        J = np.asarray(jacobien(t, y, params), dtype=float)
+    return np.linalg.eigvals(J)
+
+
+def dt_max(pas, spectre, marge=1.0, tol=1e-9):
+    """
+    Plus grand pas de temps stable pour un spectre donné.
+
+    Paramètres
+    ----------
+    pas : callable
+        Pas de la méthode.
+    spectre : ndarray
+        Valeurs propres λ de la jacobienne (les λ nulles sont ignorées).
+    marge : float
+        Facteur de sécurité appliqué au résultat (0.9 : 10 % sous la limite).
+    tol : float
+        Tolérance de rayon_stabilite().
+
+    Retour
+    ------
+    float
+        min_λ r(arg λ) / |λ| × marge ; 0 si une valeur propre est sur un
+        rayon instable dès l'origine (Euler et un oscillateur non amorti),
+        inf si le spectre est nul.
+    """
+    spectre = np.asarray(spectre, dtype=complex)
+    spectre = spectre[np.abs(spectre) > 0.0]
+    if spectre.size == 0:
+        return np.inf
+    rayons = rayon_stabilite(pas, np.angle(spectre), tol=tol)
+    return float(np.min(rayons / np.abs(spectre)) * marge)
+
+
+def dt_stable(pas, deriv, t, y, params, jacobien=None, marge=0.9):
+    """
+    Pas de temps maximal stable de pas pour deriv linéarisée en (t, y).
+
+    Raccourci pour dt_max(pas, valeurs_propres(...), marge).
+    """
+    return dt_max(pas, valeurs_propres(deriv, t, y, params, jacobien), marge)
+
+
+# ========== Vérification ==========
+if __name__ == "__main__":
+    from functools import partial
+    from rk4 import euler, rk4
+    from extrapolation import point_milieu_modifie, pas_extrapole
+    from integration import integrer
+
+    print("=" * 70)
+    print("Régions de stabilité linéaire")
+    print("=" * 70)
+
+    methodes = {"euler": euler, "rk4": rk4,
+                "point milieu ×4": partial(point_milieu_modifie, n_sous_pas=4),
+                "GBS 4 niveaux": partial(pas_extrapole, n_niveaux=4)}
+    print(f"   {'méthode':<18}{'axe réel':>10}{'axe imaginaire':>16}")
+    for nom, pas in methodes.items():
+        reel, imaginaire = rayon_stabilite(pas, [np.pi, np.pi / 2])
+        print(f"   {nom:<18}{reel:>10.4f}{imaginaire:>16.4f}")
+    print("   (attendu : Euler 2 et 0, RK4 2.7853 et 2√2 = 2.8284)")
+
+    # Chaîne de q02 : valeurs propres -k et -k2
+    def deriv_chaine(t, y, params, out=None):
+        k, k2 = params
+        return np.array([-k * y[0], k * y[0] - k2 * y[1]])
+
+    # Oscillateur de q03, non amorti (±iω) puis amorti
+    def deriv_oscillateur(t, y, params, out=None):
+        omega, gamma = params
+        return np.array([y[1], -omega**2 * y[0] - gamma * y[1]])
+
+    problemes = [("q02, k = 1, k2 = 0.1", deriv_chaine, (1.0, 0.1), [1.0, 0.0]),
+                 ("q03, ω = 1", deriv_oscillateur, (1.0, 0.0), [1.0, 0.0]),
+                 ("q03 amorti, γ = 0.5", deriv_oscillateur, (1.0, 0.5), [1.0, 0.0])]
+    print("\n📊 Pas maximal stable et vérification à 0.99 et 1.01 fois ce pas "
+          "(amplitude après 2000 pas)")
+    for nom, deriv, params, y0 in problemes:
+        spectre = valeurs_propres(deriv, 0.0, np.array(y0), params)
+        for methode, pas in [("euler", euler), ("rk4", rk4)]:
+            dt = dt_max(pas, spectre)
+            if dt == 0.0:
+                print(f"   {nom:<22}{methode:<6}: instable pour tout dt > 0")
+                continue
+            amplitudes = []
+            for facteur in (0.99, 1.01):
+                _, Y = integrer(deriv, y0, facteur * dt * np.arange(2001), params, methode)
+                amplitudes.append(np.max(np.abs(Y[-1])))
+            print(f"   {nom:<22}{methode:<6}: dt_max = {dt:.4f} → "
+                  f"{amplitudes[0]:.1e} / {amplitudes[1]:.1e}")
+    print("=" * 70)
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Désintégration stochastique X → Y → Z pour des nombres finis d'atomes.
+
+Les EDO de q01.py et q02.py décrivent la moyenne ; pour de petites
+populations les fluctuations comptent. Chaque atome de X se désintègre avec
+le taux k, chaque atome de Y avec le taux k2 : c'est un processus de sauts
+dont on simule des réalisations (répliques) indépendantes.
+
+Trois méthodes, au choix :
+    - "ssa"     : algorithme de Gillespie exact, un événement par tirage
+                  (coût proportionnel au nombre d'atomes) ;
+    - "tau"     : tau-leaping adaptatif (Cao, Gillespie et Petzold) : sur un
+                  saut tau, chaque réaction se produit un nombre de fois
+                  tiré selon une loi de Poisson (propensions au point
+                  milieu estimé) ; tau est choisi pour que les propensions
+                  varient peu (paramètre epsilon) ;
+    - "hybride" : tau-leaping, sauf pour les répliques où le saut
+                  contiendrait moins de seuil_ssa événements attendus, qui
+                  font un pas SSA exact (petites populations).
+
+Les répliques sont avancées ensemble (vecteurs numpy) par lots de
+taille_lot. Chaque lot a son propre générateur, issu de
+np.random.SeedSequence(graine).spawn() : les flux sont indépendants et le
+résultat ne dépend pas du nombre de processus. On ne conserve pas les
+trajectoires : aux instants d'observation, les moyennes et variances sont
+accumulées (formule de Welford / Chan par lot), la mémoire reste
+proportionnelle à taille_lot.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+METHODES_STOCHASTIQUES = ("ssa", "tau", "hybride")
+
+
+def nouvelles_statistiques(n_instants, n_especes=3):
+    """Accumulateurs vides : effectif, moyenne et somme des carrés des écarts."""
+    return {"n": 0, "moyenne": np.zeros((n_instants, n_especes)),
+            "m2": np.zeros((n_instants, n_especes))}
+
+
+def fusionner_statistiques(a, b):
+    """
+    Combine deux jeux d'accumulateurs (formule de Chan).
+
+    Retour
+    ------
+    dict
+        Accumulateurs de la réunion des deux échantillons.
+    """
+    n = a["n"] + b["n"]
+    if a["n"] == 0 or b["n"] == 0:
+        return dict(b) if a["n"] == 0 else dict(a)
+    ecart = b["moyenne"] - a["moyenne"]
+    return {"n": n,
+            "moyenne": a["moyenne"] + ecart * (b["n"] / n),
+            "m2": a["m2"] + b["m2"] + ecart**2 * (a["n"] * b["n"] / n)}
+
+
+def pas_tau(x, y, a1, a2, epsilon):
+    """
+    Saut tau de Cao, Gillespie et Petzold pour X → Y (a1) et Y → Z (a2).
+
+    La variation attendue de chaque population (moyenne et écart type) sur
+    le saut reste inférieure à max(epsilon × population, 1).
+    """
+    bx = np.maximum(epsilon * x, 1.0)
+    by = np.maximum(epsilon * y, 1.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tau = np.minimum(bx / a1, bx**2 / a1)
+        tau = np.minimum(tau, by / np.abs(a1 - a2))
+        tau = np.minimum(tau, by**2 / (a1 + a2))
+    return np.nan_to_num(tau, nan=np.inf)
+
+
+def _simuler_lot(N0, params, temps, n_repliques, methode, epsilon, seuil_ssa, graine):
+    """Simule un lot de répliques ; renvoie (statistiques, compteurs)."""
+    k, k2 = params
+    rng = np.random.default_rng(graine)
+    N = np.tile(np.asarray(N0, dtype=np.int64), (n_repliques, 1))
+    t = np.full(n_repliques, temps[0], dtype=float)
+    stats = nouvelles_statistiques(temps.size, N.shape[1])
+    compteurs = {"ssa": 0, "sauts": 0}
+
+    for i, t_obs in enumerate(temps):
+        actif = np.flatnonzero(t < t_obs)
+        while actif.size:
+            x = N[actif, 0]
+            y = N[actif, 1]
+            a1 = k * x
+            a2 = k2 * y
+            a0 = a1 + a2
+
+            if methode == "ssa":
+                exact = np.ones(actif.size, dtype=bool)
+            else:
+                tau = pas_tau(x, y, a1, a2, epsilon)
+                exact = (tau * a0 < seuil_ssa) if methode == "hybride" \
+                    else np.zeros(actif.size, dtype=bool)
+
+            # Pas SSA : temps du prochain événement ; s'il dépasse t_obs, on
+            # s'arrête à t_obs (loi exponentielle sans mémoire)
+            j = actif[exact]
+            if j.size:
+                a0_j = a0[exact]
+                with np.errstate(divide="ignore"):
+                    t_suivant = t[j] + rng.exponential(1.0, j.size) / a0_j
+                arrive = t_suivant < t_obs
+                reaction_1 = rng.random(j.size) * a0_j < a1[exact]
+                evenement_x = arrive & reaction_1
+                evenement_y = arrive & ~reaction_1
+                N[j, 0] -= evenement_x
+                N[j, 1] += evenement_x
+                N[j, 1] -= evenement_y
+                N[j, 2] += evenement_y
+                t[j] = np.where(arrive, t_suivant, t_obs)
+                compteurs["ssa"] += j.size
+
+            # Sauts tau : nombres de réactions poissoniens, propensions
+            # évaluées au point milieu estimé du saut (biais d'ordre 2 au
+            # lieu de 1), tronqués pour que les populations restent positives
+            j = actif[~exact]
+            if j.size:
+                duree = np.minimum(tau[~exact], t_obs - t[j])
+                x_milieu = np.maximum(x[~exact] - 0.5 * duree * a1[~exact], 0.0)
+                y_milieu = np.maximum(y[~exact] + 0.5 * duree * (a1[~exact] - a2[~exact]), 0.0)
+                K1 = np.minimum(rng.poisson(k * x_milieu * duree), N[j, 0])
+                K2 = np.minimum(rng.poisson(k2 * y_milieu * duree), N[j, 1])
+                N[j, 0] -= K1
+                N[j, 1] += K1 - K2
+                N[j, 2] += K2
+                t[j] = np.where(t_obs - t[j] <= duree, t_obs, t[j] + duree)
+                compteurs["sauts"] += j.size
+
+            actif = actif[t[actif] < t_obs]
+
+        # Statistiques du lot à cet instant, versées dans les accumulateurs
+        moyenne = N.mean(axis=0)
+        stats["moyenne"][i] = moyenne
+        stats["m2"][i] = ((N - moyenne) ** 2).sum(axis=0)
+    stats["n"] = n_repliques
+    return stats, compteurs
+
+
+def _simuler_lot_tuple(arguments):
+    """Adaptateur pour ProcessPoolExecutor.map."""
+    return _simuler_lot(*arguments)
+
+
+def simuler(N0, params, temps, n_repliques, methode="hybride", taille_lot=10_000,
+            graine=0, epsilon=0.03, seuil_ssa=10.0, parallele=False, n_processus=None):
+    """
+    Statistiques de n_repliques réalisations stochastiques de X → Y → Z.
+
+    Paramètres
+    ----------
+    N0 : sequence d'entiers
+        Populations initiales (x, y, z).
+    params : tuple
+        Constantes (k, k2).
+    temps : ndarray
+        Instants d'observation croissants ; temps[0] est l'instant initial.
+    n_repliques : int
+        Nombre de réalisations indépendantes.
+    methode : str
+        "ssa", "tau" ou "hybride".
+    taille_lot : int
+        Nombre de répliques avancées ensemble (fixe la mémoire utilisée).
+    graine : int
+        Graine de la SeedSequence dont dérivent les flux des lots.
+    epsilon : float
+        Variation relative tolérée des propensions sur un saut tau.
+    seuil_ssa : float
+        Mode hybride : nombre d'événements attendus sous lequel on fait un
+        pas SSA plutôt qu'un saut.
+    parallele : bool
+        Répartit les lots dans un ProcessPoolExecutor.
+    n_processus : int ou None
+        Nombre de processus (None : nombre de cœurs).
+
+    Retour
+    ------
+    dict
+        "temps", "moyenne" et "variance" (tableaux (temps.size, 3)), "n"
+        (nombre de répliques), "ssa" et "sauts" (nombres de pas SSA et de
+        sauts tau, toutes répliques confondues).
+    """
+    if methode not in METHODES_STOCHASTIQUES:
+        raise ValueError(f"Méthode inconnue : {methode} "
+                         f"(choix : {', '.join(METHODES_STOCHASTIQUES)})")
+    temps = np.asarray(temps, dtype=float)
+    tailles = [taille_lot] * (n_repliques // taille_lot)
+    if n_repliques % taille_lot:
+        tailles.append(n_repliques % taille_lot)
+    graines = np.random.SeedSequence(graine).spawn(len(tailles))
+    arguments = [(N0, params, temps, taille, methode, epsilon, seuil_ssa, g)
+                 for taille, g in zip(tailles, graines)]
+
+    if parallele and len(tailles) > 1:
+        with ProcessPoolExecutor(max_workers=n_processus) as executeur:
+            resultats = list(executeur.map(_simuler_lot_tuple, arguments))
+    else:
+        resultats = [_simuler_lot(*a) for a in arguments]
+
+    stats = nouvelles_statistiques(temps.size, len(N0))
+    compteurs = {"ssa": 0, "sauts": 0}
+    for stats_lot, compteurs_lot in resultats:
+        stats = fusionner_statistiques(stats, stats_lot)
+        for cle in compteurs:
+            compteurs[cle] += compteurs_lot[cle]
+    variance = stats["m2"] / max(stats["n"] - 1, 1)
+    return {"temps": temps, "moyenne": stats["moyenne"], "variance": variance,
+            "n": stats["n"], **compteurs}
+
+
+# ========== Vérification et performances ==========
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("Désintégration stochastique X → Y → Z")
+    print("=" * 70)
+
+    # Chaque atome est indépendant : x(t) et y(t) suivent des lois binomiales
+    # de probabilités p_x = e^{-kt} et p_y = k (e^{-kt} - e^{-k2 t}) / (k2 - k)
+    k, k2 = 1.0, 0.1
+    temps = np.linspace(0.0, 20.0, 41)
+    p_x = np.exp(-k * temps)
+    p_y = k * (np.exp(-k * temps) - np.exp(-k2 * temps)) / (k2 - k)
+
+    x0, n_repliques = 100, 20_000
+    print(f"\n📊 {x0} atomes, {n_repliques} répliques : écarts aux lois binomiales "
+          f"(en erreurs types)")
+    for methode in METHODES_STOCHASTIQUES:
+        start = time.perf_counter()
+        resultat = simuler([x0, 0, 0], (k, k2), temps, n_repliques, methode)
+        duree = time.perf_counter() - start
+        erreur_type = np.sqrt(x0 * p_y * (1 - p_y) / n_repliques)[1:]
+        ecart_moyenne = np.max(np.abs(resultat["moyenne"][1:, 1] - x0 * p_y[1:]) / erreur_type)
+        ecart_variance = np.max(np.abs(resultat["variance"][1:, 0] / (x0 * p_x * (1 - p_x))[1:]
+                                       - 1.0)[p_x[1:] > 0.05])
+        print(f"   {methode:<8}: moyenne de y {ecart_moyenne:.1f}σ, variance de x à "
+              f"{ecart_variance:.0%}, {resultat['ssa']:>9} pas SSA, "
+              f"{resultat['sauts']:>8} sauts, {duree:.2f} s")
+
+    # Grandes populations : le coût de SSA croît avec le nombre d'atomes,
+    # pas celui du tau-leaping
+    n_repliques = 1_000
+    print(f"\n📊 Coût selon la population ({n_repliques} répliques)")
+    for x0 in [1_000, 20_000, 10_000_000]:
+        for methode in METHODES_STOCHASTIQUES:
+            if methode == "ssa" and x0 > 20_000:
+                continue
+            start = time.perf_counter()
+            resultat = simuler([x0, 0, 0], (k, k2), temps, n_repliques, methode)
+            duree = time.perf_counter() - start
+            ecart = np.max(np.abs(resultat["moyenne"][:, 1] / x0 - p_y))
+            print(f"   x0 = {x0:<9} {methode:<8}: {duree:6.2f} s, "
+                  f"écart relatif de y moyen {ecart:.1e}")
+
+    # Indépendance vis-à-vis du parallélisme
+    sequentiel = simuler([1000, 0, 0], (k, k2), temps, 8_000, taille_lot=2_000)
+    parallele = simuler([1000, 0, 0], (k, k2), temps, 8_000, taille_lot=2_000,
+                        parallele=True)
+    print(f"\n   Séquentiel / parallèle (4 lots) identiques : "
+          f"{np.array_equal(sequentiel['moyenne'], parallele['moyenne'])}")
+    print("=" * 70)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Intégrateurs symplectiques pour les hamiltoniens séparables H = T(v) + V(x).
+
+Le système est découpé en deux parties :
+    dx/dt = v                   (dérive, « drift »)
+    dv/dt = a(t, x, params)     (impulsion, « kick »)
+
+La méthode de Störmer-Verlet (ordre 2) et ses compositions de Yoshida
+(ordres 4 et 6) conservent une énergie voisine de l'énergie exacte : l'erreur
+sur l'énergie reste bornée au lieu de croître comme avec Euler ou RK4.
+"""
+import numpy as np
+
+
+# Poids des compositions de Yoshida (suite de pas de Verlet de longueur w*dt)
+_W4_1 = 1.0 / (2.0 - 2.0 ** (1.0 / 3.0))
+_W4_0 = -(2.0 ** (1.0 / 3.0)) * _W4_1
+
+_W6_1 = -1.17767998417887
+_W6_2 = 0.235573213359357
+_W6_3 = 0.784513610477560
+_W6_0 = 1.0 - 2.0 * (_W6_1 + _W6_2 + _W6_3)
+
+POIDS = {
+    "verlet": np.array([1.0]),
+    "yoshida4": np.array([_W4_1, _W4_0, _W4_1]),
+    "yoshida6": np.array([_W6_3, _W6_2, _W6_1, _W6_0, _W6_1, _W6_2, _W6_3]),
+}
+
+
+def _composer(t, dt, x, v, a, acceleration, params, poids):
+    """
+    Enchaîne les pas de Verlet (impulsion - dérive - impulsion) de longueurs
+    poids * dt. L'accélération de fin d'un sous-pas sert au début du suivant,
+    d'où un seul appel à acceleration par sous-pas.
+
+    Retour
+    ------
+    x, v, a : ndarray
+        Position, vitesse et accélération au temps t + dt.
+    """
+    for w in poids:
+        h = w * dt
+        v = v + 0.5 * h * a
+        x = x + h * v
+        t = t + h
+        a = acceleration(t, x, params)
+        v = v + 0.5 * h * a
+    return x, v, a
+
+
+def verlet(t, dt, x, v, acceleration, params):
+    """
+    Un pas de Störmer-Verlet (forme « vitesse ») d'ordre 2.
+
+    Paramètres
+    ----------
+    t : float
+        Temps actuel.
+    dt : float
+        Pas de temps.
+    x, v : ndarray ou float
+        Position et vitesse au temps t.
+    acceleration : callable
+        Fonction acceleration(t, x, params) -> dv/dt (ne dépend pas de v).
+    params : float ou ndarray
+        Paramètres physiques.
+
+    Retour
+    ------
+    tuple
+        Position et vitesse au temps t + dt.
+    """
+    a = acceleration(t, x, params)
+    x, v, _ = _composer(t, dt, x, v, a, acceleration, params, POIDS["verlet"])
+    return x, v
+
+
+def yoshida4(t, dt, x, v, acceleration, params):
+    """Un pas de la composition de Yoshida d'ordre 4 (3 sous-pas de Verlet)."""
+    a = acceleration(t, x, params)
+    x, v, _ = _composer(t, dt, x, v, a, acceleration, params, POIDS["yoshida4"])
+    return x, v
+
+
+def yoshida6(t, dt, x, v, acceleration, params):
+    """Un pas de la composition de Yoshida d'ordre 6 (7 sous-pas de Verlet)."""
+    a = acceleration(t, x, params)
+    x, v, _ = _composer(t, dt, x, v, a, acceleration, params, POIDS["yoshida6"])
+    return x, v
+
+
+def integrer_symplectique(acceleration, x0, v0, dt, n_pas, params,
+                          methode="verlet", pas_sortie=1, t0=0.0):
+    """
+    Intègre n_pas pas symplectiques à pas constant.
+
+    L'accélération calculée à la fin d'un pas est réutilisée au début du
+    suivant : chaque sous-pas de Verlet ne coûte qu'un appel à acceleration.
+
+    Paramètres
+    ----------
+    acceleration : callable
+        Fonction acceleration(t, x, params) -> dv/dt.
+    x0, v0 : ndarray ou float
+        Position et vitesse initiales.
+    dt : float
+        Pas de temps.
+    n_pas : int
+        Nombre de pas.
+    params : float ou ndarray
+        Paramètres physiques.
+    methode : str
+        "verlet", "yoshida4" ou "yoshida6".
+    pas_sortie : int
+        On ne conserve qu'un point sur pas_sortie.
+    t0 : float
+        Temps initial.
+
+    Retour
+    ------
+    temps : ndarray
+        Temps des points conservés.
+    X, V : ndarray
+        Positions et vitesses correspondantes.
+    evaluations : int
+        Nombre d'appels à acceleration.
+    """
+    if methode not in POIDS:
+        raise ValueError(f"Méthode inconnue : {methode} (choix : {', '.join(POIDS)})")
+    poids = POIDS[methode]
+
+    x = np.array(x0, dtype=float)
+    v = np.array(v0, dtype=float)
+    n_sortie = n_pas // pas_sortie + 1
+    temps = t0 + dt * pas_sortie * np.arange(n_sortie)
+    X = np.empty((n_sortie,) + x.shape)
+    V = np.empty((n_sortie,) + v.shape)
+    X[0] = x
+    V[0] = v
+
+    a = acceleration(t0, x, params)
+    evaluations = 1
+    j = 1
+    for i in range(n_pas):
+        x, v, a = _composer(t0 + i * dt, dt, x, v, a, acceleration, params, poids)
+        evaluations += poids.size
+        if (i + 1) % pas_sortie == 0:
+            X[j] = x
+            V[j] = v
+            j += 1
+
+    return temps, X, V, evaluations
@@ -0,0 +1,427 @@
+# -*- coding: utf-8 -*-
+"""
+Méthode de Taylor d'ordre élevé par différentiation automatique (jets).
+
+Un jet est le développement de Taylor tronqué d'une fonction du temps,
+u(t0 + s) = u_0 + u_1 s + ... + u_N s^N, rangé dans un tableau de
+coefficients. Les opérations +, -, *, /, ** et les fonctions sin, cos, exp,
+sqrt de ce module agissent directement sur les coefficients (produit de
+Cauchy et récurrences classiques), ce qui permet d'écrire le second membre
+une seule fois, au niveau des expressions :
+
+    def champ(t, y, params):
+        x, v = y
+        return [v, -params**2 * x]
+
+puis d'obtenir tous les coefficients de Taylor de la solution par
+y_{k+1} = f(y)_k / (k + 1). champ n'est appelé qu'une fois par pas : les
+coefficients sont construits un par un, en O(N²) pour l'ordre N. Avec un
+ordre élevé, un seul pas couvre une bonne partie du rayon de convergence de
+la série. Le pas et l'ordre du pas suivant sont choisis à chaque pas
+d'après les derniers coefficients (méthode de Jorba et Zou).
+"""
+import numpy as np
+
+
+# Opérations en attente pendant coefficients_taylor (None : calcul immédiat)
+_bande = None
+
+
+def _constante(autre):
+    """Valeur d'une constante combinée à un jet (scalaire uniquement)."""
+    if np.ndim(autre) != 0:
+        raise TypeError(f"Jet : constante de forme {np.shape(autre)} ; un jet ne porte "
+                        "qu'une composante, utiliser par exemple params[i] plutôt que params")
+    return float(autre)
+
+
+def _avancer(regle, resultats, k):
+    """Calcule les coefficients d'indice k des jets resultats."""
+    valeurs = regle(k, *resultats)
+    if len(resultats) == 1:
+        resultats[0][k] = valeurs
+    else:
+        for c, valeur in zip(resultats, valeurs):
+            c[k] = valeur
+
+
+def _jets(n, regle, m=1):
+    """
+    m jets de n coefficients définis par une récurrence.
+
+    regle(k, *c) renvoie le coefficient k de chaque résultat à partir des
+    coefficients 0..k des opérandes et 0..k-1 des résultats c. Hors de
+    coefficients_taylor, tous les coefficients sont calculés tout de suite ;
+    pendant, la récurrence est mise en attente et avancée d'un coefficient
+    à la fois, au fur et à mesure que ceux de l'état sont connus.
+    """
+    resultats = [np.zeros(n) for _ in range(m)]
+    if _bande is None:
+        for k in range(n):
+            _avancer(regle, resultats, k)
+    else:
+        _bande.append((regle, resultats))
+    jets = [Jet(c) for c in resultats]
+    return jets[0] if m == 1 else jets
+
+
+def _precedents(c, k):
+    """Coefficients c_{k-1}, ..., c_0 (vide pour k = 0)."""
+    return c[k - 1::-1] if k else c[:0]
+
+
+class Jet:
+    """
+    Série de Taylor tronquée u_0 + u_1 s + ... + u_N s^N.
+
+    Les constantes combinées à un jet doivent être scalaires : un jet porte
+    une seule composante de l'état.
+
+    Attributs
+    ---------
+    c : ndarray
+        Coefficients (taille N + 1).
+    """
+
+    __array_priority__ = 1000  # float numpy * Jet utilise Jet.__rmul__
+
+    def __init__(self, coefficients):
+        self.c = np.asarray(coefficients, dtype=float)
+
+    @staticmethod
+    def _coef(autre, n):
+        """Coefficients d'un jet ou d'une constante scalaire, sur n termes."""
+        if isinstance(autre, Jet):
+            return autre.c
+        c = np.zeros(n)
+        c[0] = _constante(autre)
+        return c
+
+    def __add__(self, autre):
+        a, b = self.c, self._coef(autre, self.c.size)
+        return _jets(a.size, lambda k, r: a[k] + b[k])
+
+    __radd__ = __add__
+
+    def __sub__(self, autre):
+        a, b = self.c, self._coef(autre, self.c.size)
+        return _jets(a.size, lambda k, r: a[k] - b[k])
+
+    def __rsub__(self, autre):
+        a, b = self.c, self._coef(autre, self.c.size)
+        return _jets(a.size, lambda k, r: b[k] - a[k])
+
+    def __neg__(self):
+        a = self.c
+        return _jets(a.size, lambda k, r: -a[k])
+
+    def __pos__(self):
+        return self
+
+    def __mul__(self, autre):
+        a = self.c
+        if isinstance(autre, Jet):
+            # Produit de Cauchy : p_k = Σ_{j=0..k} a_j b_{k-j}
+            b = autre.c
+            return _jets(a.size, lambda k, r: np.dot(a[:k + 1], b[k::-1]))
+        s = _constante(autre)
+        return _jets(a.size, lambda k, r: a[k] * s)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, autre):
+        a = self.c
+        if not isinstance(autre, Jet):
+            s = _constante(autre)
+            return _jets(a.size, lambda k, r: a[k] / s)
+        # q = a / b : q_k = (a_k - Σ_{j=1..k} b_j q_{k-j}) / b_0
+        b = autre.c
+        return _jets(a.size,
+                     lambda k, q: (a[k] - np.dot(b[1:k + 1], _precedents(q, k))) / b[0])
+
+    def __rtruediv__(self, autre):
+        return Jet(self._coef(autre, self.c.size)) / self
+
+    def __pow__(self, n):
+        if not (isinstance(n, (int, np.integer)) and n >= 0):
+            raise ValueError("Jet ** n : n doit être un entier positif ou nul")
+        resultat = Jet(self._coef(1.0, self.c.size))
+        for _ in range(n):
+            resultat = resultat * self
+        return resultat
+
+
+def _sin_cos(u):
+    """Jets de sin(u) et cos(u) par récurrence couplée."""
+    def regle(k, s, c):
+        if k == 0:
+            return np.sin(u[0]), np.cos(u[0])
+        ju = np.arange(1, k + 1) * u[1:k + 1]  # j u_j
+        return np.dot(ju, c[k - 1::-1]) / k, -np.dot(ju, s[k - 1::-1]) / k
+    return _jets(u.size, regle, m=2)
+
+
+def sin(u):
+    """Sinus d'un jet ou d'un nombre."""
+    return _sin_cos(u.c)[0] if isinstance(u, Jet) else np.sin(u)
+
+
+def cos(u):
+    """Cosinus d'un jet ou d'un nombre."""
+    return _sin_cos(u.c)[1] if isinstance(u, Jet) else np.cos(u)
+
+
+def exp(u):
+    """Exponentielle d'un jet ou d'un nombre : e_k = Σ j u_j e_{k-j} / k."""
+    if not isinstance(u, Jet):
+        return np.exp(u)
+    a = u.c
+
+    def regle(k, e):
+        if k == 0:
+            return np.exp(a[0])
+        return np.dot(np.arange(1, k + 1) * a[1:k + 1], e[k - 1::-1]) / k
+    return _jets(a.size, regle)
+
+
+def sqrt(u):
+    """Racine carrée d'un jet ou d'un nombre : r² = u résolu terme à terme."""
+    if not isinstance(u, Jet):
+        return np.sqrt(u)
+    a = u.c
+
+    def regle(k, r):
+        if k == 0:
+            return np.sqrt(a[0])
+        return (a[k] - np.dot(r[1:k], r[k - 1:0:-1])) / (2.0 * r[0])
+    return _jets(a.size, regle)
+
+
+def coefficients_taylor(champ, t, y, params, ordre):
+    """
+    Coefficients de Taylor de la solution de dy/dt = champ(t, y, params).
+
+    champ est appelé une seule fois : les opérations qu'il crée sont mises
+    en attente, puis chacune calcule son coefficient k en O(k) dès que le
+    coefficient k de l'état est connu. Le développement coûte O(N²) par
+    opération. champ ne doit donc pas lire les coefficients de ses jets.
+
+    Paramètres
+    ----------
+    champ : callable
+        Second membre écrit avec les opérations des jets ; renvoie une
+        séquence de n composantes.
+    t : float
+        Temps du développement.
+    y : ndarray
+        État au temps t (taille n).
+    params : float, ndarray ou tuple
+        Paramètres physiques transmis à champ.
+    ordre : int
+        Ordre N du développement.
+
+    Retour
+    ------
+    ndarray
+        Tableau (N + 1, n) : la ligne k contient y^(k)(t) / k!.
+    """
+    global _bande
+    n = np.size(y)
+    Y = np.zeros((ordre + 1, n))
+    Y[0] = y
+    temps = np.zeros(ordre + 1)
+    temps[0] = t
+    if ordre >= 1:
+        temps[1] = 1.0
+
+    # Les jets de l'état sont des vues sur les colonnes de Y : ils se
+    # complètent à mesure que Y est rempli
+    _bande = []
+    try:
+        f = champ(Jet(temps), [Jet(Y[:, i]) for i in range(n)], params)
+    finally:
+        bande, _bande = _bande, None
+
+    for k in range(ordre):
+        for regle, resultats in bande:
+            _avancer(regle, resultats, k)
+        for i in range(n):
+            fk = f[i].c[k] if isinstance(f[i], Jet) else (_constante(f[i]) if k == 0 else 0.0)
+            Y[k + 1, i] = fk / (k + 1)
+    return Y
+
+
+def _evaluer(Y, h):
+    """Somme de la série (schéma de Horner) en s = h."""
+    y = Y[-1].copy()
+    for k in range(Y.shape[0] - 2, -1, -1):
+        y = y * h + Y[k]
+    return y
+
+
+def pas_optimal(Y, tol):
+    """
+    Pas de temps d'après les deux derniers coefficients (Jorba et Zou).
+
+    Le pas est choisi pour que les deux derniers termes de la série restent
+    sous la tolérance tol : h = min_j (tol / ||Y_j||)^(1/j), j = N-1, N.
+    """
+    N = Y.shape[0] - 1
+    h = np.inf
+    for j in (N - 1, N):
+        norme = np.max(np.abs(Y[j]))
+        if norme > 0.0:
+            h = min(h, (tol / norme) ** (1.0 / j))
+    return h
+
+
+def choisir_ordre(Y, tol, ordre_min, ordre_max):
+    """
+    Ordre du pas suivant, d'après les coefficients Y du pas courant.
+
+    Un pas d'ordre m coûte O(m²) (récurrences des jets) et avance de h_m,
+    le pas que donnent les coefficients jusqu'à m (pas_optimal) : on garde
+    l'ordre m de [ordre_min, N] qui minimise (m + 1)² / h_m. Si c'est N
+    lui-même, l'ordre augmente de 2, sans dépasser ordre_max.
+    """
+    N = Y.shape[0] - 1
+    j = np.arange(1, N + 1)
+    with np.errstate(divide="ignore"):
+        h = (tol / np.max(np.abs(Y[1:]), axis=1)) ** (1.0 / j)  # inf si Y_j = 0
+    ordres = j[1:]
+    couts = (ordres + 1) ** 2 / np.minimum(h[:-1], h[1:])  # h_m d'après Y_{m-1}, Y_m
+    couts, ordres = couts[ordres >= ordre_min], ordres[ordres >= ordre_min]
+    m = int(ordres[np.argmin(couts)])
+    return min(N + 2, ordre_max) if m == N else m
+
+
+def pas_taylor(t, dt, y, champ, params, ordre=20):
+    """Un pas de Taylor d'ordre fixé, de même usage que rk4()."""
+    return _evaluer(coefficients_taylor(champ, t, y, params, ordre), dt)
+
+
+def taylor(champ, y0, t0, t_fin, params, tol=1e-15, ordre=None, dt_max=np.inf,
+           ordre_max=None):
+    """
+    Intègre dy/dt = champ(t, y, params) par la méthode de Taylor adaptative.
+
+    Paramètres
+    ----------
+    champ : callable
+        Second membre écrit avec les opérations des jets.
+    y0 : ndarray
+        État initial au temps t0.
+    t0, t_fin : float
+        Bornes de l'intégration.
+    params : float, ndarray ou tuple
+        Paramètres physiques transmis à champ.
+    tol : float
+        Tolérance locale, relative à max(1, ||y||).
+    ordre : int ou None
+        Ordre fixe du développement. Par défaut, l'ordre est choisi à chaque
+        pas d'après les derniers coefficients (choisir_ordre), à partir de
+        N = ⌈-ln(tol) / 2⌉ + 1 (Jorba et Zou), qui sert de minimum.
+    dt_max : float
+        Pas maximal.
+    ordre_max : int ou None
+        Ordre maximal en mode adaptatif (par défaut 2 N).
+
+    Retour
+    ------
+    temps : ndarray
+        Temps des pas acceptés (t0 compris, t_fin atteint exactement).
+    Y : ndarray
+        Tableau (temps.size, n) des états.
+    stats : dict
+        "pas" (nombre de pas), "ordre" (ordre moyen), "ordres" (ordre de
+        chaque pas) et "evaluations" (appels à champ, un par pas).
+    """
+    adaptatif = ordre is None
+    if adaptatif:
+        ordre = int(np.ceil(-0.5 * np.log(tol))) + 1
+        ordre_max = 2 * ordre if ordre_max is None else ordre_max
+    ordre = max(ordre, 2)
+    ordre_min = ordre
+
+    t = float(t0)
+    y = np.array(y0, dtype=float)
+    temps, etats = [t], [y.copy()]
+    ordres = []
+    while t < t_fin:
+        Y = coefficients_taylor(champ, t, y, params, ordre)
+        tol_pas = tol * max(1.0, np.max(np.abs(y)))
+        h = pas_optimal(Y, tol_pas)
+        h = min(h, dt_max, t_fin - t)
+        ordres.append(ordre)
+        if adaptatif:
+            ordre = choisir_ordre(Y, tol_pas, ordre_min, ordre_max)
+        y = _evaluer(Y, h)
+        t = t_fin if t + h >= t_fin else t + h
+        temps.append(t)
+        etats.append(y.copy())
+
+    stats = {"pas": len(ordres), "ordre": float(np.mean(ordres)), "ordres": ordres,
+             "evaluations": len(ordres)}
+    return np.array(temps), np.array(etats), stats
+
+
+# ========== Banc : problème de q08 (oscillateur, t_max = 100) ==========
+if __name__ == "__main__":
+    import time
+    from rk4 import rk4
+
+    omega, t_max = 1.0, 100.0
+    y0 = np.array([1.0, 0.0])
+
+    def champ(t, y, params):
+        """Oscillateur harmonique, écrit pour les jets."""
+        x, v = y
+        return [v, -params**2 * x]
+
+    def deriv(t, y, params, out=None):
+        """Même système pour rk4."""
+        dy = np.zeros(2) if out is None else out
+        dy[0] = y[1]
+        dy[1] = -params**2 * y[0]
+        return dy
+
+    def erreur_rk4(dt):
+        """Erreur max de RK4 sur x et durée du calcul, au pas dt."""
+        n_pas = int(round(t_max / dt))
+        dt = t_max / n_pas
+        X = np.empty(n_pas + 1)
+        y = y0.copy()
+        X[0] = y[0]
+        start = time.perf_counter()
+        for i in range(n_pas):
+            y = rk4(i * dt, dt, y, deriv, omega)
+            X[i + 1] = y[0]
+        duree = time.perf_counter() - start
+        return np.max(np.abs(X - np.cos(dt * np.arange(n_pas + 1)))), duree, n_pas
+
+    print("=" * 70)
+    print("Méthode de Taylor contre RK4 à précision égale (q08, t_max = 100)")
+    print("=" * 70)
+
+    for tol in [1e-8, 1e-12]:
+        start = time.perf_counter()
+        temps, Y, stats = taylor(champ, y0, 0.0, t_max, omega, tol=tol)
+        duree_taylor = time.perf_counter() - start
+        erreur_taylor = np.max(np.abs(Y[:, 0] - np.cos(temps)))
+
+        # Pas RK4 donnant la même erreur : prédit par la loi erreur ∝ dt⁴ à
+        # partir d'un essai à dt = 0.1, puis réduit si nécessaire
+        erreur, _, _ = erreur_rk4(0.1)
+        dt = 0.1 * (erreur_taylor / erreur) ** 0.25
+        erreur, duree_rk4, n_pas = erreur_rk4(dt)
+        while erreur > erreur_taylor:
+            dt *= 0.9
+            erreur, duree_rk4, n_pas = erreur_rk4(dt)
+
+        print(f"\n📊 tol = {tol:.0e}")
+        print(f"   Taylor ordre {stats['ordre']:4.1f} : erreur {erreur_taylor:.1e}, "
+              f"{stats['pas']} pas (dt moyen {t_max / stats['pas']:.2f}), {duree_taylor:.3f} s")
+        print(f"   RK4 dt = {dt:.2e} : erreur {erreur:.1e}, "
+              f"{n_pas} pas, {duree_rk4:.3f} s")
+        print(f"   Gain en temps : {duree_rk4 / duree_taylor:.0f}x")
+    print("=" * 70)
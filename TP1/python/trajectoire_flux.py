@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Écriture en flux d'une trajectoire dans un fichier .npy projeté en mémoire.
+
+Les blocs produits par integration.integrer_par_blocs() sont recopiés au fur
+et à mesure dans un fichier .npy ouvert avec np.lib.format.open_memmap : la
+mémoire vive reste bornée par la taille d'un bloc, même pour 10⁹ pas. Le
+fichier se relit ensuite sans tout charger (np.load(..., mmap_mode='r')).
+
+Format : tableau (n_points, 1 + n) dont la colonne 0 contient les temps et
+les colonnes suivantes les composantes de l'état.
+"""
+import numpy as np
+from integration import integrer_par_blocs
+
+
+def ecrire_trajectoire(chemin, blocs, n_points, n_etat):
+    """
+    Recopie des blocs (t, Y) dans un fichier .npy projeté en mémoire.
+
+    Paramètres
+    ----------
+    chemin : str
+        Fichier de sortie (.npy).
+    blocs : itérable de (t, Y)
+        Blocs de la trajectoire, par exemple integrer_par_blocs(...).
+    n_points : int
+        Nombre total de points attendus.
+    n_etat : int
+        Taille de l'état.
+
+    Retour
+    ------
+    int
+        Nombre de points effectivement écrits.
+    """
+    fichier = np.lib.format.open_memmap(chemin, mode="w+", dtype=float,
+                                        shape=(n_points, 1 + n_etat))
+    i = 0
+    for t, Y in blocs:
+        n = t.size
+        fichier[i:i + n, 0] = t
+        fichier[i:i + n, 1:] = Y
+        i += n
+        # Les pages écrites sont rendues au système à chaque bloc
+        fichier.flush()
+    del fichier
+    return i
+
+
+def integrer_vers_fichier(chemin, deriv, y0, t0, dt, n_pas, params, methode="rk4",
+                          pas_sortie=1, taille_bloc=100_000):
+    """
+    Intègre n_pas pas constants et écrit la trajectoire dans chemin (.npy).
+
+    Mêmes paramètres que integration.integrer_par_blocs().
+
+    Retour
+    ------
+    int
+        Nombre de points écrits (n_pas // pas_sortie + 1).
+    """
+    y0 = np.asarray(y0, dtype=float)
+    n_points = n_pas // pas_sortie + 1
+    blocs = integrer_par_blocs(deriv, y0, t0, dt, n_pas, params, methode,
+                               pas_sortie, taille_bloc)
+    return ecrire_trajectoire(chemin, blocs, n_points, y0.size)
+
+
+def lire_trajectoire(chemin):
+    """
+    Relit paresseusement une trajectoire écrite par ecrire_trajectoire().
+
+    Retour
+    ------
+    t : ndarray (memmap)
+        Temps des points.
+    Y : ndarray (memmap)
+        Tableau (n_points, n) des états ; seules les parties effectivement
+        lues sont chargées en mémoire.
+    """
+    donnees = np.load(chemin, mmap_mode="r")
+    return donnees[:, 0], donnees[:, 1:]
+
+
+def parcourir_trajectoire(chemin, taille_bloc=1_000_000):
+    """
+    Parcourt une trajectoire enregistrée bloc par bloc.
+
+    Retour
+    ------
+    générateur de (t, Y)
+        Blocs lus dans le fichier, de taille au plus taille_bloc.
+    """
+    t, Y = lire_trajectoire(chemin)
+    for debut in range(0, t.size, taille_bloc):
+        yield t[debut:debut + taille_bloc], Y[debut:debut + taille_bloc]
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Pilote d'intégration d'une trajectoire complète.
+
+integrer() remplace la boucle « for i in range(n_points) » écrite dans chaque
+question : elle avance l'état sur toute une grille de temps avec euler ou
+rk4 et renvoie les tableaux (t, Y) préalloués. Si deriv est compilée avec
+numba (@njit), toute la boucle temporelle s'exécute dans un noyau compilé ;
+sinon on retombe sur la boucle Python avec les fonctions de rk4.py.
+
+integrer_par_blocs() fait de même à pas constant pour les très longues
+simulations, en produisant la trajectoire bloc par bloc.
+"""
+import numpy as np
+from rk4 import rk4, euler
+
+try:
+    from numba import njit
+    NUMBA_OK = True
+except Exception:
+    NUMBA_OK = False
+
+
+# Codes des méthodes (entiers pour pouvoir être passés au noyau numba)
+METHODES = {"euler": 0, "rk4": 1}
+
+
+def est_compilee(deriv):
+    """Indique si deriv est une fonction compilée par numba (@njit)."""
+    return NUMBA_OK and hasattr(deriv, "py_func")
+
+
+if NUMBA_OK:
+    @njit
+    def _pas_euler_nb(t, dt, y, deriv, params):
+        """Un pas d'Euler compilé."""
+        return y + dt * deriv(t, y, params)
+
+
+    @njit
+    def _pas_rk4_nb(t, dt, y, deriv, params):
+        """Un pas de RK4 compilé (mêmes étapes que rk4.rk4)."""
+        demi_pas = dt / 2.0
+        d1 = deriv(t, y, params)
+        yp = y + d1 * demi_pas
+        d2 = deriv(t + demi_pas, yp, params)
+        yp = y + d2 * demi_pas
+        d3 = deriv(t + demi_pas, yp, params)
+        yp = y + d3 * dt
+        d4 = deriv(t + dt, yp, params)
+        return y + dt * (d1 + 2 * d2 + 2 * d3 + d4) / 6.0
+
+
+    @njit
+    def _integrer_nb(deriv, y0, temps, params, methode, pas_sortie, Y):
+        """Boucle temporelle complète, compilée ; remplit Y sur place."""
+        y = y0.copy()
+        Y[0] = y
+        j = 1
+        for i in range(temps.size - 1):
+            t = temps[i]
+            dt = temps[i + 1] - t
+            if methode == 0:
+                y = _pas_euler_nb(t, dt, y, deriv, params)
+            else:
+                y = _pas_rk4_nb(t, dt, y, deriv, params)
+            if (i + 1) % pas_sortie == 0:
+                Y[j] = y
+                j += 1
+
+
+    @njit
+    def _integrer_uniforme_nb(deriv, y, t0, dt, n_pas, params, methode, pas_sortie, Y):
+        """
+        n_pas pas constants depuis l'état y au temps t0, compilés ; les états
+        conservés remplissent Y sur place. Renvoie l'état final.
+        """
+        y = y.copy()
+        j = 0
+        for i in range(n_pas):
+            t = t0 + i * dt
+            if methode == 0:
+                y = _pas_euler_nb(t, dt, y, deriv, params)
+            else:
+                y = _pas_rk4_nb(t, dt, y, deriv, params)
+            if (i + 1) % pas_sortie == 0:
+                Y[j] = y
+                j += 1
+        return y
+
+
+def _integrer_python(deriv, y0, temps, params, methode, pas_sortie, Y):
+    """Même boucle que _integrer_nb, en Python, avec euler/rk4 de rk4.py."""
+    pas = euler if methode == 0 else rk4
+    y = np.copy(y0)
+    Y[0] = y
+    j = 1
+    for i in range(temps.size - 1):
+        t = temps[i]
+        y = pas(t, temps[i + 1] - t, y, deriv, params)
+        if (i + 1) % pas_sortie == 0:
+            Y[j] = y
+            j += 1
+
+
+def _integrer_uniforme_python(deriv, y, t0, dt, n_pas, params, methode, pas_sortie, Y):
+    """Même boucle que _integrer_uniforme_nb, en Python."""
+    pas = euler if methode == 0 else rk4
+    y = np.copy(y)
+    j = 0
+    for i in range(n_pas):
+        y = pas(t0 + i * dt, dt, y, deriv, params)
+        if (i + 1) % pas_sortie == 0:
+            Y[j] = y
+            j += 1
+    return y
+
+
+def integrer(deriv, y0, temps, params, methode="rk4", pas_sortie=1):
+    """
+    Intègre dy/dt = deriv(t, y, params) sur toute la grille de temps.
+
+    Paramètres
+    ----------
+    deriv : callable
+        Fonction deriv(t, y, params) -> dy. Si elle est décorée par @njit,
+        la boucle entière est compilée par numba.
+    y0 : ndarray
+        État initial au temps temps[0].
+    temps : ndarray
+        Grille des temps (croissante, pas éventuellement variable).
+    params : float, ndarray ou tuple
+        Paramètres physiques transmis à deriv.
+    methode : str
+        "euler" ou "rk4".
+    pas_sortie : int
+        On ne conserve qu'un point sur pas_sortie (le premier est toujours
+        gardé), ce qui évite de stocker chaque pas des longues simulations.
+
+    Retour
+    ------
+    t : ndarray
+        Temps des points conservés, égal à temps[::pas_sortie].
+    Y : ndarray
+        Tableau (t.size, n) des états correspondants.
+    """
+    if methode not in METHODES:
+        raise ValueError(f"Méthode inconnue : {methode} (choix : {', '.join(METHODES)})")
+    if pas_sortie < 1:
+        raise ValueError("pas_sortie doit être un entier ≥ 1")
+
+    temps = np.asarray(temps, dtype=float)
+    y0 = np.asarray(y0, dtype=float)
+    t_sortie = temps[::pas_sortie]
+    Y = np.empty((t_sortie.size, y0.size))
+
+    if est_compilee(deriv):
+        _integrer_nb(deriv, y0, temps, params, METHODES[methode], pas_sortie, Y)
+    else:
+        _integrer_python(deriv, y0, temps, params, METHODES[methode], pas_sortie, Y)
+
+    return t_sortie, Y
+
+
+def integrer_par_blocs(deriv, y0, t0, dt, n_pas, params, methode="rk4",
+                       pas_sortie=1, taille_bloc=100_000):
+    """
+    Intègre n_pas pas constants en produisant la trajectoire par blocs.
+
+    Contrairement à integrer(), aucune grille de temps ni aucun tableau de
+    toute la trajectoire n'est alloué : la mémoire utilisée est bornée par la
+    taille d'un bloc, quel que soit n_pas (10⁹ pas et plus).
+
+    Paramètres
+    ----------
+    deriv : callable
+        Fonction deriv(t, y, params) -> dy (compilée par numba si @njit).
+    y0 : ndarray
+        État initial au temps t0.
+    t0, dt : float
+        Temps initial et pas de temps.
+    n_pas : int
+        Nombre total de pas.
+    params : float, ndarray ou tuple
+        Paramètres physiques transmis à deriv.
+    methode : str
+        "euler" ou "rk4".
+    pas_sortie : int
+        On ne conserve qu'un point sur pas_sortie.
+    taille_bloc : int
+        Nombre maximal de points conservés par bloc.
+
+    Retour
+    ------
+    générateur de (t, Y)
+        Blocs successifs ; le premier ne contient que l'état initial. Au
+        total n_pas // pas_sortie + 1 points sont produits (les pas situés
+        après le dernier point conservé ne sont pas calculés). Le tableau Y
+        est réutilisé d'un bloc à l'autre : il faut le consommer ou le
+        copier avant de demander le bloc suivant.
+    """
+    if methode not in METHODES:
+        raise ValueError(f"Méthode inconnue : {methode} (choix : {', '.join(METHODES)})")
+    if pas_sortie < 1 or taille_bloc < 1:
+        raise ValueError("pas_sortie et taille_bloc doivent être des entiers ≥ 1")
+
+    y = np.array(y0, dtype=float)
+    noyau = _integrer_uniforme_nb if est_compilee(deriv) else _integrer_uniforme_python
+    dt_sortie = dt * pas_sortie
+
+    # Premier bloc : l'état initial
+    yield np.array([t0]), y[np.newaxis, :].copy()
+
+    n_sortie = n_pas // pas_sortie
+    Y = np.empty((min(taille_bloc, n_sortie), y.size))
+    k = 0  # nombre de points déjà produits après l'état initial
+    while k < n_sortie:
+        n_bloc = min(taille_bloc, n_sortie - k)
+        bloc = Y[:n_bloc]
+        y = noyau(deriv, y, t0 + k * dt_sortie, dt, n_bloc * pas_sortie,
+                  params, METHODES[methode], pas_sortie, bloc)
+        k += n_bloc
+        t = t0 + dt_sortie * np.arange(k - n_bloc + 1, k + 1)
+        yield t, bloc
@@ -14,12 +14,12 @@ import matplotlib.pyplot as plt
 import sys
 import os
 
-# Ajouter le chemin pour importer rk4
+# Ajouter le chemin pour importer le pilote d'intégration
 sys.path.append(os.path.dirname(__file__))
-from rk4 import rk4
+from integration import integrer
 
 
-def deriv_pendule_lineaire(t, y, params):
+def deriv_pendule_lineaire(t, y, params, out=None):
     """
     Calcule les dérivées pour le pendule linéarisé.
     
@@ -37,7 +37,7 @@ def deriv_pendule_lineaire(t, y, params):
         dy[1] = d²θ/dt² = -q*y[1] - Ω²*y[0]
     """
     Omega, q = params
-    dy = np.empty(2)
+    dy = np.empty(2) if out is None else out
     dy[0] = y[1]                           # dθ/dt
     dy[1] = -q * y[1] - Omega**2 * y[0]    # d²θ/dt²
     return dy
@@ -71,23 +71,11 @@ def simuler_pendule(q, Omega=1.0, theta0_deg=10.0, omega0=0.0, dt=0.05, t_max=20
     # Nombre de pas de temps
     n_steps = int(t_max / dt)
     
-    # Tableaux pour stocker les résultats
-    t_array = np.zeros(n_steps + 1)
-    theta_array = np.zeros(n_steps + 1)
+    # Intégration sur toute la grille de temps
+    t_array = dt * np.arange(n_steps + 1)
+    t_array, Y = integrer(deriv_pendule_lineaire, y, t_array, params, methode="rk4")
     
-    # Conditions initiales
-    t_array[0] = 0.0
-    theta_array[0] = theta0
-    
-    # Boucle d'intégration
-    t = 0.0
-    for i in range(n_steps):
-        y = rk4(t, dt, y, deriv_pendule_lineaire, params)
-        t += dt
-        t_array[i + 1] = t
-        theta_array[i + 1] = y[0]
-    
-    return t_array, theta_array
+    return t_array, Y[:, 0]
 
 
 def main():
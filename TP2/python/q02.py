@@ -16,12 +16,12 @@ import matplotlib.pyplot as plt
 import sys
 import os
 
-# Ajouter le chemin pour importer rk4
+# Ajouter le chemin pour importer le pilote d'intégration
 sys.path.append(os.path.dirname(__file__))
-from rk4 import rk4
+from integration import integrer
 
 
-def deriv_pendule_excite(t, y, params):
+def deriv_pendule_excite(t, y, params, out=None):
     """
     Calcule les dérivées pour le pendule linéarisé avec excitation.
     
@@ -39,7 +39,7 @@ def deriv_pendule_excite(t, y, params):
         dy[1] = d²θ/dt² = -q*y[1] - Ω²*y[0] + Fe*sin(Ωe*t)
     """
     Omega, q, Fe, Omega_e = params
-    dy = np.empty(2)
+    dy = np.empty(2) if out is None else out
     dy[0] = y[1]                                                    # dθ/dt
     dy[1] = -q * y[1] - Omega**2 * y[0] + Fe * np.sin(Omega_e * t)  # d²θ/dt²
     return dy
@@ -80,23 +80,11 @@ def simuler_pendule_excite(q, Fe, Omega=1.0, Omega_e=None, theta0_deg=10.0,
     # Nombre de pas de temps
     n_steps = int(t_max / dt)
     
-    # Tableaux pour stocker les résultats
-    theta_array = np.zeros(n_steps + 1)
-    omega_array = np.zeros(n_steps + 1)
+    # Intégration sur toute la grille de temps
+    t_array = dt * np.arange(n_steps + 1)
+    _, Y = integrer(deriv_pendule_excite, y, t_array, params, methode="rk4")
     
-    # Conditions initiales
-    theta_array[0] = theta0
-    omega_array[0] = omega0
-    
-    # Boucle d'intégration
-    t = 0.0
-    for i in range(n_steps):
-        y = rk4(t, dt, y, deriv_pendule_excite, params)
-        t += dt
-        theta_array[i + 1] = y[0]
-        omega_array[i + 1] = y[1]
-    
-    return theta_array, omega_array
+    return Y[:, 0], Y[:, 1]
 
 
 def main():
@@ -7,19 +7,32 @@ On résout l'équation différentielle non-linéaire :
 
 On étudie le comportement pour différentes amplitudes d'excitation Fe.
 L'angle θ est maintenu dans l'intervalle [-π, π].
+
+La trajectoire est produite par blocs (integration.integrer_par_blocs) :
+avec un chemin de fichier, elle est écrite en flux dans un .npy projeté en
+mémoire (trajectoire_flux.py) et relue paresseusement, ce qui permet des
+simulations de 10⁹ pas à mémoire bornée.
+
+simuler_pendule_parareal découpe une simulation longue en tranches
+intégrées en parallèle (parareal.py). Elle converge en quelques itérations
+en régime périodique, mais pas en régime chaotique (Fe = 1.5), où le calcul
+redevient séquentiel.
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
 import sys
 import os
+import tempfile
 
-# Ajouter le chemin pour importer rk4
+# Ajouter le chemin pour importer le pilote d'intégration
 sys.path.append(os.path.dirname(__file__))
-from rk4 import rk4
+from integration import integrer_par_blocs
+from trajectoire_flux import ecrire_trajectoire, lire_trajectoire, parcourir_trajectoire
+from parareal import parareal
 
 
-def deriv_pendule_non_lineaire(t, y, params):
+def deriv_pendule_non_lineaire(t, y, params, out=None):
     """
     Calcule les dérivées pour le pendule non-linéaire avec excitation.
     
@@ -37,7 +50,7 @@ def deriv_pendule_non_lineaire(t, y, params):
         dy[1] = d²θ/dt² = -q*y[1] - Ω²*sin(y[0]) + Fe*sin(Ωe*t)
     """
     Omega, q, Fe, Omega_e = params
-    dy = np.empty(2)
+    dy = np.empty(2) if out is None else out
     dy[0] = y[1]                                                          # dθ/dt
     dy[1] = -q * y[1] - Omega**2 * np.sin(y[0]) + Fe * np.sin(Omega_e * t)  # d²θ/dt²
     return dy
@@ -45,7 +58,7 @@ def deriv_pendule_non_lineaire(t, y, params):
 
 def maintenir_angle_dans_intervalle(theta):
     """
-    Maintient l'angle dans l'intervalle [-π, π].
+    Maintient l'angle (ou chaque angle d'un tableau) dans l'intervalle [-π, π].
     
     Paramètre :
         theta : angle (rad)
@@ -53,16 +66,15 @@ def maintenir_angle_dans_intervalle(theta):
     Retour :
         angle normalisé dans [-π, π]
     """
-    while theta > np.pi:
-        theta -= 2 * np.pi
-    while theta < -np.pi:
-        theta += 2 * np.pi
+    theta = np.where(theta > np.pi, theta - 2 * np.pi * np.ceil((theta - np.pi) / (2 * np.pi)), theta)
+    theta = np.where(theta < -np.pi, theta + 2 * np.pi * np.ceil((-np.pi - theta) / (2 * np.pi)), theta)
     return theta
 
 
 def simuler_pendule_non_lineaire(Fe, q=0.5, Omega=1.0, Omega_e=None, 
                                   theta0_deg=10.0, omega0=0.0, 
-                                  dt=0.05, t_max=100.0):
+                                  dt=0.05, t_max=100.0, chemin=None, pas_sortie=1,
+                                  taille_bloc=100_000):
     """
     Simule le pendule non-linéaire avec excitation.
     
@@ -75,10 +87,13 @@ def simuler_pendule_non_lineaire(Fe, q=0.5, Omega=1.0, Omega_e=None,
         omega0 : vitesse angulaire initiale (rad/s)
         dt : pas de temps (s)
         t_max : temps final (s)
+        chemin : fichier .npy où écrire la trajectoire en flux (None : en mémoire)
+        pas_sortie : on ne conserve qu'un point sur pas_sortie
+        taille_bloc : nombre maximal de points par bloc (mémoire utilisée)
     
     Retour :
-        t_array : tableau des temps
-        theta_array : tableau des angles θ(t)
+        t_array : tableau des temps (projeté en mémoire si chemin est donné)
+        theta_array : tableau des angles θ(t), dans [-π, π]
     """
     # Pulsation excitatrice par défaut
     if Omega_e is None:
@@ -96,29 +111,53 @@ def simuler_pendule_non_lineaire(Fe, q=0.5, Omega=1.0, Omega_e=None,
     # Nombre de pas de temps
     n_steps = int(t_max / dt)
     
-    # Tableaux pour stocker les résultats
-    t_array = np.zeros(n_steps + 1)
-    theta_array = np.zeros(n_steps + 1)
-    
-    # Conditions initiales
-    t_array[0] = 0.0
-    theta_array[0] = theta0
+    # Intégration RK4 par blocs ; θ est ramené dans [-π, π] sur les points
+    # conservés (sin est 2π-périodique : la dynamique n'en dépend pas)
+    def blocs():
+        for t, Y in integrer_par_blocs(deriv_pendule_non_lineaire, y, 0.0, dt, n_steps,
+                                       params, "rk4", pas_sortie, taille_bloc):
+            Y[:, 0] = maintenir_angle_dans_intervalle(Y[:, 0])
+            yield t, Y
     
-    # Boucle d'intégration
-    t = 0.0
-    for i in range(n_steps):
-        y = rk4(t, dt, y, deriv_pendule_non_lineaire, params)
-        t += dt
-        
-        # Maintenir θ dans [-π, π]
-        y[0] = maintenir_angle_dans_intervalle(y[0])
-        
-        t_array[i + 1] = t
-        theta_array[i + 1] = y[0]
+    if chemin is not None:
+        ecrire_trajectoire(chemin, blocs(), n_steps // pas_sortie + 1, y.size)
+        t_array, Y = lire_trajectoire(chemin)
+        return t_array, Y[:, 0]
     
+    morceaux = [(t, Y[:, 0].copy()) for t, Y in blocs()]
+    t_array = np.concatenate([t for t, _ in morceaux])
+    theta_array = np.concatenate([theta for _, theta in morceaux])
     return t_array, theta_array
 
 
+def simuler_pendule_parareal(Fe, q=0.5, Omega=1.0, Omega_e=None,
+                             theta0_deg=10.0, omega0=0.0, dt=0.05, t_max=100.0,
+                             n_tranches=16, dt_grossier=0.5, tol=1e-8):
+    """
+    Simule le pendule non-linéaire par Parareal (tranches de temps en parallèle).
+    
+    Paramètres :
+        Fe, q, Omega, Omega_e, theta0_deg, omega0, dt, t_max : comme
+            simuler_pendule_non_lineaire (dt est le pas du propagateur fin)
+        n_tranches : nombre de tranches de temps
+        dt_grossier : pas du propagateur grossier (s)
+        tol : critère d'arrêt sur la correction des états de début de tranche
+    
+    Retour :
+        temps : bornes des tranches
+        theta : angles θ aux bornes des tranches, dans [-π, π]
+        infos : itérations effectuées, corrections et convergence (voir parareal)
+    """
+    if Omega_e is None:
+        Omega_e = 2.0 * Omega / 3.0
+    y = np.array([np.radians(theta0_deg), omega0])
+    params = np.array([Omega, q, Fe, Omega_e])
+    
+    temps, U, infos = parareal(deriv_pendule_non_lineaire, y, 0.0, t_max, params,
+                               n_tranches, dt, dt_grossier, tol=tol)
+    return temps, maintenir_angle_dans_intervalle(U[:, 0]), infos
+
+
 def main():
     """
     Programme principal : étudie le comportement chaotique pour différents Fe
@@ -182,6 +221,41 @@ def main():
     print("• Fe = 1.5 rad/s²   : comportement chaotique marqué")
     print("\nLa période du mouvement change avec Fe et devient irrégulière (non sinusoïdale)")
     print("pour les valeurs élevées, caractéristique d'un système chaotique.")
+    
+    # Simulation longue écrite en flux : la mémoire reste bornée par un bloc,
+    # t_max peut être augmenté jusqu'à 10⁹ pas
+    t_long, pas_sortie = 2000.0, 10
+    chemin = os.path.join(tempfile.gettempdir(), 'q03_trajectoire.npy')
+    simuler_pendule_non_lineaire(Fe=1.5, q=q, Omega=Omega, Omega_e=Omega_e,
+                                 theta0_deg=theta0_deg, omega0=omega0, dt=dt,
+                                 t_max=t_long, chemin=chemin, pas_sortie=pas_sortie)
+    n_points, theta_max = 0, 0.0
+    for _, Y in parcourir_trajectoire(chemin, taille_bloc=10_000):
+        n_points += Y.shape[0]
+        theta_max = max(theta_max, float(np.max(np.abs(Y[:, 0]))))
+    print(f"\nSimulation longue (Fe = 1.5, t_max = {t_long:.0f} s, un point sur {pas_sortie}) :")
+    print(f"  {n_points} points écrits dans {chemin}, relus par blocs (|θ| max = {theta_max:.3f} rad)")
+    
+    # Parareal : gain en régime périodique, aucun en régime chaotique
+    t_parareal, n_tranches = 400.0, 16
+    print(f"\nParareal (t_max = {t_parareal:.0f} s, {n_tranches} tranches, "
+          f"{os.cpu_count()} cœur(s)) :")
+    for Fe in (1.4, 1.5):
+        _, theta_seq = simuler_pendule_non_lineaire(Fe=Fe, q=q, Omega=Omega, Omega_e=Omega_e,
+                                                    theta0_deg=theta0_deg, omega0=omega0,
+                                                    dt=dt, t_max=t_parareal)
+        _, theta_par, infos = simuler_pendule_parareal(Fe=Fe, q=q, Omega=Omega,
+                                                       Omega_e=Omega_e,
+                                                       theta0_deg=theta0_deg,
+                                                       omega0=omega0, dt=dt,
+                                                       t_max=t_parareal,
+                                                       n_tranches=n_tranches)
+        ecart = abs(maintenir_angle_dans_intervalle(theta_par[-1] - theta_seq[-1]))
+        print(f"  Fe = {Fe} : {infos['iterations']} itération(s), écart final au "
+              f"séquentiel {ecart:.1e} rad, gain idéal "
+              f"{n_tranches / infos['iterations']:.1f}x")
+    print("  En régime chaotique, il faut autant d'itérations que de tranches, et les")
+    print("  arrondis de la grille des tranches suffisent à séparer les trajectoires.")
 
 
 if __name__ == "__main__":
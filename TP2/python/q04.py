@@ -16,30 +16,30 @@ import os
 
 # Ajouter le chemin pour importer rk4
 sys.path.append(os.path.dirname(__file__))
-from rk4 import rk4
+from rk4 import rk4_ensemble
 
 
-def deriv_pendule_non_lineaire(t, y, params):
+def deriv_pendule_non_lineaire(t, y, params, out=None):
     """
     Calcule les dérivées pour le pendule non-linéaire avec excitation.
     
     Équation : d²θ/dt² + q*dθ/dt + Ω²*sin(θ) = Fe*sin(Ωe*t)
+    
+    y peut être un seul état [θ, dθ/dt] ou un ensemble (n_membres, 2).
     """
     Omega, q, Fe, Omega_e = params
-    dy = np.empty(2)
-    dy[0] = y[1]
-    dy[1] = -q * y[1] - Omega**2 * np.sin(y[0]) + Fe * np.sin(Omega_e * t)
+    dy = np.empty_like(y) if out is None else out
+    dy[..., 0] = y[..., 1]
+    dy[..., 1] = -q * y[..., 1] - Omega**2 * np.sin(y[..., 0]) + Fe * np.sin(Omega_e * t)
     return dy
 
 
 def maintenir_angle_dans_intervalle(theta):
     """
-    Maintient l'angle dans l'intervalle [-π, π].
+    Maintient l'angle (ou chaque angle d'un tableau) dans l'intervalle [-π, π].
     """
-    while theta > np.pi:
-        theta -= 2 * np.pi
-    while theta < -np.pi:
-        theta += 2 * np.pi
+    theta = np.where(theta > np.pi, theta - 2 * np.pi * np.ceil((theta - np.pi) / (2 * np.pi)), theta)
+    theta = np.where(theta < -np.pi, theta + 2 * np.pi * np.ceil((-np.pi - theta) / (2 * np.pi)), theta)
     return theta
 
 
@@ -73,9 +73,9 @@ def simuler_pendule_deux_conditions(theta0_1_deg, theta0_2_deg, Fe=1.5,
     theta0_1 = np.radians(theta0_1_deg)
     theta0_2 = np.radians(theta0_2_deg)
     
-    # Conditions initiales pour les deux simulations
-    y1 = np.array([theta0_1, omega0])
-    y2 = np.array([theta0_2, omega0])
+    # Conditions initiales : les deux simulations forment un ensemble à 2 membres
+    Y = np.array([[theta0_1, omega0],
+                  [theta0_2, omega0]])
     
     # Paramètres physiques
     params = np.array([Omega, q, Fe, Omega_e])
@@ -96,18 +96,16 @@ def simuler_pendule_deux_conditions(theta0_1_deg, theta0_2_deg, Fe=1.5,
     # Boucle d'intégration
     t = 0.0
     for i in range(n_steps):
-        # Intégration des deux systèmes
-        y1 = rk4(t, dt, y1, deriv_pendule_non_lineaire, params)
-        y2 = rk4(t, dt, y2, deriv_pendule_non_lineaire, params)
+        # Intégration des deux systèmes en un seul appel
+        Y = rk4_ensemble(t, dt, Y, deriv_pendule_non_lineaire, params)
         t += dt
         
         # Maintenir θ dans [-π, π] pour les deux systèmes
-        y1[0] = maintenir_angle_dans_intervalle(y1[0])
-        y2[0] = maintenir_angle_dans_intervalle(y2[0])
+        Y[:, 0] = maintenir_angle_dans_intervalle(Y[:, 0])
         
         t_array[i + 1] = t
-        theta1_array[i + 1] = y1[0]
-        theta2_array[i + 1] = y2[0]
+        theta1_array[i + 1] = Y[0, 0]
+        theta2_array[i + 1] = Y[1, 0]
     
     return t_array, theta1_array, theta2_array
 
@@ -12,30 +12,65 @@ import matplotlib.pyplot as plt
 import sys
 import os
 
-# Ajouter le chemin pour importer rk4
+# Ajouter le chemin pour importer le pilote d'intégration
 sys.path.append(os.path.dirname(__file__))
-from rk4 import rk4
+# autoreglage.py n'existe qu'en un exemplaire, dans TP1
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "TP1", "python"))
+from integration import integrer, NUMBA_OK
+from autoreglage import dispatcheur, ordre_grandeur
 
+if NUMBA_OK:
+    from numba import njit
 
-def deriv_pendule_non_lineaire(t, y, params):
+
+def deriv_pendule_non_lineaire(t, y, params, out=None):
     """
     Calcule les dérivées pour le pendule non-linéaire avec excitation.
     """
     Omega, q, Fe, Omega_e = params
-    dy = np.empty(2)
+    dy = np.empty(2) if out is None else out
     dy[0] = y[1]
     dy[1] = -q * y[1] - Omega**2 * np.sin(y[0]) + Fe * np.sin(Omega_e * t)
     return dy
 
 
+def _stroboscope_python(y, temps, params, pas_sortie):
+    return integrer(deriv_pendule_non_lineaire, y, temps, params,
+                    methode="rk4", pas_sortie=pas_sortie)[1]
+
+
+VARIANTES = {"python": _stroboscope_python}
+if NUMBA_OK:
+    # Avec deriv compilée, integrer() exécute toute la boucle dans un noyau numba
+    deriv_pendule_nb = njit(deriv_pendule_non_lineaire)
+
+    def _stroboscope_numba(y, temps, params, pas_sortie):
+        return integrer(deriv_pendule_nb, y, temps, params,
+                        methode="rk4", pas_sortie=pas_sortie)[1]
+
+    VARIANTES["numba"] = _stroboscope_numba
+
+
+def _signature(y, temps, params, pas_sortie):
+    return f"pas=2^{ordre_grandeur(temps.size - 1)}"
+
+
+def _essai(y, temps, params, pas_sortie):
+    # 2000 pas suffisent à comparer les variantes
+    n = min(temps.size - 1, 2000)
+    return y, temps[:n + 1], params, n
+
+
+# États aux instants temps[::pas_sortie], par la variante la plus rapide
+stroboscope = dispatcheur("tp2_stroboscope", VARIANTES, _signature, _essai)
+
+
 def maintenir_angle_dans_intervalle(theta):
     """
-    Maintient l'angle dans l'intervalle [-π, π].
+    Maintient l'angle (ou chaque angle d'un tableau) dans l'intervalle [-π, π].
     """
-    while theta > np.pi:
-        theta -= 2 * np.pi
-    while theta < -np.pi:
-        theta += 2 * np.pi
+    theta = np.where(theta > np.pi, theta - 2 * np.pi * np.ceil((theta - np.pi) / (2 * np.pi)), theta)
+    theta = np.where(theta < -np.pi, theta + 2 * np.pi * np.ceil((-np.pi - theta) / (2 * np.pi)), theta)
     return theta
 
 
@@ -92,28 +127,23 @@ def calculer_diagramme_bifurcation(Fe_min, Fe_max, n_Fe, q=0.5, Omega=1.0,
         y = np.array([theta0, omega0])
         params = np.array([Omega, q, Fe, Omega_e])
         
-        # Phase 1 : Éliminer le régime transitoire
-        t = 0.0
+        # Phase 1 : Éliminer le régime transitoire (seul l'état final est gardé)
         n_steps_transitoire = int(n_transitoire * T_e / dt)
-        for _ in range(n_steps_transitoire):
-            y = rk4(t, dt, y, deriv_pendule_non_lineaire, params)
-            t += dt
-            y[0] = maintenir_angle_dans_intervalle(y[0])
+        temps = dt * np.arange(n_steps_transitoire + 1)
+        Y = stroboscope(y, temps, params, n_steps_transitoire)
+        y = Y[-1]
+        t = temps[-1]
         
         # Phase 2 : Mesurer θ à des instants multiples de la période T_e
-        # On cherche à mesurer quand t ≈ n*T_e (n entier)
+        # On cherche à mesurer quand t ≈ n*T_e (n entier) : on ne garde
+        # qu'un point toutes les n_steps_per_period itérations
         n_steps_per_period = int(T_e / dt)
+        temps = t + dt * np.arange(n_mesure * n_steps_per_period + 1)
+        Y = stroboscope(y, temps, params, n_steps_per_period)
         
-        for _ in range(n_mesure):
-            # Intégrer sur une période complète
-            for _ in range(n_steps_per_period):
-                y = rk4(t, dt, y, deriv_pendule_non_lineaire, params)
-                t += dt
-                y[0] = maintenir_angle_dans_intervalle(y[0])
-            
-            # Enregistrer la valeur de θ à cet instant "stroboscopique"
-            Fe_list.append(Fe)
-            theta_list.append(y[0])
+        # Enregistrer les valeurs de θ aux instants "stroboscopiques"
+        Fe_list.extend([Fe] * n_mesure)
+        theta_list.extend(maintenir_angle_dans_intervalle(Y[1:, 0]))
     
     return np.array(Fe_list), np.array(theta_list)
 
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+TP3 - Noyaux numba partagés par q08.py et q11.py
+
+Les fonctions sont compilées avec @njit(cache=True) : le code machine est
+enregistré sur disque (dans __pycache__) au premier lancement puis relu par
+les lancements suivants, au lieu d'être recompilé à chaque démarrage de
+processus (run_all.py lance un processus par question).
+"""
+
+import time
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_OK = True
+except Exception:
+    NUMBA_OK = False
+
+
+def chronometrer(fonction, *args):
+    """
+    Exécute fonction(*args) et mesure sa durée.
+
+    Retour :
+        (résultat, durée en secondes)
+    """
+    debut = time.perf_counter()
+    resultat = fonction(*args)
+    return resultat, time.perf_counter() - debut
+
+
+def afficher_rapport_demarrage(duree_import, duree_compilation, duree_calcul):
+    """
+    Affiche la répartition du temps de démarrage et de calcul.
+
+    Paramètres :
+        duree_import : temps d'import de numba et des noyaux (s)
+        duree_compilation : choix de la variante par autoreglage.py, c'est-à-dire
+                            mesures et compilation, ou relecture des caches
+                            disque (s)
+        duree_calcul : temps du calcul proprement dit (s)
+    """
+    print("\n=== Rapport de démarrage ===")
+    print(f"  Import               : {duree_import:.3f} s")
+    print(f"  Choix / compilation  : {duree_compilation:.3f} s")
+    print(f"  Calcul               : {duree_calcul:.3f} s")
+
+
+if NUMBA_OK:
+    @njit(cache=True)
+    def coord_nb(L, R):
+        return R + np.random.rand() * (L - 2 * R)
+
+
+    @njit(cache=True)
+    def place_libre_nb(n, x, y, x_new, y_new, R):
+        if n == 0:
+            return 1
+        for i in range(n):
+            dx = x[i] - x_new
+            dy = y[i] - y_new
+            if np.sqrt(dx * dx + dy * dy) < 2 * R:
+                return 0
+        return 1
+
+
+    @njit(cache=True)
+    def dist_latt_nb(x_new, y_new):
+        x_atom = np.rint(x_new)
+        y_atom = np.rint(y_new)
+        return np.sqrt((x_new - x_atom) ** 2 + (y_new - y_atom) ** 2)
+
+
+    @njit(cache=True)
+    def remplissage_nb(L, R, MAX_TRIES):
+        N_MAX = int(L ** 2 / (np.pi * R ** 2))
+        x = np.empty(N_MAX)
+        y = np.empty(N_MAX)
+        n = 0
+        echecs = 0
+
+        while echecs < MAX_TRIES:
+            x_new = coord_nb(L, R)
+            y_new = coord_nb(L, R)
+
+            if place_libre_nb(n, x, y, x_new, y_new, R) == 1:
+                x[n] = x_new
+                y[n] = y_new
+                n += 1
+                echecs = 0
+            else:
+                echecs += 1
+
+        return n
+
+
+    @njit(cache=True)
+    def stats_nb(L, R, MAX_TRIES, M):
+        frac = np.empty(M)
+        for i in range(M):
+            n = remplissage_nb(L, R, MAX_TRIES)
+            frac[i] = n * np.pi * R ** 2 / L ** 2
+        return np.mean(frac), np.std(frac)
+
+
+    @njit(cache=True)
+    def remplissage_struct_nb(L, R, MAX_TRIES, r_surf, U, T):
+        N_MAX = int(L ** 2 / (np.pi * R ** 2))
+        x = np.empty(N_MAX)
+        y = np.empty(N_MAX)
+        n = 0
+        echecs = 0
+
+        while echecs < MAX_TRIES:
+            x_new = coord_nb(L, R)
+            y_new = coord_nb(L, R)
+
+            if place_libre_nb(n, x, y, x_new, y_new, R) == 0:
+                echecs += 1
+                continue
+
+            d = dist_latt_nb(x_new, y_new)
+
+            accepter = False
+            if d < r_surf:
+                accepter = True
+            else:
+                if T == 0.0:
+                    accepter = False
+                else:
+                    if T * np.log(np.random.rand()) < -U:
+                        accepter = True
+
+            if accepter:
+                x[n] = x_new
+                y[n] = y_new
+                n += 1
+                echecs = 0
+            else:
+                echecs += 1
+
+        return n
+
+
+    @njit(cache=True)
+    def moyenne_fraction_nb(L, R, MAX_TRIES, r_surf, U, T, M):
+        frac = np.empty(M)
+        for i in range(M):
+            n = remplissage_struct_nb(L, R, MAX_TRIES, r_surf, U, T)
+            frac[i] = n * np.pi * R ** 2 / L ** 2
+        return np.mean(frac), np.std(frac)
@@ -3,95 +3,58 @@
 TP3 - Question 8 : Courbe η(T) avec M = 100 simulations
 
 Étude de la fraction moyenne de surface occupée en fonction de la température
-pour T ∈ [0, 10] avec ΔT = 0,5. Utilisation de numba si disponible.
+pour T ∈ [0, 10] avec ΔT = 0,5. Le calcul passe par dispatcheur()
+(autoreglage.py), qui choisit la variante la plus rapide (numba si
+disponible) et garde ce choix en cache.
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
 import os
 import sys
+import time
 
 sys.path.append(os.path.dirname(__file__))
+# autoreglage.py n'existe qu'en un exemplaire, dans TP1
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "TP1", "python"))
 from q06 import remplissage_surface_structuree
 
-try:
-    from numba import njit
-    NUMBA_OK = True
-except Exception:
-    NUMBA_OK = False
+_debut_import = time.perf_counter()
+from noyaux_numba import NUMBA_OK, chronometrer, afficher_rapport_demarrage
+from autoreglage import dispatcheur
+if NUMBA_OK:
+    from noyaux_numba import moyenne_fraction_nb
+DUREE_IMPORT = time.perf_counter() - _debut_import
+
+
+def moyenne_fraction_python(L, R, MAX_TRIES, r_surf, U, T, M):
+    """
+    Moyenne et écart-type de la fraction de surface sur M remplissages (Python).
+    """
+    fractions = []
+    for _ in range(M):
+        _, _, n = remplissage_surface_structuree(L, R, MAX_TRIES, r_surf, U, T)
+        fractions.append(n * np.pi * R ** 2 / L ** 2)
+    return float(np.mean(fractions)), float(np.std(fractions))
 
 
+VARIANTES = {"python": moyenne_fraction_python}
 if NUMBA_OK:
-    @njit
-    def coord_nb(L, R):
-        return R + np.random.rand() * (L - 2 * R)
-
-
-    @njit
-    def place_libre_nb(n, x, y, x_new, y_new, R):
-        if n == 0:
-            return 1
-        for i in range(n):
-            dx = x[i] - x_new
-            dy = y[i] - y_new
-            if np.sqrt(dx * dx + dy * dy) < 2 * R:
-                return 0
-        return 1
-
-
-    @njit
-    def dist_latt_nb(x_new, y_new):
-        x_atom = np.rint(x_new)
-        y_atom = np.rint(y_new)
-        return np.sqrt((x_new - x_atom) ** 2 + (y_new - y_atom) ** 2)
-
-
-    @njit
-    def remplissage_struct_nb(L, R, MAX_TRIES, r_surf, U, T):
-        N_MAX = int(L ** 2 / (np.pi * R ** 2))
-        x = np.empty(N_MAX)
-        y = np.empty(N_MAX)
-        n = 0
-        echecs = 0
-
-        while echecs < MAX_TRIES:
-            x_new = coord_nb(L, R)
-            y_new = coord_nb(L, R)
-
-            if place_libre_nb(n, x, y, x_new, y_new, R) == 0:
-                echecs += 1
-                continue
-
-            d = dist_latt_nb(x_new, y_new)
-
-            accepter = False
-            if d < r_surf:
-                accepter = True
-            else:
-                if T == 0.0:
-                    accepter = False
-                else:
-                    if T * np.log(np.random.rand()) < -U:
-                        accepter = True
-
-            if accepter:
-                x[n] = x_new
-                y[n] = y_new
-                n += 1
-                echecs = 0
-            else:
-                echecs += 1
-
-        return n
-
-
-    @njit
-    def moyenne_fraction_nb(L, R, MAX_TRIES, r_surf, U, T, M):
-        frac = np.empty(M)
-        for i in range(M):
-            n = remplissage_struct_nb(L, R, MAX_TRIES, r_surf, U, T)
-            frac[i] = n * np.pi * R ** 2 / L ** 2
-        return np.mean(frac), np.std(frac)
+    VARIANTES["numba"] = moyenne_fraction_nb
+
+
+def _signature(L, R, MAX_TRIES, r_surf, U, T, M):
+    return f"L={L},R={R}"
+
+
+def _essai(L, R, MAX_TRIES, r_surf, U, T, M):
+    # Remplissage court : la boucle Python prend déjà plusieurs secondes
+    # à MAX_TRIES = 1000
+    return L, R, min(MAX_TRIES, 100), r_surf, U, T, 1
+
+
+moyenne_fraction = dispatcheur("tp3_moyenne_fraction", VARIANTES, _signature, _essai,
+                               repetitions=1)
 
 
 def etude_temperature(L, R, MAX_TRIES, r_surf, U, T_values, M):
@@ -103,15 +66,7 @@ def etude_temperature(L, R, MAX_TRIES, r_surf, U, T_values, M):
 
     for T in T_values:
         print(f"Température T = {T:.1f} ...")
-        if NUMBA_OK:
-            moy, std = moyenne_fraction_nb(L, R, MAX_TRIES, r_surf, U, T, M)
-        else:
-            fractions = []
-            for _ in range(M):
-                _, _, n = remplissage_surface_structuree(L, R, MAX_TRIES, r_surf, U, T)
-                fractions.append(n * np.pi * R ** 2 / L ** 2)
-            moy = float(np.mean(fractions))
-            std = float(np.std(fractions))
+        moy, std = moyenne_fraction(L, R, MAX_TRIES, r_surf, U, T, M)
 
         fractions_moy.append(moy)
         fractions_std.append(std)
@@ -129,17 +84,22 @@ def main():
     r_surf = 0.05
     U = 10.0
 
-    np.random.seed(42)
-
-    if NUMBA_OK:
-        print("Numba détecté : calcul accéléré activé.")
-    else:
-        print("Numba non détecté : calculs plus lents (mode Python).")
-
     T_range = np.arange(0, 10.5, 0.5)
     M = 100
 
-    T_vals, frac_moy, frac_std = etude_temperature(L, R, MAX_TRIES, r_surf, U, T_range, M)
+    # Choix de la variante : mesures et compilation au premier lancement,
+    # relecture des caches disque ensuite. Les mesures tirent des nombres
+    # aléatoires : la graine est fixée après, pour que l'étude soit la même
+    # que le cache soit vide ou non.
+    variante, duree_compilation = chronometrer(moyenne_fraction.choisir, L, R, MAX_TRIES,
+                                               r_surf, U, T_range[1], M)
+    print(f"Variantes disponibles : {', '.join(VARIANTES)} → {variante}")
+
+    np.random.seed(42)
+
+    (T_vals, frac_moy, frac_std), duree_calcul = chronometrer(
+        etude_temperature, L, R, MAX_TRIES, r_surf, U, T_range, M)
+    afficher_rapport_demarrage(DUREE_IMPORT, duree_compilation, duree_calcul)
 
     plt.figure(figsize=(12, 7))
 
@@ -2,68 +2,75 @@
 """
 TP3 - Question 11 : Accélération avec numba
 
-Extension de l'étude MAX_TRIES jusqu'à 512000 avec M=100 répétitions.
+Extension de l'étude MAX_TRIES jusqu'à 512000 avec M=100 répétitions. Le
+calcul passe par dispatcheur() (autoreglage.py), qui choisit la variante la
+plus rapide (numba si disponible) et garde ce choix en cache.
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
 import os
-
-try:
-    from numba import njit
-    NUMBA_OK = True
-except Exception:
-    NUMBA_OK = False
+import sys
+import time
+
+_debut_import = time.perf_counter()
+sys.path.append(os.path.dirname(__file__))
+# autoreglage.py n'existe qu'en un exemplaire, dans TP1
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "TP1", "python"))
+from noyaux_numba import NUMBA_OK, chronometrer, afficher_rapport_demarrage
+from autoreglage import dispatcheur
+if NUMBA_OK:
+    from noyaux_numba import stats_nb
+DUREE_IMPORT = time.perf_counter() - _debut_import
 
 
-if NUMBA_OK:
-    @njit
-    def coord_nb(L, R):
-        return R + np.random.rand() * (L - 2 * R)
-
-
-    @njit
-    def place_libre_nb(n, x, y, x_new, y_new, R):
-        if n == 0:
-            return 1
-        for i in range(n):
-            dx = x[i] - x_new
-            dy = y[i] - y_new
-            if np.sqrt(dx * dx + dy * dy) < 2 * R:
-                return 0
-        return 1
-
-
-    @njit
-    def remplissage_nb(L, R, MAX_TRIES):
-        N_MAX = int(L ** 2 / (np.pi * R ** 2))
-        x = np.empty(N_MAX)
-        y = np.empty(N_MAX)
+def stats_python(L, R, MAX_TRIES, M):
+    """
+    Moyenne et écart-type de la fraction de surface sur M remplissages RSA (Python).
+    """
+    fractions = []
+    for _ in range(M):
         n = 0
+        x = np.empty(int(L ** 2 / (np.pi * R ** 2)))
+        y = np.empty(int(L ** 2 / (np.pi * R ** 2)))
         echecs = 0
-
         while echecs < MAX_TRIES:
-            x_new = coord_nb(L, R)
-            y_new = coord_nb(L, R)
-
-            if place_libre_nb(n, x, y, x_new, y_new, R) == 1:
+            x_new = R + np.random.rand() * (L - 2 * R)
+            y_new = R + np.random.rand() * (L - 2 * R)
+            libre = 1
+            for i in range(n):
+                dx = x[i] - x_new
+                dy = y[i] - y_new
+                if np.sqrt(dx * dx + dy * dy) < 2 * R:
+                    libre = 0
+                    break
+            if libre == 1:
                 x[n] = x_new
                 y[n] = y_new
                 n += 1
                 echecs = 0
             else:
                 echecs += 1
+        fractions.append(n * np.pi * R ** 2 / L ** 2)
+    return float(np.mean(fractions)), float(np.std(fractions))
 
-        return n
+
+VARIANTES = {"python": stats_python}
+if NUMBA_OK:
+    VARIANTES["numba"] = stats_nb
 
 
-    @njit
-    def stats_nb(L, R, MAX_TRIES, M):
-        frac = np.empty(M)
-        for i in range(M):
-            n = remplissage_nb(L, R, MAX_TRIES)
-            frac[i] = n * np.pi * R ** 2 / L ** 2
-        return np.mean(frac), np.std(frac)
+def _signature(L, R, MAX_TRIES, M):
+    return f"L={L},R={R}"
+
+
+def _essai(L, R, MAX_TRIES, M):
+    # Remplissage court : la boucle Python prend déjà plusieurs secondes
+    # à MAX_TRIES = 1000
+    return L, R, min(MAX_TRIES, 100), 1
+
+
+stats = dispatcheur("tp3_stats", VARIANTES, _signature, _essai, repetitions=1)
 
 
 def main():
@@ -76,51 +83,29 @@ def main():
 
     MAX_TRIES_values = [1000 * (2 ** k) for k in range(0, 10)]  # 1000 à 512000
 
-    np.random.seed(42)
+    # Choix de la variante : mesures et compilation au premier lancement,
+    # relecture des caches disque ensuite. Les mesures tirent des nombres
+    # aléatoires : la graine est fixée après, pour que l'étude soit la même
+    # que le cache soit vide ou non.
+    variante, duree_compilation = chronometrer(stats.choisir, L, R, MAX_TRIES_values[0], M)
+    print(f"Variantes disponibles : {', '.join(VARIANTES)} → {variante}")
 
-    if NUMBA_OK:
-        print("Numba détecté : calcul accéléré activé.")
-    else:
-        print("Numba non détecté : calculs très lents en mode Python.")
+    np.random.seed(42)
 
+    debut_calcul = time.perf_counter()
     frac_moy = []
     frac_std = []
 
     for MAX_TRIES in MAX_TRIES_values:
         print(f"MAX_TRIES = {MAX_TRIES} ...")
-        if NUMBA_OK:
-            moy, std = stats_nb(L, R, MAX_TRIES, M)
-        else:
-            fractions = []
-            for _ in range(M):
-                n = 0
-                x = np.empty(int(L ** 2 / (np.pi * R ** 2)))
-                y = np.empty(int(L ** 2 / (np.pi * R ** 2)))
-                echecs = 0
-                while echecs < MAX_TRIES:
-                    x_new = R + np.random.rand() * (L - 2 * R)
-                    y_new = R + np.random.rand() * (L - 2 * R)
-                    libre = 1
-                    for i in range(n):
-                        dx = x[i] - x_new
-                        dy = y[i] - y_new
-                        if np.sqrt(dx * dx + dy * dy) < 2 * R:
-                            libre = 0
-                            break
-                    if libre == 1:
-                        x[n] = x_new
-                        y[n] = y_new
-                        n += 1
-                        echecs = 0
-                    else:
-                        echecs += 1
-                fractions.append(n * np.pi * R ** 2 / L ** 2)
-            moy = float(np.mean(fractions))
-            std = float(np.std(fractions))
+        moy, std = stats(L, R, MAX_TRIES, M)
 
         frac_moy.append(moy)
         frac_std.append(std)
 
+    afficher_rapport_demarrage(DUREE_IMPORT, duree_compilation,
+                               time.perf_counter() - debut_calcul)
+
     plt.figure(figsize=(12, 7))
     plt.errorbar(MAX_TRIES_values, frac_moy, yerr=frac_std, fmt='o-'
                 , capsize=4, capthick=1.5, markersize=6, linewidth=1.5)